@@ -0,0 +1,77 @@
+"""
+Run the benchmark suite and write the results as JSON.
+
+Usage::
+
+    python -m benchmarks --quick --output results.json
+    python -m benchmarks --filter list. --sizes 10,1000,1000000
+"""
+
+import argparse
+import itertools
+import sys
+
+from tippo import Any, Iterable
+
+from . import bench_collections, bench_data, bench_patches, bench_pickle
+from .runner import Config, dump_results, get_metadata, run
+
+MODULES = (bench_data, bench_collections, bench_pickle, bench_patches)
+
+QUICK = {
+    "sizes": (10, 100, 1000, 10000),
+    "depths": (1, 4),
+    "attribute_counts": (1, 16),
+    "min_time": 0.02,
+    "repeat": 3,
+}
+
+
+def _int_list(text):
+    # type: (str) -> tuple[int, ...]
+    return tuple(int(v) for v in text.split(",") if v.strip())
+
+
+def parse_args(args=None):
+    # type: (Iterable[str] | None) -> Any
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run datta benchmarks.")
+    parser.add_argument("--sizes", type=_int_list, help="comma separated collection sizes")
+    parser.add_argument("--depths", type=_int_list, help="comma separated nesting depths")
+    parser.add_argument("--attribute-counts", type=_int_list, help="comma separated attribute counts")
+    parser.add_argument("--min-time", type=float, help="minimum time (in seconds) per timing round")
+    parser.add_argument("--repeat", type=int, help="number of timing rounds")
+    parser.add_argument("--filter", dest="pattern", help="only run benchmarks whose key contains this substring")
+    parser.add_argument("--quick", action="store_true", help="smaller sweep with shorter timing rounds")
+    parser.add_argument("--output", "-o", default="-", help="output JSON file ('-' for stdout)")
+    return parser.parse_args(None if args is None else list(args))
+
+
+def main(args=None):
+    # type: (Iterable[str] | None) -> int
+    options = parse_args(args)
+
+    kwargs = dict(QUICK) if options.quick else {}  # type: dict[str, Any]
+    for name in ("sizes", "depths", "attribute_counts", "min_time", "repeat", "pattern"):
+        value = getattr(options, name)
+        if value is not None:
+            kwargs[name] = value
+    config = Config(**kwargs)
+
+    def log(message):
+        # type: (str) -> None
+        sys.stderr.write(message + "\n")
+        sys.stderr.flush()
+
+    benchmarks = itertools.chain.from_iterable(m.iter_benchmarks(config) for m in MODULES)
+    results = run(benchmarks, config, log=log)
+
+    if options.output == "-":
+        dump_results(results, get_metadata(), sys.stdout)
+    else:
+        with open(options.output, "w") as stream:
+            dump_results(results, get_metadata(), stream)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
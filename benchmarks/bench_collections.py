@@ -0,0 +1,598 @@
+"""Benchmarks for :class:`datta.ListData`, :class:`datta.DictData`, :class:`datta.SetData` and \
+:class:`datta.TableData`."""
+
+import io
+import json
+
+from pyrsistent import pmap, pset, pvector
+from tippo import Any, Iterator
+
+from datta import Data, attribute, dict_cls, list_cls, set_cls, table_cls
+from datta.serializers import iter_json_array
+
+from .runner import Benchmark, Config
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+__all__ = ["iter_benchmarks"]
+
+
+IntList = list_cls(types=int, qualified_name="IntList")
+StrIntDict = dict_cls(key_types=str, types=int, qualified_name="StrIntDict")
+IntSet = set_cls(types=int, qualified_name="IntSet")
+
+
+class Point(Data):
+    """Data class used as table row."""
+
+    x = attribute(types=int)
+    y = attribute(types=float)
+
+
+PointList = list_cls(types=Point, qualified_name="PointList")
+PointTable = table_cls(Point, qualified_name="PointTable", row_list_type=PointList)
+
+_EXTRA = tuple(range(-10, 0))
+
+
+def _list_benchmarks(size):
+    # type: (int) -> Iterator[Benchmark]
+    params = {"size": size}
+    values = list(range(size))
+    middle = size // 2
+
+    def setup_datta_init():
+        return lambda: IntList(values)
+
+    def setup_pvector_init():
+        return lambda: pvector(values)
+
+    yield Benchmark("list.init", "datta", params, setup_datta_init)
+    yield Benchmark("list.init", "pyrsistent", params, setup_pvector_init)
+
+    # Initialize from a list of the same class.
+    def setup_datta_reinit():
+        obj = IntList(values)
+        return lambda: IntList(obj)
+
+    def setup_pvector_reinit():
+        obj = pvector(values)
+        return lambda: pvector(obj)
+
+    yield Benchmark("list.reinit", "datta", params, setup_datta_reinit)
+    yield Benchmark("list.reinit", "pyrsistent", params, setup_pvector_reinit)
+
+    def setup_datta_append():
+        obj = IntList(values)
+        return lambda: obj.append(-1)
+
+    def setup_pvector_append():
+        obj = pvector(values)
+        return lambda: obj.append(-1)
+
+    yield Benchmark("list.append", "datta", params, setup_datta_append)
+    yield Benchmark("list.append", "pyrsistent", params, setup_pvector_append)
+
+    def setup_datta_insert():
+        obj = IntList(values)
+        return lambda: obj.insert(middle, -1)
+
+    def setup_pvector_insert():
+        obj = pvector(values)
+        return lambda: obj[:middle] + pvector([-1]) + obj[middle:]
+
+    yield Benchmark("list.insert", "datta", params, setup_datta_insert)
+    yield Benchmark("list.insert", "pyrsistent", params, setup_pvector_insert)
+
+    def setup_datta_extend():
+        obj = IntList(values)
+        return lambda: obj.extend(_EXTRA)
+
+    def setup_pvector_extend():
+        obj = pvector(values)
+        return lambda: obj.extend(_EXTRA)
+
+    yield Benchmark("list.extend", "datta", params, setup_datta_extend)
+    yield Benchmark("list.extend", "pyrsistent", params, setup_pvector_extend)
+
+    def setup_datta_move():
+        obj = IntList(values)
+        return lambda: obj.move(0, size)
+
+    def setup_pvector_move():
+        obj = pvector(values)
+        return lambda: obj.delete(0).append(obj[0])
+
+    yield Benchmark("list.move", "datta", params, setup_datta_move)
+    yield Benchmark("list.move", "pyrsistent", params, setup_pvector_move)
+
+    def setup_datta_set():
+        obj = IntList(values)
+        return lambda: obj.set(middle, -1)
+
+    def setup_pvector_set():
+        obj = pvector(values)
+        return lambda: obj.set(middle, -1)
+
+    yield Benchmark("list.set", "datta", params, setup_datta_set)
+    yield Benchmark("list.set", "pyrsistent", params, setup_pvector_set)
+
+    def setup_datta_delete():
+        obj = IntList(values)
+        return lambda: obj.delete(middle)
+
+    def setup_pvector_delete():
+        obj = pvector(values)
+        return lambda: obj.delete(middle)
+
+    yield Benchmark("list.delete", "datta", params, setup_datta_delete)
+    yield Benchmark("list.delete", "pyrsistent", params, setup_pvector_delete)
+
+    def setup_datta_slice():
+        obj = IntList(values)
+        return lambda: obj[:middle]
+
+    def setup_datta_rewrap_slice():
+        obj = IntList(values)
+        return lambda: IntList(obj._state[:middle])
+
+    def setup_pvector_slice():
+        obj = pvector(values)
+        return lambda: obj[:middle]
+
+    yield Benchmark("list.slice", "datta", params, setup_datta_slice)
+    yield Benchmark("list.slice", "datta-rewrap", params, setup_datta_rewrap_slice)
+    yield Benchmark("list.slice", "pyrsistent", params, setup_pvector_slice)
+
+    def setup_datta_concat():
+        obj = IntList(values)
+        return lambda: obj + obj
+
+    def setup_pvector_concat():
+        obj = pvector(values)
+        return lambda: obj + obj
+
+    yield Benchmark("list.concat", "datta", params, setup_datta_concat)
+    yield Benchmark("list.concat", "pyrsistent", params, setup_pvector_concat)
+
+    def setup_datta_serialize():
+        obj = IntList(values)
+        return obj.serialize
+
+    def setup_pvector_serialize():
+        obj = pvector(values)
+        return obj.tolist
+
+    def setup_datta_serialize_json():
+        obj = IntList(values)
+        return lambda: json.dump(obj.serialize(), io.StringIO())
+
+    def setup_datta_serialize_to():
+        obj = IntList(values)
+        return lambda: obj.serialize_to(io.StringIO())
+
+    yield Benchmark("list.serialize", "datta", params, setup_datta_serialize)
+    yield Benchmark("list.serialize", "pyrsistent", params, setup_pvector_serialize)
+    yield Benchmark("list.serialize_json", "datta", params, setup_datta_serialize_json)
+    yield Benchmark("list.serialize_json", "datta-stream", params, setup_datta_serialize_to)
+
+    def setup_datta_deserialize():
+        return lambda: IntList.deserialize(values)
+
+    def setup_datta_deserialize_iter():
+        return lambda: IntList.deserialize_iter(iter(values))
+
+    def setup_datta_json_array():
+        text = json.dumps(values)
+        return lambda: IntList.deserialize_iter(iter_json_array(io.StringIO(text)))
+
+    def setup_datta_json_load():
+        text = json.dumps(values)
+        return lambda: IntList.deserialize(json.load(io.StringIO(text)))
+
+    yield Benchmark("list.deserialize", "datta", params, setup_datta_deserialize)
+    yield Benchmark("list.deserialize", "datta-iter", params, setup_datta_deserialize_iter)
+    yield Benchmark("list.deserialize", "pyrsistent", params, setup_pvector_init)
+    yield Benchmark("list.deserialize_json", "datta", params, setup_datta_json_load)
+    yield Benchmark("list.deserialize_json", "datta-stream", params, setup_datta_json_array)
+
+    def setup_datta_evolver_append():
+        empty = IntList()
+
+        def func():
+            evolver = empty.evolver()
+            for value in values:
+                evolver.append(value)
+            return evolver.persistent()
+
+        return func
+
+    def setup_pvector_evolver_append():
+        empty = pvector()
+
+        def func():
+            evolver = empty.evolver()
+            for value in values:
+                evolver.append(value)
+            return evolver.persistent()
+
+        return func
+
+    yield Benchmark("list.evolver_append", "datta", params, setup_datta_evolver_append)
+    yield Benchmark("list.evolver_append", "pyrsistent", params, setup_pvector_evolver_append)
+
+
+def _dict_benchmarks(size):
+    # type: (int) -> Iterator[Benchmark]
+    params = {"size": size}
+    values = dict((str(i), i) for i in range(size))  # type: dict[str, Any]
+    middle = str(size // 2)
+    extra = dict((str(i), i) for i in _EXTRA)
+
+    def setup_datta_init():
+        return lambda: StrIntDict(values)
+
+    def setup_pmap_init():
+        return lambda: pmap(values)
+
+    yield Benchmark("dict.init", "datta", params, setup_datta_init)
+    yield Benchmark("dict.init", "pyrsistent", params, setup_pmap_init)
+
+    def setup_datta_insert():
+        obj = StrIntDict(values)
+        return lambda: obj.set("-1", -1)
+
+    def setup_pmap_insert():
+        obj = pmap(values)
+        return lambda: obj.set("-1", -1)
+
+    yield Benchmark("dict.insert", "datta", params, setup_datta_insert)
+    yield Benchmark("dict.insert", "pyrsistent", params, setup_pmap_insert)
+
+    def setup_datta_set():
+        obj = StrIntDict(values)
+        return lambda: obj.set(middle, -1)
+
+    def setup_pmap_set():
+        obj = pmap(values)
+        return lambda: obj.set(middle, -1)
+
+    yield Benchmark("dict.set", "datta", params, setup_datta_set)
+    yield Benchmark("dict.set", "pyrsistent", params, setup_pmap_set)
+
+    def setup_datta_extend():
+        obj = StrIntDict(values)
+        return lambda: obj.update(extra)
+
+    def setup_pmap_extend():
+        obj = pmap(values)
+        return lambda: obj.update(extra)
+
+    yield Benchmark("dict.extend", "datta", params, setup_datta_extend)
+    yield Benchmark("dict.extend", "pyrsistent", params, setup_pmap_extend)
+
+    def setup_datta_delete():
+        obj = StrIntDict(values)
+        return lambda: obj.delete(middle)
+
+    def setup_pmap_delete():
+        obj = pmap(values)
+        return lambda: obj.remove(middle)
+
+    yield Benchmark("dict.delete", "datta", params, setup_datta_delete)
+    yield Benchmark("dict.delete", "pyrsistent", params, setup_pmap_delete)
+
+    def setup_datta_serialize():
+        obj = StrIntDict(values)
+        return obj.serialize
+
+    def setup_pmap_serialize():
+        obj = pmap(values)
+        return lambda: dict(obj)
+
+    yield Benchmark("dict.serialize", "datta", params, setup_datta_serialize)
+    yield Benchmark("dict.serialize", "pyrsistent", params, setup_pmap_serialize)
+
+    def setup_datta_deserialize():
+        return lambda: StrIntDict.deserialize(values)
+
+    yield Benchmark("dict.deserialize", "datta", params, setup_datta_deserialize)
+    yield Benchmark("dict.deserialize", "pyrsistent", params, setup_pmap_init)
+
+    def setup_datta_evolver_set():
+        empty = StrIntDict()
+
+        def func():
+            evolver = empty.evolver()
+            for key, value in values.items():
+                evolver[key] = value
+            return evolver.persistent()
+
+        return func
+
+    def setup_pmap_evolver_set():
+        empty = pmap()
+
+        def func():
+            evolver = empty.evolver()
+            for key, value in values.items():
+                evolver[key] = value
+            return evolver.persistent()
+
+        return func
+
+    yield Benchmark("dict.evolver_set", "datta", params, setup_datta_evolver_set)
+    yield Benchmark("dict.evolver_set", "pyrsistent", params, setup_pmap_evolver_set)
+
+
+def _set_benchmarks(size):
+    # type: (int) -> Iterator[Benchmark]
+    params = {"size": size}
+    values = list(range(size))
+    middle = size // 2
+
+    def setup_datta_init():
+        return lambda: IntSet(values)
+
+    def setup_pset_init():
+        return lambda: pset(values)
+
+    yield Benchmark("set.init", "datta", params, setup_datta_init)
+    yield Benchmark("set.init", "pyrsistent", params, setup_pset_init)
+
+    def setup_datta_insert():
+        obj = IntSet(values)
+        return lambda: obj.add(-1)
+
+    def setup_pset_insert():
+        obj = pset(values)
+        return lambda: obj.add(-1)
+
+    yield Benchmark("set.insert", "datta", params, setup_datta_insert)
+    yield Benchmark("set.insert", "pyrsistent", params, setup_pset_insert)
+
+    def setup_datta_extend():
+        obj = IntSet(values)
+        return lambda: obj.update(_EXTRA)
+
+    def setup_pset_extend():
+        obj = pset(values)
+        return lambda: obj.update(_EXTRA)
+
+    yield Benchmark("set.extend", "datta", params, setup_datta_extend)
+    yield Benchmark("set.extend", "pyrsistent", params, setup_pset_extend)
+
+    def setup_datta_delete():
+        obj = IntSet(values)
+        return lambda: obj.remove(middle)
+
+    def setup_pset_delete():
+        obj = pset(values)
+        return lambda: obj.remove(middle)
+
+    yield Benchmark("set.delete", "datta", params, setup_datta_delete)
+    yield Benchmark("set.delete", "pyrsistent", params, setup_pset_delete)
+
+    # Algebra with a set of half the size (a quarter of the values shared).
+    # Persistent sets are sized for their values, since 'pset' defaults to 8 hash buckets (linear lookups).
+    others = list(range(middle + size // 4, size + size // 4))
+
+    def setup_datta_intersection():
+        obj, other = IntSet(values), IntSet(others)
+        return lambda: obj.intersection(other)
+
+    def setup_datta_rewrap_intersection():
+        obj, other = IntSet(values), IntSet(others)
+        return lambda: IntSet(obj._state.intersection(other._state))
+
+    def setup_pset_intersection():
+        obj, other = pset(values, pre_size=0), pset(others, pre_size=0)
+        return lambda: obj.intersection(other)
+
+    yield Benchmark("set.intersection", "datta", params, setup_datta_intersection)
+    yield Benchmark("set.intersection", "datta-rewrap", params, setup_datta_rewrap_intersection)
+    yield Benchmark("set.intersection", "pyrsistent", params, setup_pset_intersection)
+
+    def setup_datta_union():
+        obj, other = IntSet(values), IntSet(others)
+        return lambda: obj.union(other)
+
+    def setup_datta_rewrap_union():
+        obj, other = IntSet(values), IntSet(others)
+        return lambda: IntSet(obj._state.union(other._state))
+
+    def setup_pset_union():
+        obj, other = pset(values, pre_size=0), pset(others, pre_size=0)
+        return lambda: obj.union(other)
+
+    yield Benchmark("set.union", "datta", params, setup_datta_union)
+    yield Benchmark("set.union", "datta-rewrap", params, setup_datta_rewrap_union)
+    yield Benchmark("set.union", "pyrsistent", params, setup_pset_union)
+
+    def setup_datta_difference():
+        obj, other = IntSet(values), IntSet(others)
+        return lambda: obj.difference(other)
+
+    def setup_pset_difference():
+        obj, other = pset(values, pre_size=0), pset(others, pre_size=0)
+        return lambda: obj.difference(other)
+
+    yield Benchmark("set.difference", "datta", params, setup_datta_difference)
+    yield Benchmark("set.difference", "pyrsistent", params, setup_pset_difference)
+
+    def setup_datta_serialize():
+        obj = IntSet(values)
+        return obj.serialize
+
+    def setup_pset_serialize():
+        obj = pset(values)
+        return lambda: list(obj)
+
+    yield Benchmark("set.serialize", "datta", params, setup_datta_serialize)
+    yield Benchmark("set.serialize", "pyrsistent", params, setup_pset_serialize)
+
+    def setup_datta_deserialize():
+        return lambda: IntSet.deserialize(values)
+
+    yield Benchmark("set.deserialize", "datta", params, setup_datta_deserialize)
+    yield Benchmark("set.deserialize", "pyrsistent", params, setup_pset_init)
+
+    def setup_datta_evolver_add():
+        empty = IntSet()
+
+        def func():
+            evolver = empty.evolver()
+            for value in values:
+                evolver.add(value)
+            return evolver.persistent()
+
+        return func
+
+    def setup_pset_evolver_add():
+        empty = pset()
+
+        def func():
+            evolver = empty.evolver()
+            for value in values:
+                evolver.add(value)
+            return evolver.persistent()
+
+        return func
+
+    yield Benchmark("set.evolver_add", "datta", params, setup_datta_evolver_add)
+    yield Benchmark("set.evolver_add", "pyrsistent", params, setup_pset_evolver_add)
+
+
+def _table_benchmarks(size):
+    # type: (int) -> Iterator[Benchmark]
+    params = {"size": size}
+    points = [Point(i, i / 2.0) for i in range(size)]
+    xs = list(range(size))
+    ys = [i / 2.0 for i in range(size)]
+
+    def setup_list_init():
+        return lambda: PointList(points)
+
+    def setup_table_init():
+        return lambda: PointTable(points)
+
+    def setup_table_from_columns():
+        return lambda: PointTable.from_columns({"x": xs, "y": ys})
+
+    yield Benchmark("table.init", "datta-list", params, setup_list_init)
+    yield Benchmark("table.init", "datta-table", params, setup_table_init)
+    yield Benchmark("table.init", "datta-table-columns", params, setup_table_from_columns)
+
+    def setup_list_column():
+        obj = PointList(points)
+        return lambda: [p.x for p in obj]
+
+    def setup_table_column():
+        obj = PointTable(points)
+        return lambda: obj.column("x")
+
+    yield Benchmark("table.column", "datta-list", params, setup_list_column)
+    yield Benchmark("table.column", "datta-table", params, setup_table_column)
+
+    def setup_list_filter():
+        obj = PointList(points)
+        return lambda: PointList(p for p in obj if p.x % 2)
+
+    def setup_table_filter():
+        obj = PointTable(points)
+        return lambda: obj.filter(lambda x: x % 2, "x")
+
+    yield Benchmark("table.filter", "datta-list", params, setup_list_filter)
+    yield Benchmark("table.filter", "datta-table", params, setup_table_filter)
+
+    def setup_list_update_column():
+        obj = PointList(points)
+        return lambda: PointList(p.update({"y": 0.0}) for p in obj)
+
+    def setup_table_update_column():
+        obj = PointTable(points)
+        zeros = [0.0] * size
+        return lambda: obj.update_column("y", zeros)
+
+    yield Benchmark("table.update_column", "datta-list", params, setup_list_update_column)
+    yield Benchmark("table.update_column", "datta-table", params, setup_table_update_column)
+
+
+def _columns_benchmarks(size):
+    # type: (int) -> Iterator[Benchmark]
+    params = {"size": size}
+    xs = list(range(size))
+    ys = [i / 2.0 for i in range(size)]
+
+    def setup_datta_from_columns():
+        return lambda: Point.from_columns(x=xs, y=ys)
+
+    def setup_loop_from_columns():
+        return lambda: PointList(Point(x, y) for x, y in zip(xs, ys))
+
+    yield Benchmark("data.from_columns", "datta", params, setup_datta_from_columns)
+    yield Benchmark("data.from_columns", "loop", params, setup_loop_from_columns)
+
+    if numpy is not None:
+
+        def setup_numpy_from_columns():
+            x_array, y_array = numpy.array(xs), numpy.array(ys)
+            return lambda: Point.from_columns(x=x_array, y=y_array)
+
+        yield Benchmark("data.from_columns", "datta-numpy", params, setup_numpy_from_columns)
+
+
+def _numpy_benchmarks(size):
+    # type: (int) -> Iterator[Benchmark]
+    params = {"size": size}
+    points = [Point(i, i / 2.0) for i in range(size)]
+
+    def setup_datta_to_numpy():
+        obj = PointList(points)
+        return obj.to_numpy
+
+    def setup_loop_to_numpy():
+        obj = PointList(points)
+        dtype = [("x", "i8"), ("y", "f8")]
+        return lambda: numpy.array([(p.x, p.y) for p in obj], dtype=dtype)
+
+    yield Benchmark("list.to_numpy", "datta", params, setup_datta_to_numpy)
+    yield Benchmark("list.to_numpy", "loop", params, setup_loop_to_numpy)
+
+    def setup_datta_from_numpy():
+        array = PointList(points).to_numpy()
+        return lambda: PointList.from_numpy(array)
+
+    def setup_loop_from_numpy():
+        array = PointList(points).to_numpy()
+        return lambda: PointList(Point(x, y) for x, y in array.tolist())
+
+    yield Benchmark("list.from_numpy", "datta", params, setup_datta_from_numpy)
+    yield Benchmark("list.from_numpy", "loop", params, setup_loop_from_numpy)
+
+
+def iter_benchmarks(config):
+    # type: (Config) -> Iterator[Benchmark]
+    """
+    Iterate over collection benchmarks.
+
+    :param config: Configuration.
+    :return: Benchmark iterator.
+    """
+    for size in config.sizes:
+        for benchmark in _list_benchmarks(size):
+            yield benchmark
+        for benchmark in _dict_benchmarks(size):
+            yield benchmark
+        for benchmark in _set_benchmarks(size):
+            yield benchmark
+        for benchmark in _table_benchmarks(size):
+            yield benchmark
+        for benchmark in _columns_benchmarks(size):
+            yield benchmark
+        if numpy is not None:
+            for benchmark in _numpy_benchmarks(size):
+                yield benchmark
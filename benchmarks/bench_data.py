@@ -0,0 +1,322 @@
+"""Benchmarks for :class:`datta.Data` (initialization, evolution and serialization)."""
+
+from pyrsistent import PRecord, field, pvector_field
+from tippo import Any, Callable, Iterator
+
+from datta import Data, attribute, list_attribute
+
+from .runner import Benchmark, Config
+
+try:
+    import dataclasses
+except ImportError:  # pragma: no cover
+    dataclasses = None  # type: ignore
+
+__all__ = ["iter_benchmarks"]
+
+
+def _names(attribute_count):
+    # type: (int) -> list[str]
+    return ["a{}".format(i) for i in range(attribute_count)]
+
+
+def make_data_cls(attribute_count):
+    # type: (int) -> type
+    """Make a data class with `attribute_count` integer attributes."""
+    dct = dict((n, attribute(types=int)) for n in _names(attribute_count))  # type: dict[str, Any]
+    return type("Data{}".format(attribute_count), (Data,), dct)
+
+
+def make_dataclass_cls(attribute_count):
+    # type: (int) -> type
+    """Make a frozen dataclass with `attribute_count` integer fields."""
+    assert dataclasses is not None
+    fields = [(n, int) for n in _names(attribute_count)]
+    return dataclasses.make_dataclass("Dataclass{}".format(attribute_count), fields, frozen=True)
+
+
+def make_precord_cls(attribute_count):
+    # type: (int) -> type
+    """Make a pyrsistent record class with `attribute_count` integer fields."""
+    dct = dict((n, field(type=int, mandatory=True)) for n in _names(attribute_count))  # type: dict[str, Any]
+    return type("Record{}".format(attribute_count), (PRecord,), dct)
+
+
+class DataNode(Data):
+    """Recursive data class (a node with a value and an optional child)."""
+
+    value = attribute(types=int)
+    child = attribute(types=("DataNode", None), default=None)
+
+
+class CachedDataNode(Data):
+    """Recursive data class that caches its serialized output."""
+
+    __kwargs__ = {"cache_serialized": True}
+
+    value = attribute(types=int)
+    child = attribute(types=("CachedDataNode", None), default=None)
+
+
+class RecordNode(PRecord):
+    """Recursive pyrsistent record (a node with a value and an optional child)."""
+
+    value = field(type=int, mandatory=True)
+    child = field(initial=None, serializer=lambda _, v: v.serialize() if v is not None else None)
+
+
+if dataclasses is not None:
+    DataclassNode = dataclasses.make_dataclass(
+        "DataclassNode", [("value", int), ("child", Any, None)], frozen=True
+    )  # type: Any
+else:  # pragma: no cover
+    DataclassNode = None
+
+
+def _nest(cls, depth):
+    # type: (Callable[..., Any], int) -> Any
+    node = None
+    for i in range(depth):
+        node = cls(value=i, child=node)
+    return node
+
+
+def _nested_dict(depth):
+    # type: (int) -> Any
+    node = None
+    for i in range(depth):
+        node = {"value": i, "child": node}
+    return node
+
+
+def _precord_from_dict(cls, dct):
+    # type: (Any, Any) -> Any
+    if dct is None:
+        return None
+    return cls(value=dct["value"], child=_precord_from_dict(cls, dct["child"]))
+
+
+def _dataclass_from_dict(cls, dct):
+    # type: (Any, Any) -> Any
+    if dct is None:
+        return None
+    return cls(value=dct["value"], child=_dataclass_from_dict(cls, dct["child"]))
+
+
+def _flat_benchmarks(attribute_count):
+    # type: (int) -> Iterator[Benchmark]
+    params = {"attributes": attribute_count}
+    names = _names(attribute_count)
+    values = list(range(attribute_count))
+    kwargs = dict(zip(names, values))
+    new_kwargs = dict((n, v + 1) for n, v in kwargs.items())
+
+    # Initialization.
+    def setup_datta_init():
+        cls = make_data_cls(attribute_count)
+        return lambda: cls(*values)
+
+    def setup_dataclass_init():
+        cls = make_dataclass_cls(attribute_count)
+        return lambda: cls(*values)
+
+    def setup_precord_init():
+        cls = make_precord_cls(attribute_count)
+        return lambda: cls(**kwargs)
+
+    yield Benchmark("data.init", "datta", params, setup_datta_init)
+    if dataclasses is not None:
+        yield Benchmark("data.init", "dataclass", params, setup_dataclass_init)
+    yield Benchmark("data.init", "precord", params, setup_precord_init)
+
+    # Set a single attribute.
+    def setup_datta_set():
+        obj = make_data_cls(attribute_count)(*values)
+        return lambda: obj.set("a0", -1)
+
+    def setup_dataclass_set():
+        obj = make_dataclass_cls(attribute_count)(*values)
+        replace = dataclasses.replace
+        return lambda: replace(obj, a0=-1)
+
+    def setup_precord_set():
+        obj = make_precord_cls(attribute_count)(**kwargs)
+        return lambda: obj.set("a0", -1)
+
+    yield Benchmark("data.set", "datta", params, setup_datta_set)
+    if dataclasses is not None:
+        yield Benchmark("data.set", "dataclass", params, setup_dataclass_set)
+    yield Benchmark("data.set", "precord", params, setup_precord_set)
+
+    # Update all attributes.
+    def setup_datta_update():
+        obj = make_data_cls(attribute_count)(*values)
+        return lambda: obj.update(new_kwargs)
+
+    def setup_dataclass_update():
+        obj = make_dataclass_cls(attribute_count)(*values)
+        replace = dataclasses.replace
+        return lambda: replace(obj, **new_kwargs)
+
+    def setup_precord_update():
+        obj = make_precord_cls(attribute_count)(**kwargs)
+        return lambda: obj.update(new_kwargs)
+
+    yield Benchmark("data.update", "datta", params, setup_datta_update)
+    if dataclasses is not None:
+        yield Benchmark("data.update", "dataclass", params, setup_dataclass_update)
+    yield Benchmark("data.update", "precord", params, setup_precord_update)
+
+    # Serialization.
+    def setup_datta_serialize():
+        obj = make_data_cls(attribute_count)(*values)
+        return obj.serialize
+
+    def setup_dataclass_serialize():
+        obj = make_dataclass_cls(attribute_count)(*values)
+        asdict = dataclasses.asdict
+        return lambda: asdict(obj)
+
+    def setup_precord_serialize():
+        obj = make_precord_cls(attribute_count)(**kwargs)
+        return obj.serialize
+
+    yield Benchmark("data.serialize", "datta", params, setup_datta_serialize)
+    if dataclasses is not None:
+        yield Benchmark("data.serialize", "dataclass", params, setup_dataclass_serialize)
+    yield Benchmark("data.serialize", "precord", params, setup_precord_serialize)
+
+    # Deserialization.
+    def setup_datta_deserialize():
+        cls = make_data_cls(attribute_count)
+        return lambda: cls.deserialize(kwargs)
+
+    def setup_dataclass_deserialize():
+        cls = make_dataclass_cls(attribute_count)
+        return lambda: cls(**kwargs)
+
+    def setup_precord_deserialize():
+        cls = make_precord_cls(attribute_count)
+        return lambda: cls.create(kwargs)
+
+    def setup_datta_trusted_deserialize():
+        cls = make_data_cls(attribute_count)
+        return lambda: cls.deserialize(kwargs, trusted=True)
+
+    yield Benchmark("data.deserialize", "datta", params, setup_datta_deserialize)
+    yield Benchmark("data.deserialize", "datta-trusted", params, setup_datta_trusted_deserialize)
+    if dataclasses is not None:
+        yield Benchmark("data.deserialize", "dataclass", params, setup_dataclass_deserialize)
+    yield Benchmark("data.deserialize", "precord", params, setup_precord_deserialize)
+
+    # Class definition with list attributes (equivalent collection classes are shared, unless there's a class body).
+    def setup_datta_define_lists():
+        return lambda: type("Lists", (Data,), dict((n, list_attribute(types=str)) for n in names))
+
+    def setup_datta_uncached_define_lists():
+        return lambda: type("Lists", (Data,), dict((n, list_attribute(types=str, cls_dct={})) for n in names))
+
+    def setup_precord_define_lists():
+        return lambda: type("Lists", (PRecord,), dict((n, pvector_field(str)) for n in names))
+
+    yield Benchmark("data.define_lists", "datta", params, setup_datta_define_lists)
+    yield Benchmark("data.define_lists", "datta-uncached", params, setup_datta_uncached_define_lists)
+    yield Benchmark("data.define_lists", "precord", params, setup_precord_define_lists)
+
+
+def _nested_benchmarks(depth):
+    # type: (int) -> Iterator[Benchmark]
+    params = {"depth": depth}
+    serialized = _nested_dict(depth)
+
+    def setup_datta_serialize():
+        obj = _nest(DataNode, depth)
+        return obj.serialize
+
+    def setup_dataclass_serialize():
+        obj = _nest(DataclassNode, depth)
+        asdict = dataclasses.asdict
+        return lambda: asdict(obj)
+
+    def setup_precord_serialize():
+        obj = _nest(RecordNode, depth)
+        return obj.serialize
+
+    yield Benchmark("data.nested_serialize", "datta", params, setup_datta_serialize)
+    if dataclasses is not None:
+        yield Benchmark("data.nested_serialize", "dataclass", params, setup_dataclass_serialize)
+    yield Benchmark("data.nested_serialize", "precord", params, setup_precord_serialize)
+
+    # Serialize again after changing the root node.
+    def setup_datta_update_serialize():
+        obj = _nest(DataNode, depth)
+        return lambda: obj.set("value", -1).serialize()
+
+    def setup_datta_cached_update_serialize():
+        obj = _nest(CachedDataNode, depth)
+        obj.serialize()
+        return lambda: obj.set("value", -1).serialize()
+
+    yield Benchmark("data.nested_update_serialize", "datta", params, setup_datta_update_serialize)
+    yield Benchmark("data.nested_update_serialize", "datta-cached", params, setup_datta_cached_update_serialize)
+
+    # Change the value of the deepest node.
+    path = ("child",) * (depth - 1) + ("value",)
+
+    def setup_datta_set_in():
+        obj = _nest(DataNode, depth)
+        return lambda: obj.set_in(path, -1)
+
+    def setup_datta_manual_set_in():
+        obj = _nest(DataNode, depth)
+
+        def set_in(node, level):
+            if level == depth - 1:
+                return node.set("value", -1)
+            return node.set("child", set_in(node.child, level + 1))
+
+        return lambda: set_in(obj, 0)
+
+    def setup_precord_set_in():
+        obj = _nest(RecordNode, depth)
+        return lambda: obj.transform(path, -1)
+
+    yield Benchmark("data.nested_set_in", "datta", params, setup_datta_set_in)
+    yield Benchmark("data.nested_set_in", "datta-manual", params, setup_datta_manual_set_in)
+    yield Benchmark("data.nested_set_in", "precord", params, setup_precord_set_in)
+
+    def setup_datta_deserialize():
+        datta_serialized = _nest(DataNode, depth).serialize()
+        return lambda: DataNode.deserialize(datta_serialized)
+
+    def setup_dataclass_deserialize():
+        return lambda: _dataclass_from_dict(DataclassNode, serialized)
+
+    def setup_precord_deserialize():
+        return lambda: _precord_from_dict(RecordNode, serialized)
+
+    def setup_datta_trusted_deserialize():
+        datta_serialized = _nest(DataNode, depth).serialize()
+        return lambda: DataNode.deserialize(datta_serialized, trusted=True)
+
+    yield Benchmark("data.nested_deserialize", "datta", params, setup_datta_deserialize)
+    yield Benchmark("data.nested_deserialize", "datta-trusted", params, setup_datta_trusted_deserialize)
+    if dataclasses is not None:
+        yield Benchmark("data.nested_deserialize", "dataclass", params, setup_dataclass_deserialize)
+    yield Benchmark("data.nested_deserialize", "precord", params, setup_precord_deserialize)
+
+
+def iter_benchmarks(config):
+    # type: (Config) -> Iterator[Benchmark]
+    """
+    Iterate over data benchmarks.
+
+    :param config: Configuration.
+    :return: Benchmark iterator.
+    """
+    for attribute_count in config.attribute_counts:
+        for benchmark in _flat_benchmarks(attribute_count):
+            yield benchmark
+    for depth in config.depths:
+        for benchmark in _nested_benchmarks(depth):
+            yield benchmark
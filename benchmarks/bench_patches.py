@@ -0,0 +1,131 @@
+"""Benchmarks for :func:`datta.diff` and patch application (structural changes to a data tree)."""
+
+from tippo import Any, Iterator
+
+from datta import Data, attribute, dict_attribute, diff, list_attribute
+from datta.patches import Patch, Update
+
+from .runner import Benchmark, Config
+
+__all__ = ["iter_benchmarks"]
+
+
+class Leaf(Data):
+    """Data class at the bottom of the tree."""
+
+    name = attribute(types=str)
+    value = attribute(types=int)
+
+
+class Branch(Data):
+    """Data class holding a list and a dictionary of leaves."""
+
+    leaves = list_attribute(types=Leaf)
+    lookup = dict_attribute(key_types=str, types=Leaf)
+
+
+def _make_tree(size):
+    # type: (int) -> Branch
+    leaves = [Leaf(str(i), i) for i in range(size)]
+    return Branch(leaves, dict((leaf.name, leaf) for leaf in leaves))
+
+
+def _change_tree(tree):
+    # type: (Branch) -> Branch
+    middle = len(tree.leaves) // 2
+    leaf = tree.leaves[middle]
+    new_leaf = leaf.update({"value": -1})
+    return tree.update({"leaves": tree.leaves.set(middle, new_leaf), "lookup": tree.lookup.set(leaf.name, new_leaf)})
+
+
+def _make_patch(tree, count):
+    # type: (Branch, int) -> Patch
+    """Patch that changes the value of evenly spread leaves, both in the list and in the dictionary."""
+    step = max(1, len(tree.leaves) // count)
+    changes = []
+    for index in range(0, len(tree.leaves), step)[:count]:
+        leaf = tree.leaves[index]
+        changes.append(Update(("leaves", index), "value", leaf.value, -1))
+        changes.append(Update(("lookup", leaf.name), "value", leaf.value, -1))
+    return Patch(changes)
+
+
+def _apply_one_by_one(tree, patch):
+    # type: (Branch, Patch) -> Branch
+    """Apply a patch through successive updates (a new copy of the whole path per change)."""
+    for change in patch:
+        container_name, key = change.path
+        container = getattr(tree, container_name)
+        value = container[key].update({change.key: change.value})
+        tree = tree.update({container_name: container.set(key, value)})
+    return tree
+
+
+def _serialized_diff(old, new, path=()):
+    # type: (Any, Any, tuple[Any, ...]) -> list[tuple[Any, ...]]
+    """Diff two serialized trees (the naive approach)."""
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = []  # type: list[tuple[Any, ...]]
+        for key in set(old) | set(new):
+            changes.extend(_serialized_diff(old.get(key), new.get(key), path + (key,)))
+        return changes
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        changes = []
+        for index, (old_value, new_value) in enumerate(zip(old, new)):
+            changes.extend(_serialized_diff(old_value, new_value, path + (index,)))
+        return changes
+    return [(path, old, new)]
+
+
+def _diff_benchmarks(size):
+    # type: (int) -> Iterator[Benchmark]
+    params = {"size": size}
+
+    def setup_datta_diff():
+        old = _make_tree(size)
+        new = _change_tree(old)
+        return lambda: diff(old, new)
+
+    def setup_serialized_diff():
+        old = _make_tree(size)
+        new = _change_tree(old)
+        return lambda: _serialized_diff(old.serialize(), new.serialize())
+
+    yield Benchmark("tree.diff", "datta", params, setup_datta_diff)
+    yield Benchmark("tree.diff", "serialized", params, setup_serialized_diff)
+
+
+def _apply_benchmarks(size):
+    # type: (int) -> Iterator[Benchmark]
+    count = min(size, 100)
+    params = {"size": size, "changes": count * 2}
+
+    def setup_datta_apply():
+        tree = _make_tree(size)
+        patch = _make_patch(tree, count)
+        return lambda: tree.apply_patch(patch)
+
+    def setup_one_by_one_apply():
+        tree = _make_tree(size)
+        patch = _make_patch(tree, count)
+        return lambda: _apply_one_by_one(tree, patch)
+
+    yield Benchmark("tree.apply_patch", "datta", params, setup_datta_apply)
+    yield Benchmark("tree.apply_patch", "one_by_one", params, setup_one_by_one_apply)
+
+
+def iter_benchmarks(config):
+    # type: (Config) -> Iterator[Benchmark]
+    """
+    Iterate over patch benchmarks.
+
+    :param config: Configuration.
+    :return: Benchmark iterator.
+    """
+    for size in config.sizes:
+        for benchmark in _diff_benchmarks(size):
+            yield benchmark
+        for benchmark in _apply_benchmarks(size):
+            yield benchmark
@@ -0,0 +1,116 @@
+"""Benchmarks for pickling and binary encoding of :class:`datta.Data` and data collections (payload size and time)."""
+
+import pickle
+
+from basicco import obj_state
+from tippo import Any, Callable, Iterator
+
+from datta import Data, attribute, dict_cls, list_cls, set_cls
+from datta.serializers import from_bytes, to_bytes
+
+from .runner import Benchmark, Config
+
+__all__ = ["iter_benchmarks"]
+
+
+PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+class PickleNode(Data):
+    """Recursive data class pickled with the compact protocol."""
+
+    value = attribute(types=int)
+    name = attribute(types=str, default="")
+    child = attribute(types=("PickleNode", None), default=None)
+
+
+class SlotsPickleNode(Data):
+    """Recursive data class pickled with generic slot-state handling."""
+
+    __reduce__ = obj_state.reducer
+
+    value = attribute(types=int)
+    name = attribute(types=str, default="")
+    child = attribute(types=("SlotsPickleNode", None), default=None)
+
+
+IntList = list_cls(types=int, qualified_name="IntList")
+StrIntDict = dict_cls(key_types=str, types=int, qualified_name="StrIntDict")
+IntSet = set_cls(types=int, qualified_name="IntSet")
+
+SlotsIntList = list_cls(types=int, qualified_name="SlotsIntList", cls_dct={"__reduce__": obj_state.reducer})
+SlotsStrIntDict = dict_cls(
+    key_types=str, types=int, qualified_name="SlotsStrIntDict", cls_dct={"__reduce__": obj_state.reducer}
+)
+SlotsIntSet = set_cls(types=int, qualified_name="SlotsIntSet", cls_dct={"__reduce__": obj_state.reducer})
+
+
+def _nest(cls, depth):
+    # type: (Callable[..., Any], int) -> Any
+    node = None
+    for i in range(depth):
+        node = cls(value=i, name=str(i), child=node)
+    return node
+
+
+def _pickle_benchmarks(name, params, implementations):
+    # type: (str, dict[str, Any], dict[str, Callable[[], Any]]) -> Iterator[Benchmark]
+    for implementation, make in implementations.items():
+
+        def setup_dumps(make=make):
+            obj = make()
+            return lambda: pickle.dumps(obj, PROTOCOL)
+
+        def setup_roundtrip(make=make):
+            obj = make()
+            return lambda: pickle.loads(pickle.dumps(obj, PROTOCOL))
+
+        yield Benchmark("{}.dumps".format(name), implementation, params, setup_dumps, payload=True)
+        yield Benchmark("{}.roundtrip".format(name), implementation, params, setup_roundtrip)
+
+    # Schema-aware binary format (same objects as the compact pickle protocol).
+    def setup_to_bytes():
+        obj = implementations["datta"]()
+        return lambda: to_bytes(obj)
+
+    def setup_bytes_roundtrip():
+        obj = implementations["datta"]()
+        cls = type(obj)
+        return lambda: from_bytes(cls, to_bytes(obj))
+
+    yield Benchmark("{}.dumps".format(name), "datta-bytes", params, setup_to_bytes, payload=True)
+    yield Benchmark("{}.roundtrip".format(name), "datta-bytes", params, setup_bytes_roundtrip)
+
+
+def iter_benchmarks(config):
+    # type: (Config) -> Iterator[Benchmark]
+    """
+    Iterate over pickling and binary encoding benchmarks.
+    The `datta-slots` implementation pickles the same classes through generic slot-state handling, and \
+`datta-bytes` uses :func:`datta.serializers.to_bytes`.
+
+    :param config: Configuration.
+    :return: Benchmark iterator.
+    """
+    for depth in config.depths:
+        implementations = {
+            "datta": lambda depth=depth: _nest(PickleNode, depth),
+            "datta-slots": lambda depth=depth: _nest(SlotsPickleNode, depth),
+        }  # type: dict[str, Callable[[], Any]]
+        for benchmark in _pickle_benchmarks("data", {"depth": depth}, implementations):
+            yield benchmark
+
+    for size in config.sizes:
+        values = list(range(size))
+        mapping = dict((str(i), i) for i in values)
+        for name, cls, slots_cls, initial in (
+            ("list", IntList, SlotsIntList, values),
+            ("dict", StrIntDict, SlotsStrIntDict, mapping),
+            ("set", IntSet, SlotsIntSet, values),
+        ):
+            implementations = {
+                "datta": lambda cls=cls, initial=initial: cls(initial),
+                "datta-slots": lambda cls=slots_cls, initial=initial: cls(initial),
+            }
+            for benchmark in _pickle_benchmarks(name, {"size": size}, implementations):
+                yield benchmark
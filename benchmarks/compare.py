@@ -0,0 +1,83 @@
+"""
+Compare two benchmark result files and report regressions.
+
+Usage::
+
+    python -m benchmarks.compare baseline.json current.json --threshold 0.1
+
+Exits with status 1 if any benchmark got slower than the threshold allows.
+"""
+
+import argparse
+import sys
+
+from tippo import Any, Iterable
+
+from .runner import load_results
+
+__all__ = ["compare"]
+
+
+def compare(baseline, current, threshold=0.1):
+    # type: (dict[str, Any], dict[str, Any], float) -> list[dict[str, Any]]
+    """
+    Compare results, matching benchmarks by key.
+
+    :param baseline: Baseline results document.
+    :param current: Current results document.
+    :param threshold: Relative slowdown (of the best timing) considered a regression.
+    :return: Comparison rows.
+    """
+    baseline_results = dict((r["key"], r) for r in baseline["results"])
+    rows = []
+    for result in current["results"]:
+        key = result["key"]
+        if key not in baseline_results:
+            continue
+        before = baseline_results[key]["best"]
+        after = result["best"]
+        ratio = after / before if before else float("inf")
+        rows.append(
+            {
+                "key": key,
+                "baseline": before,
+                "current": after,
+                "ratio": ratio,
+                "regression": ratio > 1.0 + threshold,
+            }
+        )
+    return rows
+
+
+def main(args=None):
+    # type: (Iterable[str] | None) -> int
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare", description="Compare benchmark results.")
+    parser.add_argument("baseline", help="baseline results JSON")
+    parser.add_argument("current", help="current results JSON")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown considered a regression")
+    parser.add_argument("--only-regressions", action="store_true", help="only print regressions")
+    options = parser.parse_args(None if args is None else list(args))
+
+    with open(options.baseline) as stream:
+        baseline = load_results(stream)
+    with open(options.current) as stream:
+        current = load_results(stream)
+
+    rows = compare(baseline, current, threshold=options.threshold)
+    for row in rows:
+        if options.only_regressions and not row["regression"]:
+            continue
+        sys.stdout.write(
+            "{:<90} {:>12.3f} us {:>12.3f} us {:>7.2f}x{}\n".format(
+                row["key"],
+                row["baseline"] * 1e6,
+                row["current"] * 1e6,
+                row["ratio"],
+                "  REGRESSION" if row["regression"] else "",
+            )
+        )
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""Benchmark definitions, timing and machine-readable results."""
+
+import datetime
+import gc
+import json
+import math
+import platform
+import sys
+import timeit
+
+from tippo import Any, Callable, Iterable, Mapping
+
+__all__ = ["Benchmark", "Config", "measure", "run", "get_metadata", "dump_results", "load_results"]
+
+
+class Config(object):
+    """Benchmark run configuration."""
+
+    __slots__ = ("sizes", "depths", "attribute_counts", "min_time", "repeat", "max_loops", "pattern")
+
+    def __init__(
+        self,
+        sizes=(10, 100, 1000, 10000, 100000, 1000000),  # type: Iterable[int]
+        depths=(1, 2, 4, 8),  # type: Iterable[int]
+        attribute_counts=(1, 4, 16, 64),  # type: Iterable[int]
+        min_time=0.1,  # type: float
+        repeat=5,  # type: int
+        max_loops=1000000,  # type: int
+        pattern=None,  # type: str | None
+    ):
+        # type: (...) -> None
+        """
+        :param sizes: Collection sizes to sweep.
+        :param depths: Nesting depths to sweep.
+        :param attribute_counts: Attribute counts to sweep.
+        :param min_time: Minimum time (in seconds) spent on each timing round.
+        :param repeat: Number of timing rounds.
+        :param max_loops: Maximum number of loops in a single timing round.
+        :param pattern: Only run benchmarks whose name contains this substring.
+        """
+        self.sizes = tuple(sizes)
+        self.depths = tuple(depths)
+        self.attribute_counts = tuple(attribute_counts)
+        self.min_time = min_time
+        self.repeat = repeat
+        self.max_loops = max_loops
+        self.pattern = pattern
+
+
+class Benchmark(object):
+    """Describes a single benchmark case."""
+
+    __slots__ = ("name", "implementation", "params", "setup", "payload")
+
+    def __init__(self, name, implementation, params, setup, payload=False):
+        # type: (str, str, Mapping[str, Any], Callable[[], Callable[[], Any]], bool) -> None
+        """
+        :param name: Benchmark name (operation being measured).
+        :param implementation: Implementation being measured (`datta`, `dataclass`, `precord`, `pyrsistent`).
+        :param params: Sweep parameters (size, depth, attribute count, etc).
+        :param setup: Callable that prepares the data and returns the zero-argument function to be timed.
+        :param payload: Whether the timed function returns a payload whose size (in bytes) should be recorded.
+        """
+        self.name = name
+        self.implementation = implementation
+        self.params = dict(params)
+        self.setup = setup
+        self.payload = payload
+
+    @property
+    def key(self):
+        # type: () -> str
+        """Unique key used to compare results across runs."""
+        params = ",".join("{}={}".format(k, v) for k, v in sorted(self.params.items()))
+        return "{}[{}]({})".format(self.name, self.implementation, params)
+
+
+def measure(func, min_time=0.1, repeat=5, max_loops=1000000):
+    # type: (Callable[[], Any], float, int, int) -> dict[str, Any]
+    """
+    Time a function.
+
+    :param func: Zero-argument function.
+    :param min_time: Minimum time (in seconds) spent on each timing round.
+    :param repeat: Number of timing rounds.
+    :param max_loops: Maximum number of loops in a single timing round.
+    :return: Timing statistics (seconds per call).
+    """
+    timer = timeit.Timer(func)
+
+    # Calibrate number of loops.
+    loops = 1
+    while True:
+        elapsed = timer.timeit(loops)
+        if elapsed >= min_time or loops >= max_loops:
+            break
+        if elapsed <= 0:
+            loops *= 10
+        else:
+            loops = min(max_loops, max(loops * 2, int(math.ceil(loops * min_time / elapsed))))
+
+    # Timing rounds.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        timings = [t / loops for t in timer.repeat(repeat=repeat, number=loops)]
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    mean = sum(timings) / len(timings)
+    stdev = math.sqrt(sum((t - mean) ** 2 for t in timings) / len(timings))
+    return {"loops": loops, "repeat": repeat, "best": min(timings), "mean": mean, "stdev": stdev}
+
+
+def run(benchmarks, config, log=None):
+    # type: (Iterable[Benchmark], Config, Callable[[str], None] | None) -> list[dict[str, Any]]
+    """
+    Run benchmarks.
+
+    :param benchmarks: Benchmarks.
+    :param config: Configuration.
+    :param log: Optional logging function.
+    :return: Results.
+    """
+    results = []
+    for benchmark in benchmarks:
+        if config.pattern is not None and config.pattern not in benchmark.key:
+            continue
+        func = benchmark.setup()
+        stats = measure(func, min_time=config.min_time, repeat=config.repeat, max_loops=config.max_loops)
+        result = {
+            "key": benchmark.key,
+            "benchmark": benchmark.name,
+            "implementation": benchmark.implementation,
+            "params": benchmark.params,
+        }
+        result.update(stats)
+        if benchmark.payload:
+            result["payload_size"] = len(func())
+        results.append(result)
+        if log is not None:
+            log("{:<90} {:>14.3f} us".format(benchmark.key, stats["best"] * 1e6))
+        del func
+    return results
+
+
+def get_metadata():
+    # type: () -> dict[str, Any]
+    """
+    Get information about the environment the benchmarks ran on.
+
+    :return: Metadata.
+    """
+    versions = {}  # type: dict[str, str | None]
+    for name in ("datta", "estruttura", "basicco", "pyrsistent", "tippo"):
+        try:
+            from importlib.metadata import version  # type: ignore
+        except ImportError:
+            try:
+                import pkg_resources  # type: ignore
+            except ImportError:
+                versions[name] = None
+            else:
+                try:
+                    versions[name] = pkg_resources.get_distribution(name).version
+                except Exception:
+                    versions[name] = None
+        else:
+            try:
+                versions[name] = version(name)
+            except Exception:
+                versions[name] = None
+
+    return {
+        "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
+        "python": sys.version.split()[0],
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "versions": versions,
+    }
+
+
+def dump_results(results, metadata, stream):
+    # type: (list[dict[str, Any]], dict[str, Any], Any) -> None
+    """
+    Write results as JSON.
+
+    :param results: Results.
+    :param metadata: Metadata.
+    :param stream: Writable text stream.
+    """
+    json.dump({"metadata": metadata, "results": results}, stream, indent=2, sort_keys=True)
+    stream.write("\n")
+
+
+def load_results(stream):
+    # type: (Any) -> dict[str, Any]
+    """
+    Read JSON results.
+
+    :param stream: Readable text stream.
+    :return: Results document.
+    """
+    return json.load(stream)
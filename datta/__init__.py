@@ -17,8 +17,9 @@ from ._constants import (
     DeletedType,
     MissingType,
 )
-from ._data import Data, DataMeta, PrivateData
+from ._data import Data, DataMeta, InternDataMeta, PrivateData
 from ._dict import DictData, PrivateDictData
+from ._evolvers import DataEvolver
 from ._helpers import (
     attribute,
     dict_attribute,
@@ -27,10 +28,13 @@ from ._helpers import (
     list_cls,
     set_attribute,
     set_cls,
+    table_cls,
 )
 from ._list import ListData, PrivateListData
+from ._patches import diff
 from ._relationship import Relationship
 from ._set import PrivateSetData, SetData
+from ._table import PrivateTableData, TableData
 
 __all__ = [
     "getter",
@@ -47,9 +51,12 @@ __all__ = [
     "ListData",
     "PrivateSetData",
     "SetData",
+    "PrivateTableData",
+    "TableData",
     "dict_cls",
     "list_cls",
     "set_cls",
+    "table_cls",
     "attribute",
     "dict_attribute",
     "list_attribute",
@@ -64,6 +71,9 @@ __all__ = [
     "Relationship",
     "Attribute",
     "DataMeta",
+    "InternDataMeta",
     "PrivateData",
     "Data",
+    "DataEvolver",
+    "diff",
 ]
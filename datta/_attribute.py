@@ -1,6 +1,7 @@
 import estruttura
+from basicco import basic_data
 from basicco.namespace import Namespace
-from tippo import Any, Callable, Iterable, Mapping, TypeVar
+from tippo import Any, Callable, Iterable, Mapping, Type, TypeVar
 
 from ._constants import MISSING, MissingType
 from ._relationship import Relationship
@@ -12,7 +13,7 @@ T_co = TypeVar("T_co", covariant=True)
 
 
 class Attribute(estruttura.Attribute[T_co]):
-    __slots__ = ()
+    __slots__ = ("_lazy", "_lazy_fget")
 
     def __init__(
         self,  # type: A
@@ -38,6 +39,7 @@ class Attribute(estruttura.Attribute[T_co]):
         callback=None,  # type: Callable[[A], None] | None
         extra_paths=(),  # type: Iterable[str]
         builtin_paths=None,  # type: Iterable[str] | None
+        lazy=False,  # type: bool
     ):
         # type: (...) -> None
         """
@@ -63,7 +65,31 @@ class Attribute(estruttura.Attribute[T_co]):
         :param callback: Callback that runs after attribute has been named/owned by class.
         :param extra_paths: Extra module paths in fallback order.
         :param builtin_paths: Builtin module paths in fallback order.
+        :param lazy: Whether the getter delegate runs when the value is first accessed instead of on construction.
         """
+
+        # Lazy attributes are computed from their getter delegate only.
+        if lazy:
+            for name, value in (
+                ("default", default is not MISSING),
+                ("factory", factory is not MISSING),
+                ("required", required),
+                ("init", init),
+                ("settable", settable),
+                ("deletable", deletable),
+                ("serializable", serializable),
+                ("constant", constant),
+                ("eq", eq),
+                ("order", order),
+                ("hash", hash),
+            ):
+                if value:
+                    error = "lazy attribute can't set {!r}".format(name)
+                    raise ValueError(error)
+            required = init = settable = deletable = serializable = eq = order = hash = False
+            if repr is None:
+                repr = False
+
         super(Attribute, self).__init__(
             default=default,
             factory=factory,
@@ -88,6 +114,50 @@ class Attribute(estruttura.Attribute[T_co]):
             extra_paths=extra_paths,
             builtin_paths=builtin_paths,
         )
+        self._lazy = bool(lazy)
+        self._lazy_fget = None  # type: Callable[[Any], T_co] | None
+
+    def __set_name__(self, owner, name):
+        # type: (Type[Any], str) -> None
+
+        # Keep the getter delegate of lazy attributes out of the regular delegation machinery.
+        if self._lazy and self._fget is not None:
+            self._lazy_fget, self._fget = self._fget, None
+        if self._lazy and self._lazy_fget is None:
+            error = "lazy attribute {!r} has no getter delegate".format(name)
+            raise TypeError(error)
+        if self._lazy:
+            for dependent in self.dependents:
+                if not getattr(dependent, "lazy", False):
+                    error = "lazy attribute {!r} can't be a dependency of a non-lazy attribute".format(name)
+                    raise TypeError(error)
+
+        super(Attribute, self).__set_name__(owner, name)
+
+    def to_items(self, usecase=None):
+        # type: (basic_data.ItemUsecase | None) -> list[tuple[str, Any]]
+        """
+        Convert to items.
+
+        :param usecase: Use case.
+        :return: Items.
+        """
+        items = super(Attribute, self).to_items(usecase)
+        index = [n for n, _ in items].index("builtin_paths") + 1
+        items.insert(index, ("lazy", self.lazy))
+        return items
+
+    @property
+    def lazy(self):
+        # type: () -> bool
+        """Whether the getter delegate runs when the value is first accessed instead of on construction."""
+        return self._lazy
+
+    @property
+    def lazy_fget(self):
+        # type: () -> Callable[[Any], T_co] | None
+        """Getter delegate of a lazy attribute."""
+        return self._lazy_fget
 
 
 A = TypeVar("A", bound=Attribute)
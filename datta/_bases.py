@@ -1,4 +1,8 @@
+import json
+import weakref
+
 import six
+from basicco.import_path import import_path
 from estruttura import (
     BaseImmutableCollectionStructure,
     BaseImmutableStructure,
@@ -6,22 +10,169 @@ from estruttura import (
     BaseUserImmutableCollectionStructure,
     BaseUserImmutableStructure,
 )
-from tippo import TypeVar
+from tippo import Any, Iterable, Iterator, TypeVar
 
+from ._constants import BASIC_TYPES, MISSING
+from ._profiling import ProfiledNamespace, is_profiling_classes, record_class
 from ._relationship import Relationship
+from .exceptions import SerializationError
+from .serializers import TypedSerializer
 
 T_co = TypeVar("T_co", covariant=True)
 
+_BASIC_TYPES = frozenset(BASIC_TYPES)
+_JSON_ENCODER = json.JSONEncoder()
+
+_streamable = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[type, bool]
+
 
 class BaseDataMeta(BaseStructureMeta):
     """Metaclass for :class:`BasePrivateData`."""
 
+    @classmethod
+    def __prepare__(mcs, name, bases, **kwargs):  # type: ignore  # noqa
+        # type: (str, tuple[type, ...], **Any) -> dict[str, Any]
+        if is_profiling_classes():
+            return ProfiledNamespace()
+        return {}
+
+    def __init__(cls, name, bases, dct, **kwargs):  # noqa
+        super(BaseDataMeta, cls).__init__(name, bases, dct, **kwargs)
+        if isinstance(dct, ProfiledNamespace):
+            record_class(cls, dct.started)
+
 
 # noinspection PyAbstractClass
 class BasePrivateData(six.with_metaclass(BaseDataMeta, BaseImmutableStructure)):
     """Base private data."""
 
-    __slots__ = ()
+    __slots__ = ("__hash", "__serialized")
+
+    __cache_hash__ = True  # type: bool
+    __cache_serialized__ = False  # type: bool
+
+    def __init_subclass__(cls, cache_hash=None, cache_serialized=None, **kwargs):
+        # type: (bool | None, bool | None, **Any) -> None
+        """
+        Initialize subclass with parameters.
+
+        :param cache_hash: Whether to cache the hash (disable if values are not deeply immutable).
+        :param cache_serialized: Whether to cache the serialized output (shared between calls, do not mutate it).
+        """
+        if cache_hash is not None:
+            cls.__cache_hash__ = bool(cache_hash)
+        if cache_serialized is not None:
+            cls.__cache_serialized__ = bool(cache_serialized)
+        super(BasePrivateData, cls).__init_subclass__(**kwargs)  # noqa
+
+    def _hash(self):
+        # type: () -> int
+        """
+        Get hash (cached after the first computation, unless disabled for the class).
+
+        :return: Hash.
+        """
+        if not type(self).__cache_hash__:
+            return self._do_hash()
+        try:
+            return self.__hash  # type: ignore
+        except AttributeError:
+            hash_value = self._do_hash()
+            object.__setattr__(self, "_BasePrivateData__hash", hash_value)
+            return hash_value
+
+    def _do_hash(self):
+        # type: () -> int
+        """
+        Compute hash (internal).
+
+        :return: Hash.
+        """
+        raise NotImplementedError()
+
+    def serialize(self):
+        # type: () -> Any
+        """
+        Serialize (cached after the first call if enabled for the class).
+        Cached output is shared by all calls and by the output of parents that contain this instance, so it should \
+not be mutated.
+
+        :return: Serialized object.
+        :raises SerializationError: Error while serializing.
+        """
+        if not type(self).__cache_serialized__:
+            return self._do_serialize()
+        try:
+            return self.__serialized  # type: ignore
+        except AttributeError:
+            serialized = self._do_serialize()
+            object.__setattr__(self, "_BasePrivateData__serialized", serialized)
+            return serialized
+
+    def _do_serialize(self):
+        # type: () -> Any
+        """
+        Serialize (internal).
+
+        :return: Serialized object.
+        :raises SerializationError: Error while serializing.
+        """
+        raise NotImplementedError()
+
+    def iter_serialize(self, chunk_size=65536):
+        # type: (int) -> Iterator[str]
+        """
+        Serialize as JSON, yielding text chunks as they are produced instead of building the serialized output first.
+        The chunks add up to the same text as `json.dumps(self.serialize())`.
+
+        :param chunk_size: Minimum size of each chunk (except for the last one), in characters.
+        :return: JSON text chunk iterator.
+        :raises SerializationError: Error while serializing.
+        """
+        parts = []  # type: list[str]
+        size = 0
+        for part in _iter_parts(self):
+            parts.append(part)
+            size += len(part)
+            if size >= chunk_size:
+                yield "".join(parts)
+                del parts[:]
+                size = 0
+        if parts:
+            yield "".join(parts)
+
+    def serialize_to(self, stream, chunk_size=65536):
+        # type: (Any, int) -> None
+        """
+        Serialize as JSON, writing text chunks to a stream as they are produced.
+
+        :param stream: Writable text stream.
+        :param chunk_size: Minimum size of each write (except for the last one), in characters.
+        :raises SerializationError: Error while serializing.
+        """
+        write = stream.write
+        for chunk in self.iter_serialize(chunk_size=chunk_size):
+            write(chunk)
+
+    def _iter_serialize(self):
+        # type: () -> Iterable[str]
+        """
+        Iterate over the JSON text parts of the serialized output (internal).
+
+        :return: JSON text parts.
+        :raises SerializationError: Error while serializing.
+        """
+        return (_JSON_ENCODER.encode(self.serialize()),)
+
+    def _serialize_whole(self):
+        # type: () -> Any
+        """
+        Serialize at once when streaming is not worth it (internal).
+
+        :return: Serialized output or MISSING (should be streamed).
+        :raises SerializationError: Error while serializing.
+        """
+        return MISSING
 
 
 # noinspection PyAbstractClass
@@ -48,3 +199,217 @@ class DataCollection(PrivateDataCollection[T_co], BaseUserImmutableCollectionStr
 
     def _do_clear(self):
         return type(self)()
+
+
+def deserialize_trusted(relationship, serialized):
+    # type: (Any, Any) -> Any
+    """
+    Deserialize a value from a trusted source, only decoding its structure.
+    Nested data classes are deserialized in trusted mode as well; anything else goes through the relationship.
+
+    :param relationship: Relationship.
+    :param serialized: Serialized value.
+    :return: Value.
+    :raises SerializationError: Error while deserializing.
+    """
+    if isinstance(serialized, BASIC_TYPES) or type(relationship.serializer) is not TypedSerializer:
+        return relationship.deserialize_value(serialized)
+
+    # Class path and state wrapped in a dictionary.
+    cls = None  # type: Any
+    state = serialized
+    if isinstance(serialized, dict) and "__class__" in serialized:
+        if "__state__" in serialized and all(k.startswith("__") and k.endswith("__") for k in serialized):
+            try:
+                cls = import_path(
+                    serialized["__class__"],
+                    extra_paths=relationship.extra_paths,
+                    builtin_paths=relationship.builtin_paths,
+                )
+            except (ImportError, ValueError, AttributeError):
+                cls = None
+            else:
+                state = serialized["__state__"]
+
+    # Class inferred from the relationship types.
+    else:
+        types_info = relationship.types_info
+        if not relationship.subtypes:
+            if len(types_info.complex_types) == 1:
+                cls = types_info.complex_types[0]
+            elif len(types_info.mapping_types) == 1 and isinstance(serialized, dict):
+                cls = types_info.mapping_types[0]
+            elif len(types_info.iterable_types) == 1 and isinstance(serialized, list):
+                cls = types_info.iterable_types[0]
+
+    if isinstance(cls, type) and issubclass(cls, BasePrivateData):
+        return cls.deserialize(state, trusted=True)  # type: ignore
+    return relationship.deserialize_value(serialized)
+
+
+def reconstruct_collection(cls, values):
+    # type: (Any, Any) -> Any
+    """
+    Reconstruct a pickled data collection from its flat values, without revalidating them.
+
+    :param cls: Data collection class.
+    :param values: Flat values (tuple, list or dictionary).
+    :return: Data collection.
+    """
+    return cls._do_deserialize(values)
+
+
+def _is_streamable(cls):
+    # type: (type) -> bool
+    """
+    Get whether the `_iter_serialize` method of a class mirrors its serialization methods (not overridden below it).
+
+    :param cls: Data class.
+    :return: True if streamable.
+    """
+    try:
+        return _streamable[cls]
+    except KeyError:
+        pass
+    streamable = True
+    for base in cls.__mro__:
+        if "_iter_serialize" in base.__dict__:
+            break
+        for name in ("serialize", "_do_serialize"):
+            if name in base.__dict__ and not getattr(base.__dict__[name], "_datta_generated", False):
+                streamable = False
+    _streamable[cls] = streamable
+    return streamable
+
+
+def _get_whole_serialized(obj):
+    # type: (BasePrivateData) -> Any
+    """
+    Get the serialized output of a data object if it's cached, customized or not worth streaming.
+
+    :param obj: Data object.
+    :return: Serialized output or MISSING (should be streamed).
+    :raises SerializationError: Error while serializing.
+    """
+    cls = type(obj)
+    if cls.__cache_serialized__:
+        try:
+            return object.__getattribute__(obj, "_BasePrivateData__serialized")
+        except AttributeError:
+            pass
+    if not _is_streamable(cls):
+        return obj.serialize()
+    return obj._serialize_whole()
+
+
+def _iter_parts(obj):
+    # type: (BasePrivateData) -> Iterable[str]
+    """
+    Iterate over the JSON text parts of a data object's serialized output.
+
+    :param obj: Data object.
+    :return: JSON text parts.
+    :raises SerializationError: Error while serializing.
+    """
+    serialized = _get_whole_serialized(obj)
+    if serialized is MISSING:
+        return obj._iter_serialize()
+    return (_JSON_ENCODER.encode(serialized),)
+
+
+def _streams_values(relationship):
+    # type: (Any) -> bool
+    """
+    Get whether data values of a relationship can be streamed (their output is not wrapped with their class path).
+
+    :param relationship: Relationship.
+    :return: True if data values can be streamed.
+    """
+    return (
+        type(relationship.serializer) is TypedSerializer
+        and not relationship.subtypes
+        and len(relationship.types_info.complex_types) == 1
+    )
+
+
+def iter_serialize_value(relationship, value):
+    # type: (Any, Any) -> Iterable[str]
+    """
+    Iterate over the JSON text parts of a serialized value.
+
+    :param relationship: Relationship.
+    :param value: Value.
+    :return: JSON text parts (empty if the value serializes as missing).
+    :raises SerializationError: Error while serializing.
+    """
+    if type(value) not in _BASIC_TYPES and isinstance(value, BasePrivateData) and _streams_values(relationship):
+        return _iter_parts(value)
+    serialized = relationship.serialize_value(value)
+    if serialized is MISSING:
+        return ()
+    return (_JSON_ENCODER.encode(serialized),)
+
+
+def iter_serialize_values(relationship, values, batch_size=1024):
+    # type: (Any, Iterable[Any], int) -> Iterator[str]
+    """
+    Iterate over the JSON text parts of comma-separated serialized values (without enclosing brackets).
+    Values that are not streamed are encoded in batches.
+
+    :param relationship: Relationship.
+    :param values: Values.
+    :param batch_size: Maximum number of values encoded at once.
+    :return: JSON text parts.
+    :raises SerializationError: Error while serializing.
+    """
+    basic = type(relationship.serializer) is TypedSerializer
+    streams = _streams_values(relationship)
+    serialize_value = relationship.serialize_value
+    batch = []  # type: list[Any]
+    separator = ""
+    for value in values:
+        if basic and type(value) in _BASIC_TYPES:
+            serialized = value
+        elif streams and isinstance(value, BasePrivateData):
+            serialized = _get_whole_serialized(value)
+            if serialized is MISSING:
+                if batch:
+                    yield separator
+                    yield _JSON_ENCODER.encode(batch)[1:-1]
+                    separator = ", "
+                    del batch[:]
+                yield separator
+                for part in value._iter_serialize():
+                    yield part
+                separator = ", "
+                continue
+        else:
+            serialized = serialize_value(value)
+            if serialized is MISSING:
+                continue
+        batch.append(serialized)
+        if len(batch) >= batch_size:
+            yield separator
+            yield _JSON_ENCODER.encode(batch)[1:-1]
+            separator = ", "
+            del batch[:]
+    if batch:
+        yield separator
+        yield _JSON_ENCODER.encode(batch)[1:-1]
+
+
+def encode_json_key(serialized_key):
+    # type: (Any) -> str
+    """
+    Encode a serialized dictionary key as a JSON object key (the same way :func:`json.dumps` does).
+
+    :param serialized_key: Serialized key.
+    :return: JSON text.
+    :raises SerializationError: Key can't be a JSON object key.
+    """
+    if isinstance(serialized_key, six.string_types):
+        return _JSON_ENCODER.encode(serialized_key)
+    if serialized_key is None or isinstance(serialized_key, (bool, float) + six.integer_types):
+        return _JSON_ENCODER.encode(_JSON_ENCODER.encode(serialized_key))
+    error = "keys must be str, int, float, bool or None, not {!r}".format(type(serialized_key).__name__)
+    raise SerializationError(error)
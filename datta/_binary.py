@@ -0,0 +1,480 @@
+import json
+import struct
+
+import six
+from basicco import mapping_proxy
+from basicco.import_path import get_path, import_path
+from estruttura import DictStructure, ListStructure, SetStructure, Structure
+from estruttura.constants import MISSING
+from estruttura.exceptions import SerializationError
+from estruttura.serializers import TypedSerializer
+from tippo import Any, Callable, Tuple, Type
+
+__all__ = ["to_bytes", "from_bytes"]
+
+
+Encoder = Callable[[Any, bytearray], None]
+Decoder = Callable[[Any, int], Tuple[Any, int]]
+
+_FLOAT = struct.Struct("<d")
+
+# Tags used by values whose type is not known in advance.
+_TAG_NONE = 0
+_TAG_FALSE = 1
+_TAG_TRUE = 2
+_TAG_INT = 3
+_TAG_FLOAT = 4
+_TAG_STR = 5
+_TAG_BYTES = 6
+_TAG_STRUCTURE = 7
+_TAG_SERIALIZED = 8
+
+
+def _encode_uint(value, out):
+    # type: (int, bytearray) -> None
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_uint(data, pos):
+    # type: (Any, int) -> tuple[int, int]
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _encode_int(value, out):
+    # type: (int, bytearray) -> None
+    value = value << 1 if value >= 0 else ((-value) << 1) - 1
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_int(data, pos):
+    # type: (Any, int) -> tuple[int, int]
+    value, pos = _decode_uint(data, pos)
+    return (value >> 1) if not value & 1 else -((value + 1) >> 1), pos
+
+
+def _encode_bool(value, out):
+    # type: (bool, bytearray) -> None
+    out.append(1 if value else 0)
+
+
+def _decode_bool(data, pos):
+    # type: (Any, int) -> tuple[bool, int]
+    return bool(data[pos]), pos + 1
+
+
+def _encode_float(value, out):
+    # type: (float, bytearray) -> None
+    out += _FLOAT.pack(value)
+
+
+def _decode_float(data, pos):
+    # type: (Any, int) -> tuple[float, int]
+    return _FLOAT.unpack_from(data, pos)[0], pos + 8
+
+
+def _encode_bytes(value, out):
+    # type: (bytes, bytearray) -> None
+    _encode_uint(len(value), out)
+    out += value
+
+
+def _decode_bytes(data, pos):
+    # type: (Any, int) -> tuple[bytes, int]
+    size, pos = _decode_uint(data, pos)
+    return bytes(data[pos : pos + size]), pos + size
+
+
+def _encode_str(value, out):
+    # type: (str, bytearray) -> None
+    _encode_bytes(value.encode("utf-8"), out)
+
+
+def _decode_str(data, pos):
+    # type: (Any, int) -> tuple[str, int]
+    size, pos = _decode_uint(data, pos)
+    return bytes(data[pos : pos + size]).decode("utf-8"), pos + size
+
+
+_BASIC_CODECS = {
+    bool: (_encode_bool, _decode_bool),
+    float: (_encode_float, _decode_float),
+    six.text_type: (_encode_str, _decode_str),
+    six.binary_type: (_encode_bytes, _decode_bytes),
+}  # type: dict[Type[Any], tuple[Encoder, Decoder]]
+for _int_type in six.integer_types:
+    _BASIC_CODECS[_int_type] = (_encode_int, _decode_int)
+del _int_type
+
+
+def _is_supported(cls):
+    # type: (Any) -> bool
+    """
+    Get whether a class is a data class or data collection class that can be encoded.
+
+    :param cls: Class.
+    :return: True if supported.
+    """
+    return (
+        isinstance(cls, type)
+        and hasattr(cls, "_do_deserialize")
+        and (
+            (issubclass(cls, Structure) and hasattr(cls, "__pickle_names__"))
+            or issubclass(cls, (ListStructure, SetStructure, DictStructure))
+        )
+    )
+
+
+def _get_codec(cls):
+    # type: (Type[Any]) -> tuple[Encoder, Decoder]
+    """
+    Get the encoder and decoder for a data class or data collection class (cached in the class).
+
+    :param cls: Class.
+    :return: Encoder and decoder.
+    """
+    try:
+        return cls.__dict__["__binary_codec__"]
+    except KeyError:
+        pass
+
+    # Store forwarding functions first so that recursive classes can refer to themselves.
+    codec = []  # type: list[tuple[Encoder, Decoder]]
+
+    def encode(value, out):
+        codec[0][0](value, out)
+
+    def decode(data, pos):
+        return codec[0][1](data, pos)
+
+    type.__setattr__(cls, "__binary_codec__", (encode, decode))
+    try:
+        if issubclass(cls, ListStructure) or issubclass(cls, SetStructure):
+            codec.append(_make_collection_codec(cls))
+        elif issubclass(cls, DictStructure):
+            codec.append(_make_dict_codec(cls))
+        else:
+            codec.append(_make_data_codec(cls))
+    except Exception:
+        type.__delattr__(cls, "__binary_codec__")
+        raise
+    type.__setattr__(cls, "__binary_codec__", codec[0])
+    return codec[0]
+
+
+def _make_data_codec(cls):
+    # type: (Any) -> tuple[Encoder, Decoder]
+    """
+    Make encoder and decoder for a data class.
+    Records are laid out positionally: a presence bitmap for the attributes that might not have a value, followed \
+by the values in pickling order.
+
+    :param cls: Data class.
+    :return: Encoder and decoder.
+    """
+    names = cls.__pickle_names__  # type: tuple[str, ...]
+    attributes = [cls.__attribute_map__[n] for n in names]
+
+    # Attributes that might not have a value get a bit in the presence bitmap (mask 0 means always present).
+    masks = []  # type: list[int]
+    for attribute in attributes:
+        masks.append(1 << sum(1 for m in masks if m) if not attribute.required or attribute.delegated else 0)
+    bitmap_size = (sum(1 for m in masks if m) + 7) // 8
+    value_codecs = [_make_value_codec(a.relationship) for a in attributes]
+    encoders = tuple((n, m, e) for n, m, (e, _) in zip(names, masks, value_codecs))
+    decoders = tuple((n, m, d) for n, m, (_, d) in zip(names, masks, value_codecs))
+    do_deserialize = cls._do_deserialize
+
+    def encode(value, out):
+        if type(value) is not cls:
+            error = "expected {!r} instance, got {!r}".format(cls.__name__, type(value).__name__)
+            raise SerializationError(error)
+        bitmap_pos = len(out)
+        bitmap = 0
+        if bitmap_size:
+            out += bytearray(bitmap_size)
+        for name, mask, encoder in encoders:
+            attribute_value = getattr(value, name, MISSING)
+            if attribute_value is not MISSING:
+                bitmap |= mask
+                encoder(attribute_value, out)
+        for i in range(bitmap_size):
+            out[bitmap_pos + i] = (bitmap >> (8 * i)) & 0xFF
+
+    def decode(data, pos):
+        bitmap = 0
+        for i in range(bitmap_size):
+            bitmap |= data[pos + i] << (8 * i)
+        pos += bitmap_size
+        values = {}
+        for name, mask, decoder in decoders:
+            if not mask or bitmap & mask:
+                values[name], pos = decoder(data, pos)
+        return do_deserialize(mapping_proxy.MappingProxyType(values)), pos
+
+    return encode, decode
+
+
+def _make_collection_codec(cls):
+    # type: (Any) -> tuple[Encoder, Decoder]
+    """
+    Make encoder and decoder for a list or set data collection class (length-prefixed block of values).
+
+    :param cls: Data collection class.
+    :return: Encoder and decoder.
+    """
+    value_encode, value_decode = _make_value_codec(cls.relationship)
+    do_deserialize = cls._do_deserialize
+
+    def encode(value, out):
+        _encode_uint(len(value), out)
+        for item in value:
+            value_encode(item, out)
+
+    def decode(data, pos):
+        size, pos = _decode_uint(data, pos)
+        values = []
+        append = values.append
+        for _ in range(size):
+            item, pos = value_decode(data, pos)
+            append(item)
+        return do_deserialize(tuple(values)), pos
+
+    return encode, decode
+
+
+def _make_dict_codec(cls):
+    # type: (Any) -> tuple[Encoder, Decoder]
+    """
+    Make encoder and decoder for a dictionary data collection class (length-prefixed block of key/value pairs).
+
+    :param cls: Data collection class.
+    :return: Encoder and decoder.
+    """
+    key_encode, key_decode = _make_value_codec(cls.relationship)
+    value_encode, value_decode = _make_value_codec(cls.value_relationship)
+    do_deserialize = cls._do_deserialize
+
+    def encode(value, out):
+        _encode_uint(len(value), out)
+        for key, item in six.iteritems(value):
+            key_encode(key, out)
+            value_encode(item, out)
+
+    def decode(data, pos):
+        size, pos = _decode_uint(data, pos)
+        values = {}
+        for _ in range(size):
+            key, pos = key_decode(data, pos)
+            values[key], pos = value_decode(data, pos)
+        return do_deserialize(values), pos
+
+    return encode, decode
+
+
+def _make_value_codec(relationship):
+    # type: (Any) -> tuple[Encoder, Decoder]
+    """
+    Make encoder and decoder for values of a relationship.
+    A single type (optionally with None) is encoded without type tags.
+
+    :param relationship: Relationship.
+    :return: Encoder and decoder.
+    """
+    if type(relationship.serializer) is TypedSerializer and not relationship.subtypes:
+        try:
+            all_types = relationship.types_info.all_types
+        except (ImportError, AttributeError, TypeError, ValueError):
+            all_types = ()
+        nullable = type(None) in all_types
+        types = tuple(t for t in all_types if t is not type(None))
+        if len(types) == 1:
+            typ = types[0]
+            if typ in _BASIC_CODECS:
+                codec = _BASIC_CODECS[typ]
+            elif _is_supported(typ):
+                codec = _make_class_codec(typ)
+            else:
+                codec = _make_tagged_codec(relationship)
+            return _make_nullable_codec(*codec) if nullable else codec
+    return _make_tagged_codec(relationship)
+
+
+def _make_class_codec(cls):
+    # type: (Type[Any]) -> tuple[Encoder, Decoder]
+    """
+    Make encoder and decoder that look up the codec for a class when first used (so that it can be recursive).
+
+    :param cls: Data class or data collection class.
+    :return: Encoder and decoder.
+    """
+    codec = []  # type: list[tuple[Encoder, Decoder]]
+
+    def encode(value, out):
+        if not codec:
+            codec.append(_get_codec(cls))
+        codec[0][0](value, out)
+
+    def decode(data, pos):
+        if not codec:
+            codec.append(_get_codec(cls))
+        return codec[0][1](data, pos)
+
+    return encode, decode
+
+
+def _make_nullable_codec(value_encode, value_decode):
+    # type: (Encoder, Decoder) -> tuple[Encoder, Decoder]
+    """
+    Make encoder and decoder for a value that can be None (prefixed by a presence byte).
+
+    :param value_encode: Value encoder.
+    :param value_decode: Value decoder.
+    :return: Encoder and decoder.
+    """
+
+    def encode(value, out):
+        if value is None:
+            out.append(0)
+        else:
+            out.append(1)
+            value_encode(value, out)
+
+    def decode(data, pos):
+        if not data[pos]:
+            return None, pos + 1
+        return value_decode(data, pos + 1)
+
+    return encode, decode
+
+
+def _make_tagged_codec(relationship):
+    # type: (Any) -> tuple[Encoder, Decoder]
+    """
+    Make encoder and decoder for values whose type is not known in advance (prefixed by a type tag).
+    Data objects are stored with their import path, anything else falls back to the relationship's serializer.
+
+    :param relationship: Relationship.
+    :return: Encoder and decoder.
+    """
+
+    def encode(value, out):
+        value_type = type(value)
+        if value is None:
+            out.append(_TAG_NONE)
+        elif value_type is bool:
+            out.append(_TAG_TRUE if value else _TAG_FALSE)
+        elif value_type in six.integer_types:
+            out.append(_TAG_INT)
+            _encode_int(value, out)
+        elif value_type is float:
+            out.append(_TAG_FLOAT)
+            _encode_float(value, out)
+        elif value_type is six.text_type:
+            out.append(_TAG_STR)
+            _encode_str(value, out)
+        elif value_type is six.binary_type:
+            out.append(_TAG_BYTES)
+            _encode_bytes(value, out)
+        elif _is_supported(value_type):
+            out.append(_TAG_STRUCTURE)
+            _encode_str(get_path(value_type), out)
+            _get_codec(value_type)[0](value, out)
+        else:
+            out.append(_TAG_SERIALIZED)
+            _encode_str(json.dumps(relationship.serialize_value(value), sort_keys=True), out)
+
+    def decode(data, pos):
+        tag = data[pos]
+        pos += 1
+        if tag == _TAG_NONE:
+            return None, pos
+        elif tag == _TAG_FALSE:
+            return False, pos
+        elif tag == _TAG_TRUE:
+            return True, pos
+        elif tag == _TAG_INT:
+            return _decode_int(data, pos)
+        elif tag == _TAG_FLOAT:
+            return _decode_float(data, pos)
+        elif tag == _TAG_STR:
+            return _decode_str(data, pos)
+        elif tag == _TAG_BYTES:
+            return _decode_bytes(data, pos)
+        elif tag == _TAG_STRUCTURE:
+            path, pos = _decode_str(data, pos)
+            cls = import_path(path, extra_paths=relationship.extra_paths, builtin_paths=relationship.builtin_paths)
+            if not _is_supported(cls):
+                error = "{!r} is not a data class".format(path)
+                raise SerializationError(error)
+            return _get_codec(cls)[1](data, pos)
+        elif tag == _TAG_SERIALIZED:
+            serialized, pos = _decode_str(data, pos)
+            return relationship.deserialize_value(json.loads(serialized)), pos
+        else:
+            error = "invalid type tag {}".format(tag)
+            raise SerializationError(error)
+
+    return encode, decode
+
+
+def to_bytes(obj):
+    # type: (Any) -> bytes
+    """
+    Encode a data object or data collection into a compact binary format.
+    The layout is driven by the class schema (attribute names are not stored), so the bytes can only be decoded by \
+the same class definition.
+
+    :param obj: Data object or data collection.
+    :return: Encoded bytes.
+    :raises SerializationError: Error while encoding.
+    """
+    cls = type(obj)
+    if not _is_supported(cls):
+        error = "can't encode {!r} object, expected a data object or data collection".format(cls.__name__)
+        raise SerializationError(error)
+    out = bytearray()
+    _get_codec(cls)[0](obj, out)
+    return bytes(out)
+
+
+def from_bytes(cls, data):
+    # type: (Type[Any], bytes) -> Any
+    """
+    Decode a data object or data collection from bytes produced by :func:`to_bytes`.
+    Values are not converted, type checked or validated again.
+
+    :param cls: Data class or data collection class.
+    :param data: Encoded bytes.
+    :return: Data object or data collection.
+    :raises SerializationError: Error while decoding.
+    """
+    if not _is_supported(cls):
+        error = "can't decode {!r}, expected a data class or data collection class".format(cls)
+        raise SerializationError(error)
+    if six.PY2:
+        data = bytearray(data)  # pragma: no cover
+    try:
+        obj, pos = _get_codec(cls)[1](data, 0)
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        error = "truncated or corrupted data ({})".format(e)
+        exc = SerializationError(error)
+        six.raise_from(exc, None)
+        raise exc
+    if pos != len(data):
+        error = "{} unexpected trailing byte(s)".format(len(data) - pos)
+        raise SerializationError(error)
+    return obj
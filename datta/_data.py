@@ -1,20 +1,723 @@
 import copy
+import math
+import re
+import weakref
 
 import six
-from basicco import mangling, mapping_proxy, obj_state
-from estruttura import ImmutableStructure, StructureMeta, UserImmutableStructure
-from tippo import Any, Type, TypeVar
+from basicco import dynamic_code, mangling, mapping_proxy, obj_state
+from estruttura import (
+    ImmutableStructure,
+    Structure,
+    StructureMeta,
+    UserImmutableStructure,
+)
+from tippo import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from ._attribute import Attribute
-from ._bases import BaseData, BaseDataMeta, BasePrivateData
+from ._bases import (
+    BaseData,
+    BaseDataMeta,
+    BasePrivateData,
+    deserialize_trusted,
+    encode_json_key,
+    iter_serialize_value,
+)
+from ._constants import BASIC_TYPES, DEFAULT, DELETED, MISSING
+from ._evolvers import DataEvolver
+from ._list import ListData
+from ._numpy import matches_dtype
+from ._relationship import Relationship
+from .exceptions import ProcessingError
+from .serializers import TypedSerializer
 
 KT = TypeVar("KT")
 VT = TypeVar("VT")
 
 
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_INTERN_TYPES = frozenset(BASIC_TYPES + (type(MISSING),))
+
+_nesting_classes = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[type, bool]
+_list_types = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[type, Type[ListData[Any]]]
+_direct_update_names = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[type, frozenset[str]]
+
+
+def _is_generated(func):
+    # type: (Any) -> bool
+    """
+    Get whether a function is a generated method (or its placeholder).
+
+    :param func: Function.
+    :return: True if generated.
+    """
+    return getattr(func, "_datta_generated", False) is True
+
+
+def _can_generate_init(cls):
+    # type: (Type[PrivateData]) -> bool
+    """
+    Get whether a specialized `__init__` method can be generated for a data class.
+
+    :param cls: Data class.
+    :return: True if supported.
+    """
+
+    # Base private data class being defined.
+    if "PrivateData" not in globals():
+        return False
+
+    # Custom '__init__' or '_do_init' methods.
+    for base in cls.__mro__:
+        if "__init__" in base.__dict__:
+            init = base.__dict__["__init__"]
+            if init is not Structure.__dict__["__init__"] and not _is_generated(init):
+                return False
+            break
+    if getattr(cls._do_init, "__func__", cls._do_init) is not PrivateData.__dict__["_do_init"]:
+        return False
+
+    # Keyword arguments only (no syntax for it in Python 2.7).
+    if cls.__kw_only__ and six.PY2:
+        return False
+
+    for name, attribute in cls.__attribute_map__.ordered_items():
+        if attribute.constant:
+            continue
+
+        # Delegated attributes go through the dependency resolution machinery.
+        if attribute.delegated:
+            return False
+
+        # Required attributes that can't be initialized.
+        if not attribute.init and attribute.required and not attribute.has_default:
+            return False
+
+    # Names can't clash with the generated code.
+    for init_name in cls.__initialization_map__:
+        if not _IDENTIFIER.match(init_name) or init_name == "self" or init_name.startswith("_datta_"):
+            return False
+
+    return True
+
+
+def _generic_init(self, cls, values, args, kwargs):
+    # type: (PrivateData, Type[PrivateData], tuple[Any, ...], tuple[Any, ...], dict[str, Any]) -> None
+    """
+    Initialize through the generic `__init__` method (used when the generated one does not apply).
+
+    :param self: Instance.
+    :param cls: Class that owns the generated `__init__` method.
+    :param values: Values received by the generated `__init__` method's named parameters.
+    :param args: Extra positional arguments.
+    :param kwargs: Extra keyword arguments.
+    """
+    if args:
+        Structure.__init__(self, *(values + args), **kwargs)
+    else:
+        kwargs = dict(kwargs)
+        for init_name, value in zip(cls.__initialization_map__, values):
+            if value is not MISSING:
+                kwargs[init_name] = value
+        Structure.__init__(self, **kwargs)
+
+
+def _raise_invalid_arguments(cls, args, kwargs):
+    # type: (Type[PrivateData], tuple[Any, ...], dict[str, Any]) -> None
+    """
+    Raise error for invalid arguments.
+
+    :param cls: Class that owns the generated `__init__` method.
+    :param args: Extra positional arguments.
+    :param kwargs: Extra keyword arguments.
+    :raises TypeError: Invalid arguments.
+    """
+    if cls.__kw_only__ and args:
+        error = "'{}.__init__' accepts keyword arguments only".format(cls.__qualname__)
+    elif kwargs:
+        error = "invalid keyword argument(s) {}".format(", ".join(repr(k) for k in kwargs))
+    else:
+        error = "invalid additional positional argument value(s) {}".format(", ".join(repr(p) for p in args))
+    raise TypeError(error)
+
+
+def _raise_missing(cls, values):
+    # type: (Type[PrivateData], tuple[Any, ...]) -> None
+    """
+    Raise error for missing required attribute values.
+
+    :param cls: Class that owns the generated `__init__` method.
+    :param values: Values received by the generated `__init__` method's named parameters.
+    :raises RuntimeError: Missing required attribute values.
+    """
+    missing = []
+    for attribute_name, value in zip(six.itervalues(cls.__initialization_map__), values):
+        attribute = cls.__attribute_map__[attribute_name]
+        if attribute.required and not attribute.has_default and (value is MISSING or value is DEFAULT):
+            missing.append(attribute_name)
+    error = "missing values for required attributes {}".format(", ".join(repr(n) for n in missing))
+    raise RuntimeError(error)
+
+
+def _generate_init(cls):
+    # type: (Type[PrivateData]) -> Callable[..., None]
+    """
+    Generate an `__init__` method specialized for a data class.
+
+    Default values, factories, processing and type checks are inlined and values are written directly to the slots.
+
+    :param cls: Data class.
+    :return: Generated `__init__` method.
+    """
+    globs = {
+        "_datta_cls": cls,
+        "_datta_type": type,
+        "_datta_isinstance": isinstance,
+        "_datta_MISSING": MISSING,
+        "_datta_DEFAULT": DEFAULT,
+        "_datta_generic_init": _generic_init,
+        "_datta_raise_invalid_arguments": _raise_invalid_arguments,
+        "_datta_raise_missing": _raise_missing,
+    }  # type: dict[str, Any]
+
+    init_names = list(cls.__initialization_map__)
+    attribute_names = list(six.itervalues(cls.__initialization_map__))
+    values_tuple = "({},)".format(", ".join(init_names)) if init_names else "()"
+
+    parameters = ["self"]
+    if cls.__kw_only__:
+        parameters.append("*_datta_args")
+    parameters.extend("{}=_datta_MISSING".format(n) for n in init_names)
+    if not cls.__kw_only__:
+        parameters.append("*_datta_args")
+    parameters.append("**_datta_kwargs")
+
+    lines = [
+        "def __init__({}):".format(", ".join(parameters)),
+        "    if _datta_type(self) is not _datta_cls:",
+        "        return _datta_generic_init(self, _datta_cls, {}, _datta_args, _datta_kwargs)".format(values_tuple),
+        "    if _datta_args or _datta_kwargs:",
+        "        _datta_raise_invalid_arguments(_datta_cls, _datta_args, _datta_kwargs)",
+    ]
+
+    for i, (name, attribute) in enumerate(cls.__attribute_map__.ordered_items()):
+        if attribute.constant:
+            continue
+
+        # Local variable holding the value.
+        if attribute.init:
+            var = init_names[attribute_names.index(name)]
+        elif attribute.has_default:
+            var = "_datta_value_{}".format(i)
+        else:
+            continue
+        indent = "    "
+
+        # Direct slot setter.
+        owner = attribute.owner
+        assert owner is not None
+        globs["_datta_set_{}".format(i)] = owner.__dict__[mangling.mangle(name, owner.__name__)].__set__
+
+        # Default value/factory.
+        if attribute.has_default:
+            if attribute.default is not MISSING:
+                globs["_datta_default_{}".format(i)] = attribute.default
+                default_code = "_datta_default_{}".format(i)
+            else:
+                globs["_datta_get_default_{}".format(i)] = attribute.get_default_value
+                default_code = "_datta_get_default_{}()".format(i)
+            if attribute.init:
+                lines.append("    if {0} is _datta_MISSING or {0} is _datta_DEFAULT:".format(var))
+                lines.append("        {} = {}".format(var, default_code))
+            else:
+                lines.append("    {} = {}".format(var, default_code))
+        elif attribute.required:
+            lines.append("    if {0} is _datta_MISSING or {0} is _datta_DEFAULT:".format(var))
+            lines.append("        _datta_raise_missing(_datta_cls, {})".format(values_tuple))
+        else:
+            lines.append("    if {0} is not _datta_MISSING and {0} is not _datta_DEFAULT:".format(var))
+            indent = "        "
+
+        # Processing (converter, type check, validator).
+        if attribute.relationship.will_process:
+            globs["_datta_process_{}".format(i)] = attribute.process_value
+            process_code = "{} = _datta_process_{}({}, {!r})".format(var, i, var, name)
+            relationship = attribute.relationship
+            exact_types = relationship.exact_types if isinstance(relationship, Relationship) else ()
+            if not exact_types:
+                lines.append("{}{}".format(indent, process_code))
+            else:
+                globs["_datta_types_{}".format(i)] = exact_types
+                if relationship.subtypes:
+                    lines.append("{}if not _datta_isinstance({}, _datta_types_{}):".format(indent, var, i))
+                else:
+                    lines.append("{}if _datta_type({}) not in _datta_types_{}:".format(indent, var, i))
+                lines.append("{}    {}".format(indent, process_code))
+
+        # Write to slot.
+        lines.append("{}_datta_set_{}(self, {})".format(indent, i, var))
+
+    script = "\n".join(lines) + "\n"
+    init = dynamic_code.make_function(
+        "__init__",
+        script,
+        globs=globs,
+        filename=dynamic_code.generate_unique_filename("__init__", cls.__module__, cls.__qualname__),
+        module=cls.__module__,
+    )
+    init.__qualname__ = "{}.__init__".format(cls.__qualname__)
+    init._datta_generated = True  # type: ignore
+    return init
+
+
+def _make_init_placeholder(cls):
+    # type: (Type[PrivateData]) -> Callable[..., None]
+    """
+    Make an `__init__` method that generates and installs the specialized one when first called.
+
+    Generation is deferred so that types declared as forward references can be resolved by then.
+
+    :param cls: Data class.
+    :return: Placeholder `__init__` method.
+    """
+
+    def __init__(self, *args, **kwargs):
+        init = cls.__dict__["__init__"]
+        if init is __init__:
+            init = _generate_init(cls)
+            type.__setattr__(cls, "__init__", init)
+        init(self, *args, **kwargs)
+
+    __init__.__qualname__ = "{}.__init__".format(cls.__qualname__)
+    __init__._datta_generated = True  # type: ignore
+    return __init__
+
+
+def _can_generate_serialize(cls):
+    # type: (Type[PrivateData]) -> bool
+    """
+    Get whether a specialized `_do_serialize` method can be generated for a data class.
+
+    :param cls: Data class.
+    :return: True if supported.
+    """
+
+    # Base private data class being defined.
+    if "PrivateData" not in globals():
+        return False
+
+    # Custom '_do_serialize' method.
+    for base in cls.__mro__:
+        if "_do_serialize" in base.__dict__:
+            do_serialize = base.__dict__["_do_serialize"]
+            if do_serialize is not PrivateData.__dict__["_do_serialize"] and not _is_generated(do_serialize):
+                return False
+            break
+
+    # Delegated attributes might compute their values.
+    for attribute in six.itervalues(cls.__attribute_map__):
+        if attribute.serializable and attribute.delegated:
+            return False
+
+    return True
+
+
+def _get_direct_type(relationship):
+    # type: (Any) -> Type[Any] | None
+    """
+    Get the data type whose instances can be serialized by calling their `serialize` method directly.
+
+    :param relationship: Relationship.
+    :return: Data type or None.
+    """
+    if type(relationship.serializer) is not TypedSerializer or relationship.subtypes:
+        return None
+    try:
+        complex_types = relationship.types_info.complex_types
+    except (ImportError, AttributeError, TypeError, ValueError):
+        return None
+    if len(complex_types) == 1 and isinstance(complex_types[0], type) and issubclass(complex_types[0], BasePrivateData):
+        return complex_types[0]
+    return None
+
+
+def _can_nest(cls):
+    # type: (Type[PrivateData]) -> bool
+    """
+    Get whether any serializable attribute of a data class might hold a value with a nested serialized output.
+
+    :param cls: Data class.
+    :return: True if values might nest.
+    """
+    try:
+        return _nesting_classes[cls]
+    except KeyError:
+        pass
+    can_nest = False
+    for attribute in six.itervalues(cls.__attribute_map__):
+        if not attribute.serializable or type(attribute.relationship.serializer) is not TypedSerializer:
+            continue
+        try:
+            types_info = attribute.relationship.types_info
+        except (ImportError, AttributeError, TypeError, ValueError):
+            can_nest = True
+            break
+        if not types_info.all_types or types_info.complex_types:
+            can_nest = True
+            break
+    _nesting_classes[cls] = can_nest
+    return can_nest
+
+
+def _get_direct_update_names(cls):
+    # type: (Type[PrivateData]) -> frozenset[str]
+    """
+    Get the names of the attributes of a data class that can be updated by writing their processed values directly \
+to a new object (settable, stored and without dependents, in a class without delegated attributes).
+
+    :param cls: Data class.
+    :return: Attribute names.
+    """
+    try:
+        return _direct_update_names[cls]
+    except KeyError:
+        pass
+    attribute_map = cls.__attribute_map__
+    if any(a.delegated for a in six.itervalues(attribute_map)):
+        names = frozenset()  # type: frozenset[str]
+    else:
+        names = frozenset(
+            n for n in cls.__pickle_names__ if attribute_map[n].settable and not attribute_map[n].dependents
+        )
+    _direct_update_names[cls] = names
+    return names
+
+
+def _generate_serialize(cls):
+    # type: (Type[PrivateData]) -> Callable[[PrivateData], dict[str, Any]]
+    """
+    Generate a `_do_serialize` method specialized for a data class.
+
+    Serialized names and default checks are resolved once, values are read directly from the slots, and values of \
+basic types and of a single nested data type skip the relationship's serializer.
+
+    :param cls: Data class.
+    :return: Generated `_do_serialize` method.
+    """
+    globs = {
+        "_datta_cls": cls,
+        "_datta_type": type,
+        "_datta_MISSING": MISSING,
+        "_datta_BASIC_TYPES": frozenset(BASIC_TYPES),
+        "_datta_generic_serialize": Structure.__dict__["serialize"],
+    }  # type: dict[str, Any]
+
+    lines = [
+        "def _do_serialize(self):",
+        "    if _datta_type(self) is not _datta_cls:",
+        "        return _datta_generic_serialize(self)",
+        "    _datta_serialized = {}",
+    ]
+
+    for i, (name, attribute) in enumerate(cls.__attribute_map__.ordered_items()):
+        if not attribute.serializable:
+            continue
+
+        # Serialized name.
+        if isinstance(attribute.serialize_as, cls.__attribute_type__):
+            serialized_name = attribute.serialize_as.name
+        elif isinstance(attribute.serialize_as, six.string_types):
+            serialized_name = attribute.serialize_as
+        else:
+            serialized_name = name
+        target = "_datta_serialized[{!r}]".format(serialized_name)
+
+        # Read value (constants are the same for every instance).
+        if attribute.constant:
+            globs["_datta_constant_{}".format(i)] = attribute.default
+            lines.append("    _datta_value = _datta_constant_{}".format(i))
+            indent = "    "
+        else:
+            owner = attribute.owner
+            assert owner is not None
+            globs["_datta_get_{}".format(i)] = owner.__dict__[mangling.mangle(name, owner.__name__)].__get__
+            lines.append("    try:")
+            lines.append("        _datta_value = _datta_get_{}(self)".format(i))
+            lines.append("    except AttributeError:")
+            lines.append("        pass")
+            lines.append("    else:")
+            indent = "        "
+
+        # Skip default value.
+        if not attribute.serialize_default and attribute.default is not MISSING:
+            globs["_datta_default_{}".format(i)] = attribute.default
+            lines.append("{}if not (_datta_value == _datta_default_{}):".format(indent, i))
+            indent += "    "
+
+        # Specialized branches for basic and nested data types.
+        relationship = attribute.relationship
+        branch = "if"
+        if type(relationship.serializer) is TypedSerializer:
+            lines.append("{}if _datta_type(_datta_value) in _datta_BASIC_TYPES:".format(indent))
+            lines.append("{}    {} = _datta_value".format(indent, target))
+            branch = "elif"
+        direct_type = _get_direct_type(relationship)
+        if direct_type is not None:
+            globs["_datta_direct_type_{}".format(i)] = direct_type
+            lines.append("{}{} _datta_type(_datta_value) is _datta_direct_type_{}:".format(indent, branch, i))
+            lines.append("{}    {} = _datta_value.serialize()".format(indent, target))
+            branch = "elif"
+
+        # Generic serialization through the relationship.
+        if branch == "elif":
+            lines.append("{}else:".format(indent))
+            indent += "    "
+        globs["_datta_serialize_{}".format(i)] = relationship.serialize_value
+        lines.append("{}_datta_value = _datta_serialize_{}(_datta_value)".format(indent, i))
+        lines.append("{}if _datta_value is not _datta_MISSING:".format(indent))
+        lines.append("{}    {} = _datta_value".format(indent, target))
+
+    lines.append("    return _datta_serialized")
+
+    script = "\n".join(lines) + "\n"
+    do_serialize = dynamic_code.make_function(
+        "_do_serialize",
+        script,
+        globs=globs,
+        filename=dynamic_code.generate_unique_filename("_do_serialize", cls.__module__, cls.__qualname__),
+        module=cls.__module__,
+    )
+    do_serialize.__qualname__ = "{}._do_serialize".format(cls.__qualname__)
+    do_serialize._datta_generated = True  # type: ignore
+    return do_serialize
+
+
+def _make_serialize_placeholder(cls):
+    # type: (Type[PrivateData]) -> Callable[[PrivateData], dict[str, Any]]
+    """
+    Make a `_do_serialize` method that generates and installs the specialized one when first called.
+
+    :param cls: Data class.
+    :return: Placeholder `_do_serialize` method.
+    """
+
+    def _do_serialize(self):
+        do_serialize = cls.__dict__["_do_serialize"]
+        if do_serialize is _do_serialize:
+            do_serialize = _generate_serialize(cls)
+            type.__setattr__(cls, "_do_serialize", do_serialize)
+        return do_serialize(self)
+
+    _do_serialize.__qualname__ = "{}._do_serialize".format(cls.__qualname__)
+    _do_serialize._datta_generated = True  # type: ignore
+    return _do_serialize
+
+
+def _intern_key(self):
+    # type: (PrivateData) -> tuple[Any, ...] | None
+    """
+    Get a key for interning a data object, with the type of each value (equal values of different types, like `1` \
+and `True`, are not interchangeable) and the sign of floats (neither are `0.0` and `-0.0`).
+    Data objects with values other than basic types or data objects have no key, since the equality of those doesn't \
+imply the equality of the types of their contents (`(1,) == (True,)`).
+
+    :param self: Data object.
+    :return: Intern key or None.
+    """
+    cls = type(self)
+    key = []  # type: list[tuple[Any, ...]]
+    for name in cls.__attribute_map__:
+        if name not in cls.__lazy_attributes__:
+            value = getattr(self, name, MISSING)  # type: Any
+            value_type = type(value)
+            if value_type is float:
+                key.append((value_type, value, math.copysign(1.0, value)))  # 0.0 == -0.0
+            elif value_type in _INTERN_TYPES:
+                key.append((value_type, value))
+            elif isinstance(value, PrivateData):
+                value_key = _intern_key(value)
+                if value_key is None:
+                    return None
+                key.append((value_type, value_key))
+            else:
+                return None
+    return tuple(key)
+
+
+def _intern(self):
+    # type: (PD) -> PD
+    """
+    Get the interned instance equal to a data object, interning it if there's none.
+    Data objects with values other than basic types or data objects are not interned.
+
+    :param self: Data object.
+    :return: Interned data object.
+    """
+    key = _intern_key(self)
+    if key is None:
+        return self
+    intern_table = type(self).__intern_table__
+    assert intern_table is not None
+    return cast("PD", intern_table.setdefault(key, self))
+
+
+def _reconstruct_data(cls, values):
+    # type: (Type[PD], tuple[Any, ...]) -> PD
+    """
+    Reconstruct a pickled data object from its positional attribute values, without revalidating them.
+
+    :param cls: Data class.
+    :param values: Attribute values (in pickling order).
+    :return: Data object.
+    """
+    return cls._do_deserialize(
+        mapping_proxy.MappingProxyType(dict((n, v) for n, v in zip(cls.__pickle_names__, values) if v is not MISSING))
+    )
+
+
+def _process_column(attribute, values):
+    # type: (Any, Iterable[Any]) -> list[Any]
+    """
+    Process a column of attribute values.
+    Values are type checked in a single pass when the attribute relationship has exact types (or based on the dtype \
+for NumPy arrays), and processed one by one otherwise.
+
+    :param attribute: Attribute.
+    :param values: Values (iterable or NumPy array).
+    :return: Processed values.
+    :raises ProcessingError: Error while processing values.
+    """
+    relationship = attribute.relationship
+    if hasattr(values, "dtype") and hasattr(values, "tolist"):
+        dtype = values.dtype  # type: ignore
+        values = values.tolist()  # type: ignore
+        if matches_dtype(relationship, dtype):
+            return cast("list[Any]", values)
+    values = list(values)
+
+    # Single pass type check.
+    exact_types = relationship.exact_types if isinstance(relationship, Relationship) else ()
+    if exact_types:
+        if relationship.subtypes:
+            if all(isinstance(v, exact_types) for v in values):
+                return values
+        elif set(map(type, values)).issubset(exact_types):
+            return values
+
+    process_value = attribute.process_value
+    name = attribute.name
+    try:
+        return [process_value(v, name) for v in values]
+    except ProcessingError as e:
+        exc = type(e)(e)
+        six.raise_from(exc, None)
+        raise exc
+
+
+def _lazy_changed(attribute, inserts, deletes, updates_new, updates_old):
+    # type: (Attribute, Mapping[str, Any], Mapping[str, Any], Mapping[str, Any], Mapping[str, Any]) -> bool
+    """
+    Get whether any of the (recursive) dependencies of a lazy attribute actually changed in an update.
+    Dependencies set to an equal value of the same type don't count as changes.
+
+    :param attribute: Lazy attribute.
+    :param inserts: Keys and values being inserted.
+    :param deletes: Keys and values being deleted.
+    :param updates_new: Keys and values being updated (new values).
+    :param updates_old: Keys and values being updated (old values).
+    :return: True if changed.
+    """
+    for dependency in attribute.recursive_dependencies:
+        name = cast(str, dependency.name)
+        if name in inserts or name in deletes:
+            return True
+        if name in updates_new:
+            old_value, new_value = updates_old[name], updates_new[name]
+            if old_value is new_value:
+                continue
+            if type(old_value) is not type(new_value) or old_value != new_value:
+                return True
+    return False
+
+
+def _get_list_type(cls):
+    # type: (Type[PD]) -> Type[ListData[PD]]
+    """
+    Get a list data class for a data class (created once per data class).
+
+    :param cls: Data class.
+    :return: List data class.
+    """
+    try:
+        return _list_types[cls]
+    except KeyError:
+        pass
+    from ._helpers import list_cls
+
+    list_type = cast(
+        "Type[ListData[PD]]",
+        list_cls(
+            types=cls,
+            extra_paths=(cls.__module__,),
+            list_type=ListData,
+            cls_module=cls.__module__,
+            relationship_type=Relationship,
+        ),
+    )
+    _list_types[cls] = list_type
+    return list_type
+
+
 class DataMeta(StructureMeta, BaseDataMeta):
     """Metaclass for :class:`PrivateData`."""
 
+    @staticmethod
+    def __new__(mcs, name, bases, dct, **kwargs):  # noqa
+        # type: (...) -> DataMeta
+
+        # Interning requires a metaclass that can return existing instances.
+        if dct.get("__kwargs__", {}).get("intern", kwargs.get("intern")) and not issubclass(mcs, InternDataMeta):
+            mcs = InternDataMeta
+
+        cls = cast("Type[PrivateData]", super(DataMeta, mcs).__new__(mcs, name, bases, dct, **kwargs))
+
+        # Map lazy attributes by name.
+        lazy_attributes = dict(
+            (n, a) for n, a in cls.__attribute_map__.ordered_items() if getattr(a, "lazy", False)
+        )  # type: dict[str, Any]
+        type.__setattr__(cls, "__lazy_attributes__", lazy_attributes)
+
+        # Names of the attribute values stored in instances, in pickling order.
+        pickle_names = tuple(
+            n for n, a in cls.__attribute_map__.ordered_items() if not a.constant and n not in lazy_attributes
+        )
+        type.__setattr__(cls, "__pickle_names__", pickle_names)
+
+        # Install generated '__init__' method (or restore the generic one).
+        if "__init__" not in dct:
+            if _can_generate_init(cls):
+                type.__setattr__(cls, "__init__", _make_init_placeholder(cls))
+            elif _is_generated(getattr(cls, "__init__")):
+                type.__setattr__(cls, "__init__", Structure.__dict__["__init__"])
+
+        # Install generated '_do_serialize' method (or restore the generic one).
+        if "_do_serialize" not in dct:
+            if _can_generate_serialize(cls):
+                type.__setattr__(cls, "_do_serialize", _make_serialize_placeholder(cls))
+            elif _is_generated(getattr(cls, "_do_serialize")):
+                type.__setattr__(cls, "_do_serialize", PrivateData.__dict__["_do_serialize"])
+
+        return cast(DataMeta, cls)
+
     @staticmethod
     def __edit_dct__(this_attribute_map, attribute_map, name, bases, dct, **kwargs):  # noqa
         """
@@ -39,12 +742,40 @@ class DataMeta(StructureMeta, BaseDataMeta):
         return dct
 
 
+class InternDataMeta(DataMeta):
+    """Metaclass for :class:`PrivateData` classes that intern their instances."""
+
+    def __call__(cls, *args, **kwargs):
+        self = super(InternDataMeta, cls).__call__(*args, **kwargs)
+        if cls.__intern__:
+            return _intern(self)
+        return self
+
+
 class PrivateData(six.with_metaclass(DataMeta, BasePrivateData, ImmutableStructure)):
     """Private data."""
 
     __slots__ = ()
 
     __attribute_type__ = Attribute
+    __lazy_attributes__ = {}  # type: dict[str, Attribute]
+    __pickle_names__ = ()  # type: tuple[str, ...]
+    __intern__ = False  # type: bool
+    __intern_table__ = None  # type: weakref.WeakValueDictionary[tuple[Any, ...], PrivateData] | None
+
+    def __init_subclass__(cls, intern=None, **kwargs):
+        # type: (bool | None, **Any) -> None
+        """
+        Initialize subclass with parameters.
+
+        :param intern: Whether to intern instances, so that equal data objects are the same object (only those with \
+basic type or data object values).
+        """
+        if intern is not None:
+            cls.__intern__ = bool(intern)
+        if cls.__intern__:
+            cls.__intern_table__ = weakref.WeakValueDictionary()
+        super(PrivateData, cls).__init_subclass__(**kwargs)  # noqa
 
     def __copy__(self):
         # type: (PD) -> PD
@@ -55,29 +786,148 @@ class PrivateData(six.with_metaclass(DataMeta, BasePrivateData, ImmutableStructu
         """
         cls = type(self)
         new_self = cls.__new__(cls)
-        obj_state.update_state(new_self, obj_state.get_state(self))
+        state = obj_state.get_state(self)
+        state.pop("_BasePrivateData__hash", None)
+        state.pop("_BasePrivateData__serialized", None)
+        obj_state.update_state(new_self, state)
         return new_self
 
+    def __reduce__(self):
+        # type: () -> tuple[Any, ...]
+        """
+        Reduce for pickling as a positional tuple of attribute values.
+        Cached hash, cached serialized output and lazy values are not pickled.
+
+        :return: Reconstructor and its arguments.
+        """
+        cls = type(self)
+        return _reconstruct_data, (cls, tuple(getattr(self, n, MISSING) for n in cls.__pickle_names__))
+
+    def _do_hash(self):
+        # type: () -> int
+        """
+        Compute hash (internal).
+
+        :return: Hash.
+        """
+        return ImmutableStructure._hash(self)
+
+    def _do_serialize(self):
+        # type: () -> dict[str, Any]
+        """
+        Serialize (internal).
+
+        :return: Serialized dictionary.
+        :raises SerializationError: Error while serializing.
+        """
+        return ImmutableStructure.serialize(self)
+
+    def _serialize_whole(self):
+        # type: () -> Any
+        """
+        Serialize at once when streaming is not worth it (internal).
+        That's the case for data classes whose attributes can't hold values with nested serialized output.
+
+        :return: Serialized dictionary or MISSING (should be streamed).
+        :raises SerializationError: Error while serializing.
+        """
+        if _can_nest(type(self)):
+            return MISSING
+        return self._do_serialize()
+
+    def _iter_serialize(self):
+        # type: () -> Iterator[str]
+        """
+        Iterate over the JSON text parts of the serialized output (internal).
+
+        :return: JSON text parts.
+        :raises SerializationError: Error while serializing.
+        """
+        cls = type(self)
+        separator = "{"
+        for name, value in self:
+            attribute = cls.__attribute_map__[name]
+            if not attribute.serializable:
+                continue
+            if not attribute.serialize_default and value == attribute.default:
+                continue
+            parts = iter_serialize_value(attribute.relationship, value)
+            if not parts:
+                continue
+            if isinstance(attribute.serialize_as, cls.__attribute_type__):
+                serialized_name = attribute.serialize_as.name
+            elif isinstance(attribute.serialize_as, six.string_types):
+                serialized_name = attribute.serialize_as
+            else:
+                serialized_name = name
+            yield separator
+            yield encode_json_key(serialized_name)
+            yield ": "
+            for part in parts:
+                yield part
+            separator = ", "
+        yield "{}" if separator == "{" else "}"
+
+    def __getattr__(self, name):
+        # type: (str) -> Any
+        """
+        Compute the value of a lazy attribute on first access and store it.
+
+        :param name: Attribute name.
+        :return: Attribute value.
+        :raises AttributeError: Not a lazy attribute.
+        """
+        cls = type(self)
+        attribute = cls.__lazy_attributes__.get(name)
+        if attribute is None or attribute.lazy_fget is None:
+            error = "{!r} object has no attribute {!r}".format(cls.__name__, name)
+            raise AttributeError(error)
+        value = attribute.process_value(attribute.lazy_fget(self), name)
+        object.__setattr__(self, name, value)
+        return value
+
     def __getitem__(self, name):
         # type: (str) -> Any
         """
         Get value for attribute.
+        Lazy attributes only have a value after being accessed as an attribute.
 
         :param name: Attribute name.
         :return: Attribute value.
-        :raises KeyError: Attribute does not exist or has no value.
+        :raises KeyError: Attribute has no value (updates rely on it to tell unset attributes apart).
+        :raises AttributeError: Not an attribute.
         """
-        return getattr(self, name)
+        cls = type(self)
+        try:
+            if name in cls.__lazy_attributes__:
+                return object.__getattribute__(self, name)
+            return getattr(self, name)
+        except AttributeError:
+            if name not in cls.__attribute_map__:
+                raise
+            exc = KeyError(name)
+            six.raise_from(exc, None)
+            raise exc
 
     def __contains__(self, name):
         # type: (object) -> bool
         """
         Get whether there's a value for attribute.
+        Lazy attributes only have a value after being accessed as an attribute.
 
         :param name: Attribute name.
         :return: True if has value.
         """
-        return isinstance(name, six.string_types) and name in type(self).__attribute_map__ and hasattr(self, name)
+        if not isinstance(name, six.string_types):
+            return False
+        cls = type(self)
+        if name in cls.__lazy_attributes__:
+            try:
+                object.__getattribute__(self, name)
+            except AttributeError:
+                return False
+            return True
+        return name in cls.__attribute_map__ and hasattr(self, name)
 
     def __setattr__(self, name, value):
         # type: (str, Any) -> None
@@ -126,8 +976,170 @@ class PrivateData(six.with_metaclass(DataMeta, BasePrivateData, ImmutableStructu
         """
         self = cls.__new__(cls)
         self._do_init(values)
+        if cls.__intern__:
+            return _intern(self)
         return self
 
+    @classmethod
+    def deserialize(cls, serialized, trusted=False):
+        # type: (Type[PD], Mapping[str, Any], bool) -> PD
+        """
+        Deserialize.
+
+        :param serialized: Serialized dictionary.
+        :param trusted: Whether the serialized dictionary comes from a trusted source, such as data serialized by \
+this same class. If so, values are only structurally decoded (no conversion, type checking or validation).
+        :return: Data.
+        :raises SerializationError: Error while deserializing.
+        :raises RuntimeError: Missing values for required attributes.
+        """
+        if not trusted:
+            return super(PrivateData, cls).deserialize(serialized)
+
+        values = {}  # type: dict[str, Any]
+        delegated = False
+        for serialized_name, serialized_value in six.iteritems(serialized):
+            name = cls.__deserialization_map__[serialized_name]
+            attribute = cls.__attribute_map__[name]
+            if attribute.delegated and attribute.serializable and attribute.fset is None:
+                continue
+            values[name] = deserialize_trusted(attribute.relationship, serialized_value)
+
+        # Fill in default values for missing attributes (delegates require the full machinery).
+        for name, attribute in cls.__attribute_map__.ordered_items():
+            if attribute.delegated:
+                delegated = True
+                break
+            if name not in values and attribute.has_default and not attribute.constant:
+                values[name] = attribute.process_value(attribute.get_default_value(), name)
+        if delegated:
+            values = cls.__attribute_map__.get_initial_values(
+                (),
+                values,
+                init_property="serializable",
+                init_method="deserialize",
+            )
+        else:
+            missing = [
+                n for n, a in cls.__attribute_map__.ordered_items() if a.required and not a.constant and n not in values
+            ]
+            if missing:
+                error = "missing values for required attributes {}".format(", ".join(repr(n) for n in missing))
+                raise RuntimeError(error)
+
+        return cls._do_deserialize(mapping_proxy.MappingProxyType(values))
+
+    @classmethod
+    def _process_columns(cls, columns):
+        # type: (Type[PD], Mapping[str, Iterable[Any]]) -> tuple[dict[str, list[Any]], int]
+        """
+        Process columns of attribute values (internal).
+
+        :param columns: Attribute values by attribute name.
+        :return: Processed columns and their length.
+        :raises KeyError: Not the name of an attribute that can be initialized.
+        :raises ValueError: Columns have different lengths.
+        :raises ProcessingError: Error while processing values.
+        """
+        processed_columns = {}  # type: dict[str, list[Any]]
+        for name, values in six.iteritems(columns):
+            if name not in cls.__pickle_names__ or not cls.__attribute_map__[name].init:
+                raise KeyError(name)
+            processed_columns[name] = _process_column(cls.__attribute_map__[name], values)
+        lengths = set(len(c) for c in six.itervalues(processed_columns))
+        if len(lengths) > 1:
+            error = "columns have different lengths"
+            raise ValueError(error)
+        return processed_columns, lengths.pop() if lengths else 0
+
+    @classmethod
+    def _complete_columns(cls, columns, length):
+        # type: (Type[PD], Mapping[str, Sequence[Any]], int) -> list[Sequence[Any]]
+        """
+        Complete columns of processed attribute values with default values (internal).
+
+        :param columns: Processed attribute values by attribute name.
+        :param length: Number of objects.
+        :return: Columns in pickling order (MISSING for no value).
+        :raises RuntimeError: Missing values for required attributes.
+        """
+        attribute_map = cls.__attribute_map__
+        complete_columns = []  # type: list[Sequence[Any]]
+        missing = []  # type: list[str]
+        for name in cls.__pickle_names__:
+            attribute = attribute_map[name]
+            if name in columns:
+                complete_columns.append(columns[name])
+            elif attribute.has_default:
+                if attribute.factory is MISSING:
+                    complete_columns.append((attribute.process_value(attribute.default, name),) * length)
+                else:
+                    complete_columns.append(
+                        [attribute.process_value(attribute.get_default_value(), name) for _ in range(length)]
+                    )
+            elif attribute.required:
+                missing.append(name)
+            else:
+                complete_columns.append((MISSING,) * length)
+        if missing and length:
+            error = "missing values for required attributes {}".format(", ".join(repr(n) for n in missing))
+            raise RuntimeError(error)
+        return complete_columns
+
+    @classmethod
+    def _make_instances(cls, columns, length):
+        # type: (Type[PD], Mapping[str, Sequence[Any]], int) -> list[PD]
+        """
+        Make data objects from columns of processed attribute values, without initializing them one by one (internal).
+        Values are written directly to the slots, one column at a time. Missing columns are filled with default \
+values. Classes with delegated attributes are initialized normally.
+
+        :param columns: Processed attribute values by attribute name (MISSING for no value).
+        :param length: Number of objects.
+        :return: Data objects.
+        :raises RuntimeError: Missing values for required attributes.
+        """
+        attribute_map = cls.__attribute_map__
+        if any(a.delegated for a in six.itervalues(attribute_map)):
+            init_names = dict((a, i) for i, a in six.iteritems(cls.__initialization_map__))
+            names = [init_names[n] for n in columns]
+            return [cls(**dict(zip(names, v))) for v in zip(*six.itervalues(columns))]
+
+        complete_columns = cls._complete_columns(columns, length)
+        new = cls.__new__
+        instances = [new(cls) for _ in range(length)]
+        for name, column in zip(cls.__pickle_names__, complete_columns):
+            owner = attribute_map[name].owner
+            assert owner is not None
+            set_value = owner.__dict__[mangling.mangle(name, owner.__name__)].__set__
+            for instance, value in zip(instances, column):
+                if value is not MISSING:
+                    set_value(instance, value)
+
+        if cls.__intern__:
+            return [_intern(i) for i in instances]
+        return instances
+
+    @classmethod
+    def from_columns(cls, **columns):
+        # type: (Type[PD], **Iterable[Any]) -> ListData[PD]
+        """
+        Make data objects from columns of attribute values, such as `Point.from_columns(x=[1, 2], y=[3, 4])`.
+        Each column is processed by its attribute: type checked in a single pass when the attribute has no \
+converter or validator (based on the dtype for NumPy arrays), or value by value otherwise. Objects are then \
+allocated without going through initialization; missing columns are filled with default values.
+
+        :param columns: Attribute values by attribute name (attributes that can be initialized).
+        :return: List data.
+        :raises KeyError: Not the name of an attribute that can be initialized.
+        :raises ValueError: Columns have different lengths.
+        :raises RuntimeError: Missing values for required attributes.
+        :raises ProcessingError: Error while processing values.
+        """
+        processed_columns, length = cls._process_columns(columns)
+        list_type = _get_list_type(cls)
+        return list_type._do_deserialize(tuple(cls._make_instances(processed_columns, length)))
+
 
 PD = TypeVar("PD", bound=PrivateData)  # private data self type
 
@@ -159,10 +1171,117 @@ class Data(PrivateData, BaseData, UserImmutableStructure):
         :return: Transformed (immutable) or self (mutable).
         """
         new_self = copy.copy(self)
-        new_self._do_init(updates_and_inserts)
-        for name, _ in six.iteritems(deletes):
-            object.__delattr__(self, name)
+        new_self._do_init(
+            mapping_proxy.MappingProxyType(
+                dict((n, v) for n, v in six.iteritems(updates_and_inserts) if v is not DELETED)
+            )
+        )
+        lazy_attributes = type(self).__lazy_attributes__
+        for name, value in six.iteritems(all_updates):
+            if value is DELETED:
+                if name in lazy_attributes and not _lazy_changed(
+                    lazy_attributes[name], inserts, deletes, updates_new, updates_old
+                ):
+                    continue
+                object.__delattr__(new_self, name)
+        for name in deletes:
+            object.__delattr__(new_self, name)
+        if type(new_self).__intern__:
+            return _intern(new_self)
         return new_self
 
+    def _do_evolve(self, updates, process=True):
+        # type: (D, Mapping[str, Any], bool) -> D
+        """
+        Update attribute values accumulated by an evolver (internal).
+        When possible, values are processed and written to a new object directly instead of going through the \
+generic update machinery.
+
+        :param updates: Attribute values by name (DELETED to delete).
+        :param process: Whether to process the values (disable if they are known to be valid).
+        :return: Transformed.
+        """
+        cls = type(self)
+        if not _get_direct_update_names(cls).issuperset(updates) or any(v is DELETED for v in six.itervalues(updates)):
+            return self.update(updates)
+        attribute_map = cls.__attribute_map__
+        values = {}  # type: dict[str, Any]
+        for name in cls.__pickle_names__:
+            if name in updates:
+                values[name] = attribute_map[name].process_value(updates[name], name) if process else updates[name]
+            else:
+                value = getattr(self, name, MISSING)
+                if value is not MISSING:
+                    values[name] = value
+
+        # Attributes updated directly have no dependents, so computed lazy values are still valid.
+        for name in cls.__lazy_attributes__:
+            try:
+                values[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        return cls._do_deserialize(mapping_proxy.MappingProxyType(values))
+
+    def set_in(self, path, value):
+        # type: (D, Iterable[Any], Any) -> D
+        """
+        Set the value at the end of a path of keys (attribute names, indices and dictionary keys).
+        Only the data objects, lists and dictionaries along the path are copied, and only the new value is processed.
+
+        :param path: Path.
+        :param value: Value.
+        :return: Transformed.
+        :raises ValueError: Empty path.
+        :raises TypeError: Path goes through something other than a data object, list or dictionary.
+        :raises KeyError: Attribute or key along the path not found.
+        :raises IndexError: Index out of range.
+        """
+        from ._paths import set_in
+
+        return set_in(self, path, value)
+
+    def update_in(self, path, func):
+        # type: (D, Iterable[Any], Callable[[Any], Any]) -> D
+        """
+        Update the value at the end of a path of keys (attribute names, indices and dictionary keys) with a function.
+        Only the data objects, lists and dictionaries along the path are copied, and only the new value is processed.
+
+        :param path: Path.
+        :param func: Function that gets the new value from the current one.
+        :return: Transformed.
+        :raises ValueError: Empty path.
+        :raises TypeError: Path goes through something other than a data object, list or dictionary.
+        :raises KeyError: Attribute or key not found.
+        :raises IndexError: Index out of range.
+        """
+        from ._paths import update_in
+
+        return update_in(self, path, func)
+
+    def apply_patch(self, patch):
+        # type: (D, Iterable[Any]) -> D
+        """
+        Apply changes (such as the ones in a patch obtained with :func:`datta.diff`), in order.
+        Every container along the changed paths is copied only once, no matter how many changes it receives.
+
+        :param patch: Changes (:class:`datta.patches.Change` objects).
+        :return: Transformed.
+        :raises TypeError: Change can't be applied to the container at its path.
+        :raises KeyError: Attribute or key not found.
+        :raises IndexError: Index out of range.
+        """
+        from ._patches import apply_patch
+
+        return apply_patch(self, patch)
+
+    def evolver(self):
+        # type: (D) -> DataEvolver[D]
+        """
+        Get an evolver, which accumulates changes and applies them all at once.
+
+        :return: Evolver.
+        """
+        return DataEvolver(self)
+
 
 D = TypeVar("D", bound=Data)  # data self type
@@ -1,13 +1,22 @@
 import copy
 
+import six
 from basicco import mapping_proxy
 from estruttura import ImmutableDictStructure, UserImmutableDictStructure
 from pyrsistent import pmap
 from pyrsistent.typing import PMap
-from tippo import Iterator, Type, TypeVar
+from tippo import Any, Callable, Iterable, Iterator, Mapping, Type, TypeVar
 
-from ._bases import DataCollection, PrivateDataCollection
+from ._bases import (
+    DataCollection,
+    PrivateDataCollection,
+    deserialize_trusted,
+    encode_json_key,
+    iter_serialize_value,
+    reconstruct_collection,
+)
 from ._constants import DeletedType
+from ._evolvers import DictDataEvolver
 from ._relationship import Relationship
 
 KT = TypeVar("KT")
@@ -21,6 +30,36 @@ class PrivateDictData(PrivateDataCollection[KT], ImmutableDictStructure[KT, VT])
 
     value_relationship = Relationship()  # type: Relationship[VT]
 
+    def __init__(self, *args, **kwargs):
+        # type: (*Any, **Any) -> None
+        """
+        Same parameters as :class:`dict`.
+        Initial values are not processed again if coming from a dictionary data of the same class or with identical \
+relationships.
+        """
+        if len(args) == 1 and not kwargs:
+            initial = args[0]
+            if type(initial) is type(self) or (
+                isinstance(initial, PrivateDictData)
+                and initial.relationship == self.relationship
+                and initial.value_relationship == self.value_relationship
+            ):
+                self._state = initial._state  # type: PMap[KT, VT]
+                return
+        super(PrivateDictData, self).__init__(*args, **kwargs)
+
+    def __copy__(self):
+        # type: (PDD) -> PDD
+        """
+        Make a shallow copy (the cached hash is not carried over).
+
+        :return: Shallow copy.
+        """
+        cls = type(self)
+        new_self = cls.__new__(cls)
+        new_self._state = self._state
+        return new_self
+
     def __iter__(self):
         # type: () -> Iterator[KT]
         """
@@ -50,10 +89,19 @@ class PrivateDictData(PrivateDataCollection[KT], ImmutableDictStructure[KT, VT])
         """
         return self._state[key]
 
-    def _hash(self):
+    def __reduce__(self):
+        # type: () -> tuple[Any, ...]
+        """
+        Reduce for pickling as a flat dictionary.
+
+        :return: Reconstructor and its arguments.
+        """
+        return reconstruct_collection, (type(self), dict(self._state))
+
+    def _do_hash(self):
         # type: () -> int
         """
-        Get hash.
+        Compute hash (internal).
 
         :return: Hash.
         """
@@ -79,7 +127,7 @@ class PrivateDictData(PrivateDataCollection[KT], ImmutableDictStructure[KT, VT])
 
         :param initial_values: Initial values.
         """
-        self._state = pmap(initial_values)  # type: PMap[KT, VT]
+        self._state = pmap(initial_values)
 
     @classmethod
     def _do_deserialize(cls, values):
@@ -95,6 +143,61 @@ class PrivateDictData(PrivateDataCollection[KT], ImmutableDictStructure[KT, VT])
         self._state = pmap(values)
         return self
 
+    def _do_serialize(self):
+        # type: () -> dict[KT, Any]
+        """
+        Serialize (internal).
+
+        :return: Serialized dictionary.
+        :raises SerializationError: Error while serializing.
+        """
+        serialize_key = type(self).relationship.serialize_value
+        serialize_value = type(self).value_relationship.serialize_value
+        return dict((serialize_key(k), serialize_value(v)) for k, v in six.iteritems(self._state))
+
+    def _iter_serialize(self):
+        # type: () -> Iterator[str]
+        """
+        Iterate over the JSON text parts of the serialized dictionary (internal).
+
+        :return: JSON text parts.
+        :raises SerializationError: Error while serializing.
+        """
+        cls = type(self)
+        serialize_key = cls.relationship.serialize_value
+        value_relationship = cls.value_relationship
+        separator = "{"
+        for key, value in six.iteritems(self._state):
+            yield separator
+            yield encode_json_key(serialize_key(key))
+            yield ": "
+            for part in iter_serialize_value(value_relationship, value):
+                yield part
+            separator = ", "
+        yield "{}" if separator == "{" else "}"
+
+    @classmethod
+    def deserialize(cls, serialized, trusted=False):
+        # type: (Type[PDD], Mapping[KT, Any], bool) -> PDD
+        """
+        Deserialize.
+
+        :param serialized: Serialized mapping.
+        :param trusted: Whether the serialized mapping comes from a trusted source, such as data serialized by \
+this same class. If so, values are only structurally decoded (no conversion, type checking or validation).
+        :return: Dictionary data.
+        :raises SerializationError: Error while deserializing.
+        """
+        if not trusted:
+            return super(PrivateDictData, cls).deserialize(serialized)
+        key_relationship = cls.relationship
+        value_relationship = cls.value_relationship
+        values = dict(
+            (deserialize_trusted(key_relationship, k), deserialize_trusted(value_relationship, v))
+            for k, v in six.iteritems(serialized)
+        )
+        return cls._do_deserialize(mapping_proxy.MappingProxyType(values))
+
 
 PDD = TypeVar("PDD", bound=PrivateDictData)  # private dictionary data self type
 
@@ -134,5 +237,66 @@ class DictData(PrivateDictData[KT, VT], DataCollection[KT], UserImmutableDictStr
         new_self._state = new_state
         return new_self
 
+    def set_in(self, path, value):
+        # type: (DD, Iterable[Any], Any) -> DD
+        """
+        Set the value at the end of a path of keys (attribute names, indices and dictionary keys).
+        Only the data objects, lists and dictionaries along the path are copied, and only the new value is processed.
+
+        :param path: Path.
+        :param value: Value.
+        :return: Transformed.
+        :raises ValueError: Empty path.
+        :raises TypeError: Path goes through something other than a data object, list or dictionary.
+        :raises KeyError: Attribute or key along the path not found.
+        :raises IndexError: Index out of range.
+        """
+        from ._paths import set_in
+
+        return set_in(self, path, value)
+
+    def update_in(self, path, func):
+        # type: (DD, Iterable[Any], Callable[[Any], Any]) -> DD
+        """
+        Update the value at the end of a path of keys (attribute names, indices and dictionary keys) with a function.
+        Only the data objects, lists and dictionaries along the path are copied, and only the new value is processed.
+
+        :param path: Path.
+        :param func: Function that gets the new value from the current one.
+        :return: Transformed.
+        :raises ValueError: Empty path.
+        :raises TypeError: Path goes through something other than a data object, list or dictionary.
+        :raises KeyError: Attribute or key not found.
+        :raises IndexError: Index out of range.
+        """
+        from ._paths import update_in
+
+        return update_in(self, path, func)
+
+    def apply_patch(self, patch):
+        # type: (DD, Iterable[Any]) -> DD
+        """
+        Apply changes (such as the ones in a patch obtained with :func:`datta.diff`), in order.
+        Every container along the changed paths is copied only once, no matter how many changes it receives.
+
+        :param patch: Changes (:class:`datta.patches.Change` objects).
+        :return: Transformed.
+        :raises TypeError: Change can't be applied to the container at its path.
+        :raises KeyError: Attribute or key not found.
+        :raises IndexError: Index out of range.
+        """
+        from ._patches import apply_patch
+
+        return apply_patch(self, patch)
+
+    def evolver(self):
+        # type: (DD) -> DictDataEvolver[DD]
+        """
+        Get an evolver, which processes values as they come and applies all changes at once.
+
+        :return: Evolver.
+        """
+        return DictDataEvolver(self)
+
 
 DD = TypeVar("DD", bound=DictData)  # dictionary data self type
@@ -0,0 +1,646 @@
+import copy
+
+import six
+from basicco import SlottedBase
+from pyrsistent import pvector
+from tippo import Any, Generic, Iterable, TypeVar
+
+from ._bases import BaseData, DataCollection
+from ._constants import DELETED
+from ._relationship import Relationship
+from .exceptions import ProcessingError
+
+__all__ = ["DataEvolver", "ListDataEvolver", "DictDataEvolver", "SetDataEvolver"]
+
+
+D = TypeVar("D", bound=BaseData)
+C = TypeVar("C", bound=DataCollection)
+
+
+def _process_value(relationship, value, location):
+    # type: (Relationship, Any, Any) -> Any
+    """
+    Process value through a relationship (if it will process it).
+
+    :param relationship: Relationship.
+    :param value: Value.
+    :param location: Value location information.
+    :return: Processed value.
+    :raises ProcessingError: Error while processing value.
+    """
+    if not relationship.will_process:
+        return value
+    try:
+        return relationship.process_value(value, location)
+    except ProcessingError as e:
+        exc = type(e)(e)
+        six.raise_from(exc, None)
+        raise exc
+
+
+def _freeze(data, state):
+    # type: (C, Any) -> C
+    """
+    Make a copy of a data collection with a new internal state.
+
+    :param data: Data collection.
+    :param state: New internal state.
+    :return: New data collection.
+    """
+    new_data = copy.copy(data)
+    new_data._state = state  # type: ignore
+    return new_data
+
+
+class DataEvolver(SlottedBase, Generic[D]):
+    """Accumulates changes to a data object and applies them all at once."""
+
+    __slots__ = ("__data", "__updates")
+
+    def __init__(self, data):
+        # type: (D) -> None
+        """
+        :param data: Data.
+        """
+        self.__data = data
+        self.__updates = {}  # type: dict[str, Any]
+
+    def __repr__(self):
+        # type: () -> str
+        """
+        Get representation.
+
+        :return: Representation.
+        """
+        return "<{} of {!r} ({} pending change(s))>".format(type(self).__name__, self.__data, len(self.__updates))
+
+    def __getitem__(self, name):
+        # type: (str) -> Any
+        """
+        Get current value for attribute (pending values are not processed yet).
+
+        :param name: Attribute name.
+        :return: Attribute value.
+        :raises KeyError: Attribute has no value.
+        """
+        try:
+            value = self.__updates[name]
+        except KeyError:
+            if name not in self.__data:  # type: ignore
+                raise KeyError(name)
+            return self.__data[name]  # type: ignore
+        if value is DELETED:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name):
+        # type: (object) -> bool
+        """
+        Get whether there's a value for attribute.
+
+        :param name: Attribute name.
+        :return: True if has value.
+        """
+        if name in self.__updates:
+            return self.__updates[name] is not DELETED
+        return name in self.__data  # type: ignore
+
+    def __setitem__(self, name, value):
+        # type: (str, Any) -> None
+        """
+        Set value for attribute.
+
+        :param name: Attribute name.
+        :param value: Value.
+        """
+        self.set(name, value)
+
+    def __delitem__(self, name):
+        # type: (str) -> None
+        """
+        Delete attribute value.
+
+        :param name: Attribute name.
+        """
+        self.delete(name)
+
+    def set(self, name, value):
+        # type: (DE, str, Any) -> DE
+        """
+        Set value for attribute.
+
+        :param name: Attribute name.
+        :param value: Value.
+        :return: Evolver.
+        """
+        self.__updates[name] = value
+        return self
+
+    def delete(self, name):
+        # type: (DE, str) -> DE
+        """
+        Delete attribute value.
+
+        :param name: Attribute name.
+        :return: Evolver.
+        :raises KeyError: Attribute has no value.
+        """
+        if name not in self:
+            raise KeyError(name)
+        if name in self.__data:  # type: ignore
+            self.__updates[name] = DELETED
+        else:
+            del self.__updates[name]
+        return self
+
+    def discard(self, name):
+        # type: (DE, str) -> DE
+        """
+        Discard attribute value (if it has one).
+
+        :param name: Attribute name.
+        :return: Evolver.
+        """
+        if name in self:
+            self.delete(name)
+        return self
+
+    def update(self, *args, **kwargs):
+        # type: (DE, *Any, **Any) -> DE
+        """
+        Update attribute values.
+        Same parameters as :meth:`dict.update`.
+
+        :return: Evolver.
+        """
+        for name, value in six.iteritems(dict(*args, **kwargs)):
+            if value is DELETED:
+                self.delete(name)
+            else:
+                self.set(name, value)
+        return self
+
+    def is_dirty(self):
+        # type: () -> bool
+        """
+        Get whether there are pending changes.
+
+        :return: True if there are pending changes.
+        """
+        return bool(self.__updates)
+
+    def persistent(self):
+        # type: () -> D
+        """
+        Process all pending changes at once and get the resulting data.
+        The evolver can continue to be used afterwards.
+
+        :return: Data.
+        """
+        if self.__updates:
+            self.__data = self.__data._do_evolve(self.__updates)  # type: ignore
+            self.__updates = {}
+        return self.__data
+
+
+DE = TypeVar("DE", bound=DataEvolver)  # data evolver self type
+
+
+class ListDataEvolver(SlottedBase, Generic[C]):
+    """Accumulates changes to a list data (processing values as they come) and applies them all at once."""
+
+    __slots__ = ("__data", "__evolver")
+
+    def __init__(self, data):
+        # type: (C) -> None
+        """
+        :param data: List data.
+        """
+        self.__data = data
+        self.__evolver = data._state.evolver()  # type: ignore
+
+    def __repr__(self):
+        # type: () -> str
+        """
+        Get representation.
+
+        :return: Representation.
+        """
+        return "<{} of {!r} ({})>".format(type(self).__name__, self.__data, "dirty" if self.is_dirty() else "clean")
+
+    def __len__(self):
+        # type: () -> int
+        """
+        Get value count.
+
+        :return: Value count.
+        """
+        return len(self.__evolver)
+
+    def __getitem__(self, index):
+        # type: (int) -> Any
+        """
+        Get value at index.
+
+        :param index: Index.
+        :return: Value.
+        """
+        return self.__evolver[index]
+
+    def __setitem__(self, index, value):
+        # type: (int, Any) -> None
+        """
+        Set value at index.
+
+        :param index: Index.
+        :param value: Value.
+        """
+        self.set(index, value)
+
+    def __delitem__(self, index):
+        # type: (int) -> None
+        """
+        Delete value at index.
+
+        :param index: Index.
+        """
+        self.delete(index)
+
+    def set(self, index, value):
+        # type: (LDE, int, Any) -> LDE
+        """
+        Set value at index.
+
+        :param index: Index.
+        :param value: Value.
+        :return: Evolver.
+        """
+        self.__evolver[index] = _process_value(self.__data.relationship, value, index)
+        return self
+
+    def delete(self, index):
+        # type: (LDE, int) -> LDE
+        """
+        Delete value at index.
+
+        :param index: Index.
+        :return: Evolver.
+        """
+        del self.__evolver[index]
+        return self
+
+    def append(self, value):
+        # type: (LDE, Any) -> LDE
+        """
+        Append value at the end.
+
+        :param value: Value.
+        :return: Evolver.
+        """
+        self.__evolver.append(_process_value(self.__data.relationship, value, len(self.__evolver)))
+        return self
+
+    def extend(self, iterable):
+        # type: (LDE, Iterable[Any]) -> LDE
+        """
+        Extend at the end with iterable.
+
+        :param iterable: Iterable.
+        :return: Evolver.
+        """
+        relationship = self.__data.relationship
+        if relationship.will_process:
+            start = len(self.__evolver)
+            values = [_process_value(relationship, v, start + i) for i, v in enumerate(iterable)]
+        else:
+            values = list(iterable)
+        self.__evolver.extend(values)
+        return self
+
+    def insert(self, index, *values):
+        # type: (LDE, int, *Any) -> LDE
+        """
+        Insert value(s) at index.
+
+        :param index: Index.
+        :param values: Value(s).
+        :return: Evolver.
+        """
+        if not values:
+            return self
+        length = len(self.__evolver)
+        if index < 0:
+            index = max(0, length + index)
+        if index >= length:
+            return self.extend(values)
+        relationship = self.__data.relationship
+        values = tuple(_process_value(relationship, v, index + i) for i, v in enumerate(values))
+        state = self.__evolver.persistent()
+        self.__evolver = (state[:index] + pvector(values) + state[index:]).evolver()
+        return self
+
+    def is_dirty(self):
+        # type: () -> bool
+        """
+        Get whether there are pending changes.
+
+        :return: True if there are pending changes.
+        """
+        return self.__evolver.is_dirty()
+
+    def persistent(self):
+        # type: () -> C
+        """
+        Get the resulting list data.
+        The evolver can continue to be used afterwards.
+
+        :return: List data.
+        """
+        state = self.__evolver.persistent()
+        if state is not self.__data._state:  # type: ignore
+            self.__data = _freeze(self.__data, state)
+        return self.__data
+
+
+LDE = TypeVar("LDE", bound=ListDataEvolver)  # list data evolver self type
+
+
+class DictDataEvolver(SlottedBase, Generic[C]):
+    """Accumulates changes to a dictionary data (processing keys/values as they come) and applies them all at once."""
+
+    __slots__ = ("__data", "__evolver")
+
+    def __init__(self, data):
+        # type: (C) -> None
+        """
+        :param data: Dictionary data.
+        """
+        self.__data = data
+        self.__evolver = data._state.evolver()  # type: ignore
+
+    def __repr__(self):
+        # type: () -> str
+        """
+        Get representation.
+
+        :return: Representation.
+        """
+        return "<{} of {!r} ({})>".format(type(self).__name__, self.__data, "dirty" if self.is_dirty() else "clean")
+
+    def __len__(self):
+        # type: () -> int
+        """
+        Get key count.
+
+        :return: Key count.
+        """
+        return len(self.__evolver)
+
+    def __contains__(self, key):
+        # type: (object) -> bool
+        """
+        Get whether contains key.
+
+        :param key: Key.
+        :return: True if contains.
+        """
+        return key in self.__evolver
+
+    def __getitem__(self, key):
+        # type: (Any) -> Any
+        """
+        Get value for key.
+
+        :param key: Key.
+        :return: Value.
+        :raises KeyError: Key is not present.
+        """
+        return self.__evolver[key]
+
+    def __setitem__(self, key, value):
+        # type: (Any, Any) -> None
+        """
+        Set value for key.
+
+        :param key: Key.
+        :param value: Value.
+        """
+        self.set(key, value)
+
+    def __delitem__(self, key):
+        # type: (Any) -> None
+        """
+        Delete key.
+
+        :param key: Key.
+        :raises KeyError: Key is not present.
+        """
+        self.delete(key)
+
+    def set(self, key, value):
+        # type: (DDE, Any, Any) -> DDE
+        """
+        Set value for key.
+
+        :param key: Key.
+        :param value: Value.
+        :return: Evolver.
+        """
+        key = _process_value(self.__data.relationship, key, "{!r} (key)".format(key))
+        self.__evolver[key] = _process_value(self.__data.value_relationship, value, key)  # type: ignore
+        return self
+
+    def delete(self, key):
+        # type: (DDE, Any) -> DDE
+        """
+        Delete key.
+
+        :param key: Key.
+        :return: Evolver.
+        :raises KeyError: Key is not present.
+        """
+        del self.__evolver[key]
+        return self
+
+    def discard(self, key):
+        # type: (DDE, Any) -> DDE
+        """
+        Discard key if it exists.
+
+        :param key: Key.
+        :return: Evolver.
+        """
+        if key in self.__evolver:
+            del self.__evolver[key]
+        return self
+
+    def update(self, *args, **kwargs):
+        # type: (DDE, *Any, **Any) -> DDE
+        """
+        Update keys and values.
+        Same parameters as :meth:`dict.update`.
+
+        :return: Evolver.
+        """
+        for key, value in six.iteritems(dict(*args, **kwargs)):
+            if value is DELETED:
+                self.delete(key)
+            else:
+                self.set(key, value)
+        return self
+
+    def is_dirty(self):
+        # type: () -> bool
+        """
+        Get whether there are pending changes.
+
+        :return: True if there are pending changes.
+        """
+        return self.__evolver.is_dirty()
+
+    def persistent(self):
+        # type: () -> C
+        """
+        Get the resulting dictionary data.
+        The evolver can continue to be used afterwards.
+
+        :return: Dictionary data.
+        """
+        state = self.__evolver.persistent()
+        if state is not self.__data._state:  # type: ignore
+            self.__data = _freeze(self.__data, state)
+        return self.__data
+
+
+DDE = TypeVar("DDE", bound=DictDataEvolver)  # dictionary data evolver self type
+
+
+class SetDataEvolver(SlottedBase, Generic[C]):
+    """Accumulates changes to a set data (processing values as they come) and applies them all at once."""
+
+    __slots__ = ("__data", "__evolver")
+
+    def __init__(self, data):
+        # type: (C) -> None
+        """
+        :param data: Set data.
+        """
+        self.__data = data
+        self.__evolver = data._state.evolver()  # type: ignore
+
+    def __repr__(self):
+        # type: () -> str
+        """
+        Get representation.
+
+        :return: Representation.
+        """
+        return "<{} of {!r} ({})>".format(type(self).__name__, self.__data, "dirty" if self.is_dirty() else "clean")
+
+    def __len__(self):
+        # type: () -> int
+        """
+        Get value count.
+
+        :return: Value count.
+        """
+        return len(self.__evolver)
+
+    def __contains__(self, value):
+        # type: (object) -> bool
+        """
+        Get whether contains value.
+
+        :param value: Value.
+        :return: True if contains.
+        """
+        return value in self.__snapshot()
+
+    def add(self, value):
+        # type: (SDE, Any) -> SDE
+        """
+        Add value.
+
+        :param value: Value.
+        :return: Evolver.
+        """
+        self.__evolver.add(_process_value(self.__data.relationship, value, value))
+        return self
+
+    def update(self, iterable):
+        # type: (SDE, Iterable[Any]) -> SDE
+        """
+        Add values from iterable.
+
+        :param iterable: Iterable.
+        :return: Evolver.
+        """
+        for value in iterable:
+            self.add(value)
+        return self
+
+    def remove(self, *values):
+        # type: (SDE, *Any) -> SDE
+        """
+        Remove existing value(s).
+
+        :param values: Value(s).
+        :return: Evolver.
+        :raises KeyError: Value is not present.
+        """
+        for value in values:
+            self.__evolver.remove(value)
+        return self
+
+    def discard(self, *values):
+        # type: (SDE, *Any) -> SDE
+        """
+        Discard value(s) if they exist.
+
+        :param values: Value(s).
+        :return: Evolver.
+        """
+        for value in values:
+            try:
+                self.__evolver.remove(value)
+            except KeyError:
+                pass
+        return self
+
+    def __snapshot(self):
+        # type: () -> Any
+        """
+        Get the current internal state.
+        The underlying evolver is replaced, since it can't be used after being made persistent.
+
+        :return: Internal state.
+        """
+        state = self.__evolver.persistent()
+        if self.__evolver.is_dirty() or state is not self.__data._state:  # type: ignore
+            self.__evolver = state.evolver()
+        return state
+
+    def is_dirty(self):
+        # type: () -> bool
+        """
+        Get whether there are pending changes.
+
+        :return: True if there are pending changes.
+        """
+        return self.__evolver.is_dirty() or self.__evolver.persistent() is not self.__data._state  # type: ignore
+
+    def persistent(self):
+        # type: () -> C
+        """
+        Get the resulting set data.
+        The evolver can continue to be used afterwards.
+
+        :return: Set data.
+        """
+        state = self.__snapshot()
+        if state is not self.__data._state:  # type: ignore
+            self.__data = _freeze(self.__data, state)
+        return self.__data
+
+
+SDE = TypeVar("SDE", bound=SetDataEvolver)  # set data evolver self type
@@ -1,21 +1,290 @@
+import functools
+import sys
+import weakref
+
 import estruttura
+import six
+from basicco import custom_repr, dynamic_class, fabricate_value, type_checking
 from basicco.namespace import Namespace
-from tippo import Any, Callable, Iterable, Mapping, Type, TypeVar, cast
+from six.moves import copyreg
+from tippo import Any, Callable, Hashable, Iterable, Mapping, Type, TypeVar, cast
 
 from ._attribute import Attribute
+from ._bases import BaseDataMeta
 from ._constants import MISSING, MissingType
+from ._data import PrivateData
 from ._dict import DictData
 from ._list import ListData
 from ._relationship import Relationship
 from ._set import SetData
+from ._table import TableData
 from .serializers import Serializer, TypedSerializer
 
 T = TypeVar("T")
 KT = TypeVar("KT")
 VT = TypeVar("VT")
+PD = TypeVar("PD", bound=PrivateData)
+
+
+def _caller_module():
+    # type: () -> str | None
+    """
+    Get the module of the caller of the function that calls this one.
+    Reads the name from the frame globals instead of inspecting the whole stack (which reads source files).
+
+    :return: Module name or None.
+    """
+    try:
+        return sys._getframe(2).f_globals.get("__name__")
+    except (AttributeError, ValueError):
+        return None
+
+
+def _auto_caller_module(
+    iterable_params=None,  # type: Iterable[str] | str | None
+    single_params=None,  # type: Iterable[str] | str | None
+):
+    # type: (...) -> Callable[[T], T]
+    """
+    Make a decorator for a function that takes iterable/single keyword arguments that contain module paths.
+    If no paths are provided, set the caller module as a path.
+    Same as :func:`estruttura.auto_caller_module`, without inspecting the whole stack.
+
+    :param iterable_params: Keyword arguments that are supposed to contain module paths.
+    :param single_params: Keyword argument that are supposed to contain a single module path or None.
+    :return: Decorator.
+    """
+    if isinstance(iterable_params, six.string_types):
+        iterable_params = (iterable_params,)
+    if isinstance(single_params, six.string_types):
+        single_params = (single_params,)
+    iterable_params_ = tuple(iterable_params or ())
+    single_params_ = tuple(single_params or ())
+
+    def decorator(func):
+        @functools.wraps(func)
+        def decorated(*args, **kwargs):
+            module = MISSING  # type: str | None | MissingType
+            for param in iterable_params_:
+                paths = tuple(kwargs.get(param, ()))
+                if not paths:
+                    if module is MISSING:
+                        module = _caller_module()
+                    paths = (module,)
+                kwargs[param] = paths
+            for param in single_params_:
+                if kwargs.get(param, None) is None:
+                    if module is MISSING:
+                        module = _caller_module()
+                    kwargs[param] = module
+            return func(*args, **kwargs)
+
+        return cast(T, decorated)
+
+    return decorator
+
+
+_collection_classes = weakref.WeakValueDictionary()  # type: weakref.WeakValueDictionary[Hashable, Type[Any]]
+_collection_recipes = (
+    weakref.WeakKeyDictionary()
+)  # type: weakref.WeakKeyDictionary[Type[Any], tuple[Callable[..., Type[Any]], dict[str, Any]]]
+
+
+def _relationship_key(
+    converter,  # type: Any
+    validator,  # type: Any
+    types,  # type: Any
+    subtypes,  # type: bool
+    serializer,  # type: Any
+    extra_paths,  # type: Iterable[str]
+    builtin_paths,  # type: Iterable[str] | None
+    relationship_type,  # type: Type[Relationship[Any]]
+    relationship_kwargs,  # type: Mapping[str, Any] | None
+):
+    # type: (...) -> tuple[Any, ...]
+    """
+    Get a key that is the same for equivalent relationship parameters.
+    Module paths are only part of it when something has to be imported from them.
+
+    :return: Relationship key.
+    """
+    types = type_checking.format_types(types)
+    if any(isinstance(p, six.string_types) for p in (converter, validator) + types):
+        paths = (tuple(extra_paths), None if builtin_paths is None else tuple(builtin_paths))  # type: Any
+    else:
+        paths = None
+    if type(serializer) is TypedSerializer:
+        serializer = TypedSerializer  # stateless
+    return (
+        relationship_type,
+        converter,
+        validator,
+        types,
+        bool(subtypes),
+        serializer,
+        paths,
+        frozenset(six.iteritems(relationship_kwargs or {})),
+    )
+
+
+def _cached_cls(key, factory, recipe, **kwargs):
+    # type: (Hashable | None, Callable[..., Type[Any]], Callable[..., Type[Any]], **Any) -> Type[Any]
+    """
+    Get a collection class from the cache, or build it and cache it.
+    Classes are built every time if there's no key or if it can't be hashed.
+    Cached classes remember how to get them again, so they can be pickled without being importable by name.
+
+    :param key: Cache key.
+    :param factory: Class factory.
+    :param recipe: Caching class factory that takes the same keyword arguments.
+    :param kwargs: Class factory keyword arguments.
+    :return: Collection class.
+    """
+    if key is not None:
+        try:
+            return _collection_classes[key]
+        except KeyError:
+            cls = _collection_classes[key] = factory(**kwargs)
+            _collection_recipes[cls] = (recipe, kwargs)
+            return cls
+        except TypeError:
+            pass
+    return factory(**kwargs)
+
+
+def _build_collection_cls(recipe, kwargs):
+    # type: (Callable[..., Type[Any]], Mapping[str, Any]) -> Type[Any]
+    """
+    Get a collection class (when unpickling).
+
+    :param recipe: Caching class factory.
+    :param kwargs: Class factory keyword arguments.
+    :return: Collection class.
+    """
+    return recipe(**kwargs)
+
+
+def _reduce_collection_cls(cls):
+    # type: (Type[Any]) -> str | tuple[Any, ...]
+    """
+    Pickle a collection class by name, or as a call to the factory that built it when it can't be imported by name \
+(classes shared by equivalent attributes are not named after any of them).
+
+    :param cls: Collection class.
+    :return: Qualified name or reduce tuple.
+    """
+    recipe = _collection_recipes.get(cls)
+    if recipe is not None:
+        obj = sys.modules.get(cls.__module__)  # type: Any
+        for name in cls.__qualname__.split("."):
+            obj = getattr(obj, name, None)
+        if obj is not cls:
+            return _build_collection_cls, recipe
+    return cls.__qualname__
+
+
+copyreg.pickle(BaseDataMeta, _reduce_collection_cls)
+
+
+def _collection_attribute(
+    cls,  # type: Type[Any]
+    converter,  # type: Callable[[Any], Any] | Type[Any] | str | None
+    key_converter,  # type: Callable[[Any], Any] | Type[Any] | str | None
+    constant,  # type: bool
+    repr,  # type: bool | Callable[[Any], str] | None
+    callback,  # type: Callable[[Any], None] | None
+    relationship_type,  # type: Type[Relationship[Any]]
+    relationship_kwargs,  # type: Mapping[str, Any] | None
+    **kwargs  # type: Any
+):
+    # type: (...) -> Any
+    """
+    Define an attribute whose values are instances of a collection class.
+    Mirrors what `dict_attribute`, `list_attribute` and `set_attribute` do in estruttura 2.0.0 (pinned in the \
+requirements) after building the class, except that cached classes shared by equivalent attributes are not renamed \
+after the attribute that owns them.
+
+    :param cls: Collection class.
+    :param converter: Callable value converter.
+    :param key_converter: Callable key converter (dictionaries only).
+    :param constant: Whether attribute is a class constant.
+    :param repr: Whether to include in the `__repr__` method.
+    :param callback: Callback that runs after attribute has been named/owned by class.
+    :param relationship_type: Relationship class.
+    :param relationship_kwargs: Relationship keyword arguments.
+    :param kwargs: Other attribute keyword arguments.
+    :return: Attribute.
+    """
+    mapping = issubclass(cls, DictData)
+    shared = cls in _collection_recipes
+    if not constant and repr is None:
+        if mapping:
+            repr = custom_repr.mapping_repr
+        elif issubclass(cls, SetData):
+            repr = lambda s: custom_repr.iterable_repr(s, prefix="{", suffix="}")
+        else:
+            repr = custom_repr.iterable_repr
+
+    def _callback(attr, _cls=cls, _cb=callback):
+        if not shared:
+            _cls.__qualname__ = "{}.attributes.{}.namespace.{}".format(
+                attr.owner.__qualname__, attr.name, _cls.__name__
+            )
+        if _cb is not None:
+            _cb(attr)
+
+    if mapping:
+
+        def _converter(value, _cls=cls, _conv=converter, _kconv=key_converter):
+            if isinstance(value, _cls):
+                return value
+            if _conv is not None or _kconv is not None:
+                value = dict(
+                    (fabricate_value.fabricate_value(_kconv, k), fabricate_value.fabricate_value(_conv, v))
+                    for k, v in six.iteritems(value)
+                )
+            return _cls(value)
+
+    else:
+
+        def _converter(value, _cls=cls, _conv=converter, _kconv=None):
+            if isinstance(value, _cls):
+                return value
+            if _conv is not None:
+                value = [fabricate_value.fabricate_value(_conv, v) for v in value]
+            return _cls(value)
+
+    return estruttura.attribute(
+        converter=_converter,
+        types=(cls,),
+        subtypes=False,
+        constant=constant,
+        repr=repr,  # type: ignore
+        namespace={cls.__name__: cls},
+        callback=_callback,
+        relationship_type=relationship_type,
+        relationship_kwargs=_collection_relationship_kwargs(cls, relationship_type, relationship_kwargs),
+        **kwargs
+    )
+
+
+def _collection_relationship_kwargs(cls, relationship_type, relationship_kwargs):
+    # type: (Type[Any], Type[Any], Mapping[str, Any] | None) -> Mapping[str, Any] | None
+    """
+    Get the keyword arguments for the relationship of a collection attribute, so that it accepts instances of its \
+collection class as they are (their values were processed when they were built).
+
+    :param cls: Collection class.
+    :param relationship_type: Relationship class.
+    :param relationship_kwargs: Relationship keyword arguments.
+    :return: Relationship keyword arguments.
+    """
+    if isinstance(relationship_type, type) and issubclass(relationship_type, Relationship):
+        return dict(relationship_kwargs or {}, trusted_types=(cls,))
+    return relationship_kwargs
 
 
-@estruttura.auto_caller_module("extra_paths", "cls_module")
+@_auto_caller_module("extra_paths", "cls_module")
 def dict_cls(
     converter=None,  # type: Callable[[Any], VT] | Type[VT] | str | None
     validator=None,  # type: Callable[[Any], None] | str | None
@@ -41,6 +310,7 @@ def dict_cls(
     # type: (...) -> Type[DictData[KT, VT]]
     """
     Build a dictionary structure class.
+    Calls with equivalent arguments return the same class, unless a class body is provided.
 
     :param converter: Callable value converter.
     :param validator: Callable value validator.
@@ -56,7 +326,7 @@ def dict_cls(
     :param builtin_paths: Builtin module paths in fallback order.
     :param qualified_name: Qualified name.
     :param dict_type: Base class.
-    :param cls_dct: Class body.
+    :param cls_dct: Class body (always builds a new class).
     :param cls_module: Class module.
     :param relationship_type: Value relationship class.
     :param relationship_kwargs: Value relationship keyword arguments.
@@ -64,9 +334,41 @@ def dict_cls(
     :param key_relationship_kwargs: Key relationship keyword arguments.
     :return: Dictionary structure class.
     """
+    key = None  # type: Hashable | None
+    if cls_dct is None:
+        key = (
+            dict_type,
+            qualified_name,
+            cls_module,
+            _relationship_key(
+                converter,
+                validator,
+                types,
+                subtypes,
+                serializer,
+                extra_paths,
+                builtin_paths,
+                relationship_type,
+                relationship_kwargs,
+            ),
+            _relationship_key(
+                key_converter,
+                key_validator,
+                key_types,
+                key_subtypes,
+                key_serializer,
+                extra_paths,
+                builtin_paths,
+                key_relationship_type,
+                key_relationship_kwargs,
+            ),
+        )
     return cast(
         Type[DictData[KT, VT]],
-        estruttura.dict_cls(
+        _cached_cls(
+            key,
+            estruttura.dict_cls,
+            dict_cls,
             converter=converter,
             validator=validator,
             types=types,
@@ -91,7 +393,7 @@ def dict_cls(
     )
 
 
-@estruttura.auto_caller_module("extra_paths", "cls_module")
+@_auto_caller_module("extra_paths", "cls_module")
 def list_cls(
     converter=None,  # type: Callable[[Any], T] | Type[T] | str | None
     validator=None,  # type: Callable[[Any], None] | str | None
@@ -110,6 +412,7 @@ def list_cls(
     # type: (...) -> Type[ListData[T]]
     """
     Build a list structure class.
+    Calls with equivalent arguments return the same class, unless a class body is provided.
 
     :param converter: Callable value converter.
     :param validator: Callable value validator.
@@ -120,15 +423,36 @@ def list_cls(
     :param builtin_paths: Builtin module paths in fallback order.
     :param qualified_name: Qualified name.
     :param list_type: Base class.
-    :param cls_dct: Class body.
+    :param cls_dct: Class body (always builds a new class).
     :param cls_module: Class module.
     :param relationship_type: Relationship class.
     :param relationship_kwargs: Relationship keyword arguments.
     :return: List structure class.
     """
+    key = None  # type: Hashable | None
+    if cls_dct is None:
+        key = (
+            list_type,
+            qualified_name,
+            cls_module,
+            _relationship_key(
+                converter,
+                validator,
+                types,
+                subtypes,
+                serializer,
+                extra_paths,
+                builtin_paths,
+                relationship_type,
+                relationship_kwargs,
+            ),
+        )
     return cast(
         Type[ListData[T]],
-        estruttura.list_cls(
+        _cached_cls(
+            key,
+            estruttura.list_cls,
+            list_cls,
             converter=converter,
             validator=validator,
             types=types,
@@ -146,7 +470,7 @@ def list_cls(
     )
 
 
-@estruttura.auto_caller_module("extra_paths", "cls_module")
+@_auto_caller_module("extra_paths", "cls_module")
 def set_cls(
     converter=None,  # type: Callable[[Any], T] | Type[T] | str | None
     validator=None,  # type: Callable[[Any], None] | str | None
@@ -165,6 +489,7 @@ def set_cls(
     # type: (...) -> Type[SetData[T]]
     """
     Build a set structure class.
+    Calls with equivalent arguments return the same class, unless a class body is provided.
 
     :param converter: Callable value converter.
     :param validator: Callable value validator.
@@ -175,15 +500,36 @@ def set_cls(
     :param builtin_paths: Builtin module paths in fallback order.
     :param qualified_name: Qualified name.
     :param set_type: Base class.
-    :param cls_dct: Class body.
+    :param cls_dct: Class body (always builds a new class).
     :param cls_module: Class module.
     :param relationship_type: Relationship class.
     :param relationship_kwargs: Relationship keyword arguments.
     :return: Set structure class.
     """
+    key = None  # type: Hashable | None
+    if cls_dct is None:
+        key = (
+            set_type,
+            qualified_name,
+            cls_module,
+            _relationship_key(
+                converter,
+                validator,
+                types,
+                subtypes,
+                serializer,
+                extra_paths,
+                builtin_paths,
+                relationship_type,
+                relationship_kwargs,
+            ),
+        )
     return cast(
         Type[SetData[T]],
-        estruttura.set_cls(
+        _cached_cls(
+            key,
+            estruttura.set_cls,
+            set_cls,
             converter=converter,
             validator=validator,
             types=types,
@@ -201,7 +547,49 @@ def set_cls(
     )
 
 
-@estruttura.auto_caller_module("extra_paths")
+@_auto_caller_module(single_params="cls_module")
+def table_cls(
+    row_type,  # type: Type[PD]
+    qualified_name=None,  # type: str | None
+    table_type=TableData,  # type: Type[TableData[PD]]
+    row_list_type=None,  # type: Type[ListData[PD]] | None
+    cls_dct=None,  # type: Mapping[str, Any] | None
+    cls_module=None,  # type: str | None
+):
+    # type: (...) -> Type[TableData[PD]]
+    """
+    Build a table structure class, which stores data objects of a class as columns of attribute values.
+
+    :param row_type: Data class.
+    :param qualified_name: Qualified name.
+    :param table_type: Base class.
+    :param row_list_type: List data class used for conversion (defaults to a new list class for the data class).
+    :param cls_dct: Class body.
+    :param cls_module: Class module.
+    :return: Table structure class.
+    """
+    if row_list_type is None:
+        row_list_type = list_cls(types=row_type, extra_paths=(cls_module,) if cls_module else (), cls_module=cls_module)
+
+    # Class body.
+    cls_dct = dict(cls_dct or {})
+    cls_dct["row_type"] = row_type
+    cls_dct["row_list_type"] = row_list_type
+    cls_dct["relationship"] = Relationship(types=row_type)
+
+    # Build class and return it.
+    return cast(
+        Type[TableData[PD]],
+        dynamic_class.make_cls(
+            qualified_name or table_type.__qualname__,
+            bases=(table_type,),
+            dct=cls_dct,
+            module=cls_module,
+        ),
+    )
+
+
+@_auto_caller_module("extra_paths")
 def attribute(
     default=MISSING,  # type: T | MissingType
     factory=MISSING,  # type: Callable[..., T] | str | MissingType
@@ -233,6 +621,7 @@ def attribute(
     attribute_kwargs=None,  # type: Mapping[str, Any] | None
     relationship_type=Relationship,  # type: Type[Relationship[T]]
     relationship_kwargs=None,  # type: Mapping[str, Any] | None
+    lazy=False,  # type: bool
 ):
     # type: (...) -> T
     """
@@ -268,6 +657,7 @@ def attribute(
     :param attribute_kwargs: Attribute keyword arguments.
     :param relationship_type: Relationship class.
     :param relationship_kwargs: Relationship keyword arguments.
+    :param lazy: Whether the getter delegate runs when the value is first accessed instead of on construction.
     :return: Attribute.
     """
     return cast(
@@ -300,14 +690,14 @@ def attribute(
             extra_paths=extra_paths,
             builtin_paths=builtin_paths,
             attribute_type=attribute_type,
-            attribute_kwargs=attribute_kwargs,
+            attribute_kwargs=dict(attribute_kwargs or {}, lazy=True) if lazy else attribute_kwargs,
             relationship_type=relationship_type,
             relationship_kwargs=relationship_kwargs,
         ),
     )
 
 
-@estruttura.auto_caller_module("extra_paths", "cls_module")
+@_auto_caller_module("extra_paths", "cls_module")
 def dict_attribute(
     default=MISSING,  # type: Mapping[KT, VT] | MissingType
     factory=MISSING,  # type: Callable[..., Mapping[KT, VT]] | str | MissingType
@@ -350,21 +740,43 @@ def dict_attribute(
     key_relationship_kwargs=None,  # type: Mapping[str, Any] | None
 ):
     # type: (...) -> DictData[KT, VT]
+    cls = dict_cls(
+        qualified_name=dict_type.__name__,
+        cls_module=cls_module,
+        cls_dct=cls_dct,
+        converter=converter,
+        validator=validator,
+        types=types,
+        subtypes=subtypes,
+        serializer=serializer,
+        key_converter=key_converter,
+        key_validator=key_validator,
+        key_types=key_types,
+        key_subtypes=key_subtypes,
+        key_serializer=key_serializer,
+        extra_paths=extra_paths,
+        builtin_paths=builtin_paths,
+        dict_type=dict_type,
+        relationship_type=relationship_type,
+        relationship_kwargs=relationship_kwargs,
+        key_relationship_type=key_relationship_type,
+        key_relationship_kwargs=key_relationship_kwargs,
+    )
     return cast(
         DictData[KT, VT],
-        estruttura.dict_attribute(
+        _collection_attribute(
+            cls,
+            converter,
+            key_converter,
+            constant,
+            repr,
+            callback,
+            relationship_type,
+            relationship_kwargs,
             default=default,
             factory=factory,
-            converter=converter,
             validator=validator,
-            types=types,
-            subtypes=subtypes,
             serializer=serializer,
-            key_converter=key_converter,
-            key_validator=key_validator,
-            key_types=key_types,
-            key_subtypes=key_subtypes,
-            key_serializer=key_serializer,
             required=required,
             init=init,
             init_as=init_as,
@@ -373,30 +785,20 @@ def dict_attribute(
             serializable=serializable,
             serialize_as=serialize_as,
             serialize_default=serialize_default,
-            constant=constant,
-            repr=repr,  # type: ignore
             eq=eq,
             order=order,
             hash=hash,
             doc=doc,
             metadata=metadata,
-            callback=callback,  # type: ignore
             extra_paths=extra_paths,
             builtin_paths=builtin_paths,
             attribute_type=attribute_type,
             attribute_kwargs=attribute_kwargs,
-            dict_type=dict_type,
-            cls_dct=cls_dct,
-            cls_module=cls_module,
-            relationship_type=relationship_type,
-            relationship_kwargs=relationship_kwargs,
-            key_relationship_type=key_relationship_type,
-            key_relationship_kwargs=key_relationship_kwargs,
         ),
     )
 
 
-@estruttura.auto_caller_module("extra_paths", "cls_module")
+@_auto_caller_module("extra_paths", "cls_module")
 def list_attribute(
     default=MISSING,  # type: Iterable[T] | MissingType
     factory=MISSING,  # type: Callable[..., Iterable[T]] | str | MissingType
@@ -432,15 +834,35 @@ def list_attribute(
     relationship_kwargs=None,  # type: Mapping[str, Any] | None
 ):
     # type: (...) -> ListData[T]
+    cls = list_cls(
+        qualified_name=list_type.__name__,
+        cls_module=cls_module,
+        cls_dct=cls_dct,
+        converter=converter,
+        validator=validator,
+        types=types,
+        subtypes=subtypes,
+        serializer=serializer,
+        extra_paths=extra_paths,
+        builtin_paths=builtin_paths,
+        list_type=list_type,
+        relationship_type=relationship_type,
+        relationship_kwargs=relationship_kwargs,
+    )
     return cast(
         ListData[T],
-        estruttura.list_attribute(
+        _collection_attribute(
+            cls,
+            converter,
+            None,
+            constant,
+            repr,
+            callback,
+            relationship_type,
+            relationship_kwargs,
             default=default,
             factory=factory,
-            converter=converter,
             validator=validator,
-            types=types,
-            subtypes=subtypes,
             serializer=serializer,
             required=required,
             init=init,
@@ -450,28 +872,20 @@ def list_attribute(
             serializable=serializable,
             serialize_as=serialize_as,
             serialize_default=serialize_default,
-            constant=constant,
-            repr=repr,  # type: ignore
             eq=eq,
             order=order,
             hash=hash,
             doc=doc,
             metadata=metadata,
-            callback=callback,  # type: ignore
             extra_paths=extra_paths,
             builtin_paths=builtin_paths,
             attribute_type=attribute_type,
             attribute_kwargs=attribute_kwargs,
-            list_type=list_type,
-            cls_dct=cls_dct,
-            cls_module=cls_module,
-            relationship_type=relationship_type,
-            relationship_kwargs=relationship_kwargs,
         ),
     )
 
 
-@estruttura.auto_caller_module("extra_paths", "cls_module")
+@_auto_caller_module("extra_paths", "cls_module")
 def set_attribute(
     default=MISSING,  # type: Iterable[T] | MissingType
     factory=MISSING,  # type: Callable[..., Iterable[T]] | str | MissingType
@@ -507,15 +921,35 @@ def set_attribute(
     relationship_kwargs=None,  # type: Mapping[str, Any] | None
 ):
     # type: (...) -> SetData[T]
+    cls = set_cls(
+        qualified_name=set_type.__name__,
+        cls_module=cls_module,
+        cls_dct=cls_dct,
+        converter=converter,
+        validator=validator,
+        types=types,
+        subtypes=subtypes,
+        serializer=serializer,
+        extra_paths=extra_paths,
+        builtin_paths=builtin_paths,
+        set_type=set_type,
+        relationship_type=relationship_type,
+        relationship_kwargs=relationship_kwargs,
+    )
     return cast(
         SetData[T],
-        estruttura.set_attribute(
+        _collection_attribute(
+            cls,
+            converter,
+            None,
+            constant,
+            repr,
+            callback,
+            relationship_type,
+            relationship_kwargs,
             default=default,
             factory=factory,
-            converter=converter,
             validator=validator,
-            types=types,
-            subtypes=subtypes,
             serializer=serializer,
             required=required,
             init=init,
@@ -525,22 +959,14 @@ def set_attribute(
             serializable=serializable,
             serialize_as=serialize_as,
             serialize_default=serialize_default,
-            constant=constant,
-            repr=repr,  # type: ignore
             eq=eq,
             order=order,
             hash=hash,
             doc=doc,
             metadata=metadata,
-            callback=callback,  # type: ignore
             extra_paths=extra_paths,
             builtin_paths=builtin_paths,
             attribute_type=attribute_type,
             attribute_kwargs=attribute_kwargs,
-            set_type=set_type,
-            cls_dct=cls_dct,
-            cls_module=cls_module,
-            relationship_type=relationship_type,
-            relationship_kwargs=relationship_kwargs,
         ),
     )
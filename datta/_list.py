@@ -1,12 +1,30 @@
 import copy
 import itertools
 
+import six
 from estruttura import ImmutableListStructure, UserImmutableListStructure
 from pyrsistent import pvector
-from pyrsistent.typing import PVector
-from tippo import Any, Iterator, MutableSequence, Type, TypeVar, overload
-
-from ._bases import DataCollection, PrivateDataCollection
+from pyrsistent.typing import PVector, PVectorEvolver
+from tippo import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    MutableSequence,
+    Type,
+    TypeVar,
+    overload,
+)
+
+from ._bases import (
+    DataCollection,
+    PrivateDataCollection,
+    deserialize_trusted,
+    iter_serialize_values,
+    reconstruct_collection,
+)
+from ._evolvers import ListDataEvolver
+from ._numpy import get_numpy_columns, get_row_type, to_numpy
 
 T = TypeVar("T")
 
@@ -16,6 +34,31 @@ class PrivateListData(PrivateDataCollection[T], ImmutableListStructure[T]):
 
     __slots__ = ("_state",)
 
+    def __init__(self, initial=()):
+        # type: (Iterable[T]) -> None
+        """
+        :param initial: Initial values (not processed again if coming from a list data of the same class or with \
+an identical relationship).
+        """
+        if type(initial) is type(self) or (
+            isinstance(initial, PrivateListData) and initial.relationship == self.relationship
+        ):
+            self._state = initial._state  # type: PVector[T]
+        else:
+            super(PrivateListData, self).__init__(initial)
+
+    def __copy__(self):
+        # type: (PLD) -> PLD
+        """
+        Make a shallow copy (the cached hash is not carried over).
+
+        :return: Shallow copy.
+        """
+        cls = type(self)
+        new_self = cls.__new__(cls)
+        new_self._state = self._state
+        return new_self
+
     def __iter__(self):
         # type: () -> Iterator[T]
         """
@@ -34,29 +77,114 @@ class PrivateListData(PrivateDataCollection[T], ImmutableListStructure[T]):
         """
         return len(self._state)
 
-    @overload
+    @overload  # type: ignore
     def __getitem__(self, item):
         # type: (int) -> T
         pass
 
     @overload
     def __getitem__(self, item):
-        # type: (slice) -> MutableSequence[T]
+        # type: (PLD, slice) -> PLD
         pass
 
     def __getitem__(self, item):
         """
         Get value/values at index/slice.
+        Slices are of the same class and are not processed again.
 
         :param item: Index/slice.
         :return: Value/values.
         """
+        if isinstance(item, slice):
+            return self.__from_state(self._state[item])
         return self._state[item]
 
-    def _hash(self):
+    def __add__(self, other):
+        # type: (PLD, Iterable[T]) -> PLD
+        """
+        Concatenate with another list of values.
+        Values from a list data of the same class are not processed again.
+
+        :param other: List data, list or tuple.
+        :return: List data of the same class.
+        :raises ProcessingError: Error while processing values.
+        """
+        if type(other) is type(self):
+            return self.__from_state(self._state + other._state)  # type: ignore
+        if not isinstance(other, (PrivateListData, list, tuple)):
+            return NotImplemented
+        return self.__from_state(self._state + pvector(self.__process_values(other, len(self._state))))
+
+    def __radd__(self, other):
+        # type: (PLD, Iterable[T]) -> PLD
+        """
+        Concatenate after another list of values.
+
+        :param other: List or tuple.
+        :return: List data of the same class.
+        :raises ProcessingError: Error while processing values.
+        """
+        if not isinstance(other, (PrivateListData, list, tuple)):
+            return NotImplemented
+        return self.__from_state(pvector(self.__process_values(other, 0)) + self._state)
+
+    def __mul__(self, times):
+        # type: (PLD, int) -> PLD
+        """
+        Repeat values.
+
+        :param times: Number of times.
+        :return: List data of the same class.
+        """
+        if not isinstance(times, six.integer_types):
+            return NotImplemented
+        return self.__from_state(self._state * times)  # type: ignore
+
+    __rmul__ = __mul__
+
+    def __from_state(self, state):
+        # type: (PLD, PVector[T]) -> PLD
+        """
+        Make a list data of the same class with a new internal state, without processing its values.
+
+        :param state: Internal state.
+        :return: List data.
+        """
+        if state is self._state:
+            return self
+        cls = type(self)
+        new_self = cls.__new__(cls)
+        new_self._state = state
+        return new_self
+
+    def __process_values(self, values, start):
+        # type: (Iterable[Any], int) -> list[T]
+        """
+        Process values through the relationship.
+
+        :param values: Values.
+        :param start: Index of the first value.
+        :return: Processed values.
+        :raises ProcessingError: Error while processing values.
+        """
+        relationship = self.relationship
+        if not relationship.will_process:
+            return list(values)
+        return [relationship.process_value(v, start + i) for i, v in enumerate(values)]
+
+    def __reduce__(self):
+        # type: () -> tuple[Any, ...]
+        """
+        Reduce for pickling as a flat tuple.
+
+        :return: Reconstructor and its arguments.
+        """
+        return reconstruct_collection, (type(self), tuple(self._state))
+
+    def _do_hash(self):
         # type: () -> int
         """
-        Get hash.
+        Compute hash (internal).
 
         :return: Hash.
         """
@@ -82,7 +210,7 @@ class PrivateListData(PrivateDataCollection[T], ImmutableListStructure[T]):
 
         :param initial_values: New values.
         """
-        self._state = pvector(initial_values)  # type: PVector[T]
+        self._state = pvector(initial_values)
 
     @classmethod
     def _do_deserialize(cls, values):
@@ -98,6 +226,104 @@ class PrivateListData(PrivateDataCollection[T], ImmutableListStructure[T]):
         self._state = pvector(values)
         return self
 
+    def _do_serialize(self):
+        # type: () -> list[Any]
+        """
+        Serialize (internal).
+
+        :return: Serialized list.
+        :raises SerializationError: Error while serializing.
+        """
+        serialize_value = type(self).relationship.serialize_value
+        return [serialize_value(v) for v in self._state]
+
+    def _iter_serialize(self):
+        # type: () -> Iterator[str]
+        """
+        Iterate over the JSON text parts of the serialized list (internal).
+
+        :return: JSON text parts.
+        :raises SerializationError: Error while serializing.
+        """
+        yield "["
+        for part in iter_serialize_values(type(self).relationship, self._state):
+            yield part
+        yield "]"
+
+    @classmethod
+    def deserialize(cls, serialized, trusted=False):
+        # type: (Type[PLD], Iterable[Any], bool) -> PLD
+        """
+        Deserialize.
+
+        :param serialized: Serialized iterable.
+        :param trusted: Whether the serialized iterable comes from a trusted source, such as data serialized by \
+this same class. If so, values are only structurally decoded (no conversion, type checking or validation).
+        :return: List data.
+        :raises SerializationError: Error while deserializing.
+        """
+        return cls.deserialize_iter(serialized, trusted=trusted)
+
+    @classmethod
+    def deserialize_iter(cls, serialized, trusted=False):
+        # type: (Type[PLD], Iterable[Any], bool) -> PLD
+        """
+        Deserialize from an iterable, consuming one serialized value at a time.
+        Values are appended to the output as they are deserialized, so the input can be a generator (such as \
+:func:`datta.serializers.iter_json_lines`) and doesn't need to be materialized.
+
+        :param serialized: Serialized iterable.
+        :param trusted: Whether the serialized iterable comes from a trusted source, such as data serialized by \
+this same class. If so, values are only structurally decoded (no conversion, type checking or validation).
+        :return: List data.
+        :raises SerializationError: Error while deserializing.
+        """
+        relationship = cls.relationship
+        evolver = pvector().evolver()  # type: PVectorEvolver[T]
+        append = evolver.append
+        if trusted:
+            for serialized_value in serialized:
+                append(deserialize_trusted(relationship, serialized_value))
+        else:
+            deserialize_value = relationship.deserialize_value
+            for serialized_value in serialized:
+                append(deserialize_value(serialized_value))
+        self = cls.__new__(cls)
+        self._state = evolver.persistent()
+        return self
+
+    def to_numpy(self):
+        # type: () -> Any
+        """
+        Export to a NumPy structured array (requires NumPy).
+        Values must be of a single data class; each of its `bool`, `int` and `float` attributes becomes a field.
+
+        :return: Structured array.
+        :raises ImportError: NumPy is not installed.
+        :raises TypeError: Values are not of a single data class.
+        """
+        return to_numpy(self._state, get_row_type(type(self)))
+
+    @classmethod
+    def from_numpy(cls, array):
+        # type: (Type[PLD], Any) -> PLD
+        """
+        Import from a NumPy structured array whose fields are attribute names of the data class of the values \
+(requires NumPy).
+        Values are type checked once per field based on its dtype, or processed one by one for attributes that have \
+a converter or a validator. Attributes without a field get their default values.
+
+        :param array: Structured array.
+        :return: List data.
+        :raises ImportError: NumPy is not installed.
+        :raises TypeError: Values are not of a single data class or not a structured array.
+        :raises KeyError: Field is not an attribute of the data class.
+        :raises ProcessingError: Error while processing values.
+        """
+        row_type = get_row_type(cls)
+        columns, length = row_type._process_columns(get_numpy_columns(array))
+        return cls._do_deserialize(tuple(row_type._make_instances(columns, length)))
+
     def count(self, value):
         # type: (object) -> int
         """
@@ -213,5 +439,66 @@ class ListData(PrivateListData[T], DataCollection[T], UserImmutableListStructure
         new_self._state = new_state
         return new_self
 
+    def set_in(self, path, value):
+        # type: (LD, Iterable[Any], Any) -> LD
+        """
+        Set the value at the end of a path of keys (attribute names, indices and dictionary keys).
+        Only the data objects, lists and dictionaries along the path are copied, and only the new value is processed.
+
+        :param path: Path.
+        :param value: Value.
+        :return: Transformed.
+        :raises ValueError: Empty path.
+        :raises TypeError: Path goes through something other than a data object, list or dictionary.
+        :raises KeyError: Attribute or key along the path not found.
+        :raises IndexError: Index out of range.
+        """
+        from ._paths import set_in
+
+        return set_in(self, path, value)
+
+    def update_in(self, path, func):
+        # type: (LD, Iterable[Any], Callable[[Any], Any]) -> LD
+        """
+        Update the value at the end of a path of keys (attribute names, indices and dictionary keys) with a function.
+        Only the data objects, lists and dictionaries along the path are copied, and only the new value is processed.
+
+        :param path: Path.
+        :param func: Function that gets the new value from the current one.
+        :return: Transformed.
+        :raises ValueError: Empty path.
+        :raises TypeError: Path goes through something other than a data object, list or dictionary.
+        :raises KeyError: Attribute or key not found.
+        :raises IndexError: Index out of range.
+        """
+        from ._paths import update_in
+
+        return update_in(self, path, func)
+
+    def apply_patch(self, patch):
+        # type: (LD, Iterable[Any]) -> LD
+        """
+        Apply changes (such as the ones in a patch obtained with :func:`datta.diff`), in order.
+        Every container along the changed paths is copied only once, no matter how many changes it receives.
+
+        :param patch: Changes (:class:`datta.patches.Change` objects).
+        :return: Transformed.
+        :raises TypeError: Change can't be applied to the container at its path.
+        :raises KeyError: Attribute or key not found.
+        :raises IndexError: Index out of range.
+        """
+        from ._patches import apply_patch
+
+        return apply_patch(self, patch)
+
+    def evolver(self):
+        # type: (LD) -> ListDataEvolver[LD]
+        """
+        Get an evolver, which processes values as they come and applies all changes at once.
+
+        :return: Evolver.
+        """
+        return ListDataEvolver(self)
+
 
 LD = TypeVar("LD", bound=ListData)  # list data self type
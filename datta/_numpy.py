@@ -0,0 +1,152 @@
+import weakref
+
+import six
+from tippo import Any, Type
+
+from ._bases import BasePrivateData
+
+__all__ = ["import_numpy", "get_row_type", "get_numpy_fields", "to_numpy", "matches_dtype", "get_numpy_columns"]
+
+
+# Exact attribute type, structured array field type and accepted NumPy dtype kinds.
+_FIELD_TYPES = (
+    (bool, "?", "b"),
+    (int, "i8", "iu"),
+    (float, "f8", "f"),
+)
+
+_numpy_fields = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[type, tuple[tuple[str, str], ...]]
+
+
+def import_numpy():
+    # type: () -> Any
+    """
+    Import NumPy (an optional dependency).
+
+    :return: NumPy module.
+    :raises ImportError: NumPy is not installed.
+    """
+    try:
+        import numpy  # type: ignore
+    except ImportError:
+        exc = ImportError("NumPy is required for structured array conversion")
+        six.raise_from(exc, None)
+        raise exc
+    return numpy
+
+
+def get_row_type(cls):
+    # type: (Any) -> Type[Any]
+    """
+    Get the data class of the values of a collection class.
+
+    :param cls: Collection class.
+    :return: Data class.
+    :raises TypeError: Values are not of a single data class.
+    """
+    relationship = cls.relationship
+    all_types = relationship.types_info.all_types
+    if (
+        relationship.subtypes
+        or len(all_types) != 1
+        or not isinstance(all_types[0], type)
+        or not issubclass(all_types[0], BasePrivateData)
+        or not hasattr(all_types[0], "__pickle_names__")
+    ):
+        error = "{!r} values are not of a single data class".format(cls.__name__)
+        raise TypeError(error)
+    return all_types[0]
+
+
+def _get_field(relationship):
+    # type: (Any) -> tuple[str, str] | None
+    """
+    Get the structured array field type and accepted dtype kinds for the values of a relationship.
+
+    :param relationship: Relationship.
+    :return: Field type and dtype kinds, or None if not supported.
+    """
+    if relationship.subtypes:
+        return None
+    for field_type, dtype, kinds in _FIELD_TYPES:
+        if relationship.types == (field_type,):
+            return dtype, kinds
+    return None
+
+
+def get_numpy_fields(row_type):
+    # type: (Type[Any]) -> tuple[tuple[str, str], ...]
+    """
+    Get the structured array fields of a data class (`bool`, `int` and `float` attributes).
+
+    :param row_type: Data class.
+    :return: Field names and types.
+    """
+    try:
+        return _numpy_fields[row_type]
+    except KeyError:
+        pass
+    fields = []
+    for name in row_type.__pickle_names__:
+        field = _get_field(row_type.__attribute_map__[name].relationship)
+        if field is not None:
+            fields.append((name, field[0]))
+    _numpy_fields[row_type] = result = tuple(fields)
+    return result
+
+
+def to_numpy(values, row_type):
+    # type: (Any, Type[Any]) -> Any
+    """
+    Export data objects to a NumPy structured array, with a field for each `bool`, `int` and `float` attribute.
+
+    :param values: Data objects (sized iterable).
+    :param row_type: Data class.
+    :return: Structured array.
+    :raises ImportError: NumPy is not installed.
+    :raises ValueError: Data object has no value for an attribute.
+    """
+    numpy = import_numpy()
+    fields = get_numpy_fields(row_type)
+    array = numpy.empty(len(values), dtype=list(fields))
+    for name, _ in fields:
+        try:
+            array[name] = [getattr(v, name) for v in values]
+        except AttributeError:
+            exc = ValueError("data object has no value for attribute {!r}".format(name))
+            six.raise_from(exc, None)
+            raise exc
+    return array
+
+
+def matches_dtype(relationship, dtype):
+    # type: (Any, Any) -> bool
+    """
+    Get whether the values of a NumPy array are readily accepted by a relationship based on the array's dtype.
+
+    :param relationship: Relationship.
+    :param dtype: NumPy dtype.
+    :return: True if values converted with `tolist` don't need to be processed.
+    """
+    if relationship.converter is not None or relationship.validator is not None:
+        return False
+    field = _get_field(relationship)
+    return field is not None and dtype.kind in field[1]
+
+
+def get_numpy_columns(array):
+    # type: (Any) -> dict[str, Any]
+    """
+    Get the fields of a NumPy structured array.
+
+    :param array: Structured array.
+    :return: Field arrays by name.
+    :raises ImportError: NumPy is not installed.
+    :raises TypeError: Not a structured array.
+    """
+    import_numpy()
+    names = getattr(getattr(array, "dtype", None), "names", None)
+    if names is None:
+        error = "expected a NumPy structured array, got {!r}".format(type(array).__name__)
+        raise TypeError(error)
+    return dict((n, array[n]) for n in names)
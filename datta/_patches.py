@@ -0,0 +1,492 @@
+import weakref
+from itertools import compress, count
+from operator import is_not
+
+import six
+from basicco import SlottedBase
+from tippo import Any, Iterable, Iterator, Mapping, Tuple, Type, TypeVar
+
+from ._bases import BasePrivateData
+from ._constants import MISSING
+from ._data import Data, PrivateData
+from ._dict import DictData, PrivateDictData
+from ._evolvers import ListDataEvolver, SetDataEvolver
+from ._helpers import attribute
+from ._list import ListData, PrivateListData
+from ._relationship import Relationship
+from ._set import PrivateSetData, SetData
+from .serializers import Serializer
+
+__all__ = ["Change", "Insert", "Delete", "Update", "Move", "Patch", "diff", "apply_patch"]
+
+
+BD = TypeVar("BD", bound=BasePrivateData)
+
+
+class _PathSerializer(Serializer[Tuple[Any, ...]]):
+    """Serializes paths as lists of serialized keys."""
+
+    __slots__ = ()
+
+    def serialize(self, relationship, value):
+        # type: (Any, tuple[Any, ...]) -> list[Any]
+        """
+        Serialize path.
+
+        :param relationship: Relationship.
+        :param value: Path.
+        :return: Serialized path.
+        :raises SerializationError: Error while serializing.
+        """
+        return [_KEY_RELATIONSHIP.serialize_value(k) for k in value]
+
+    def deserialize(self, relationship, serialized):
+        # type: (Any, Any) -> tuple[Any, ...]
+        """
+        Deserialize path.
+
+        :param relationship: Relationship.
+        :param serialized: Serialized path.
+        :return: Path.
+        :raises SerializationError: Error while deserializing.
+        """
+        return tuple(_KEY_RELATIONSHIP.deserialize_value(s) for s in serialized)
+
+
+# Values of any type, serialized along with their class path when not basic.
+_KEY_RELATIONSHIP = Relationship(types=object, subtypes=True)  # type: Relationship[Any]
+
+
+class Change(Data):
+    """Change to a container in a data tree."""
+
+    path = attribute(types=tuple, serializer=_PathSerializer())  # type: tuple[Any, ...]
+    """Keys leading from the root to the container (attribute names, indices, dictionary keys)."""
+
+    key = attribute(types=object, subtypes=True)  # type: Any
+    """Attribute name, index, dictionary key or set value within the container."""
+
+
+class Insert(Change):
+    """Value inserted into a container (appended to a list if the index is its length)."""
+
+    value = attribute(types=object, subtypes=True)  # type: Any
+    """Inserted value."""
+
+
+class Delete(Change):
+    """Value deleted from a container."""
+
+    old_value = attribute(types=object, subtypes=True)  # type: Any
+    """Deleted value."""
+
+
+class Update(Change):
+    """Value replaced in a container."""
+
+    old_value = attribute(types=object, subtypes=True)  # type: Any
+    """Previous value."""
+
+    value = attribute(types=object, subtypes=True)  # type: Any
+    """New value."""
+
+
+class Move(Change):
+    """List value moved to a target index (as in :meth:`datta.ListData.move`)."""
+
+    target_index = attribute(types=int)  # type: int
+    """Target index (before moving)."""
+
+
+class Patch(ListData[Change]):
+    """Sequence of changes, applied in order."""
+
+    __slots__ = ()
+
+    relationship = Relationship(types=Change, subtypes=True)
+
+
+_DIFFABLE_TYPES = (PrivateData, PrivateListData, PrivateDictData, PrivateSetData)
+
+_diff_names = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[type, tuple[str, ...]]
+
+
+def _same(old, new):
+    # type: (Any, Any) -> bool
+    """
+    Get whether two values are the same.
+    Structures of the same type that are not identical are not compared for equality, their changes are looked for \
+instead.
+
+    :param old: Old value.
+    :param new: New value.
+    :return: True if the same.
+    """
+    if old is new:
+        return True
+    if type(old) is type(new) and isinstance(old, _DIFFABLE_TYPES):
+        return False
+    return old == new
+
+
+def _get_diff_names(cls):
+    # type: (Type[PrivateData]) -> tuple[str, ...]
+    """
+    Get the names of the attributes of a data class that are compared (stored and settable).
+
+    :param cls: Data class.
+    :return: Attribute names.
+    """
+    try:
+        return _diff_names[cls]
+    except KeyError:
+        pass
+    attribute_map = cls.__attribute_map__
+    names = tuple(n for n in cls.__pickle_names__ if not (attribute_map[n].delegated and not attribute_map[n].settable))
+    _diff_names[cls] = names
+    return names
+
+
+def _iter_value_changes(path, key, old, new):
+    # type: (tuple[Any, ...], Any, Any, Any) -> Iterator[Change]
+    """
+    Iterate over the changes between two values at the same location.
+    Structures of the same type are compared recursively, anything else is replaced as a whole.
+
+    :param path: Path to the container.
+    :param key: Key within the container.
+    :param old: Old value.
+    :param new: New value.
+    :return: Change iterator.
+    """
+    if old is new:
+        return
+    if type(old) is type(new) and isinstance(old, _DIFFABLE_TYPES):
+        for change in _iter_changes(path + (key,), old, new):
+            yield change
+    elif old != new:
+        yield Update(path, key, old, new)
+
+
+def _iter_data_changes(path, old, new):
+    # type: (tuple[Any, ...], PrivateData, PrivateData) -> Iterator[Change]
+    """
+    Iterate over the changes between two data objects of the same class.
+
+    :param path: Path to the data object.
+    :param old: Old data object.
+    :param new: New data object.
+    :return: Change iterator.
+    """
+    for name in _get_diff_names(type(old)):
+        old_value = getattr(old, name, MISSING)
+        new_value = getattr(new, name, MISSING)
+        if old_value is new_value:
+            continue
+        if old_value is MISSING:
+            yield Insert(path, name, new_value)
+        elif new_value is MISSING:
+            yield Delete(path, name, old_value)
+        else:
+            for change in _iter_value_changes(path, name, old_value, new_value):
+                yield change
+
+
+def _iter_list_changes(path, old, new):
+    # type: (tuple[Any, ...], PrivateListData, PrivateListData) -> Iterator[Change]
+    """
+    Iterate over the changes between two lists of the same class.
+    Only the range between the common prefix and the common suffix is compared.
+
+    :param path: Path to the list.
+    :param old: Old list.
+    :param new: New list.
+    :return: Change iterator.
+    """
+    old_state, new_state = old._state, new._state
+    old_length, new_length = len(old_state), len(new_state)
+
+    # Common prefix and suffix (values are compared for identity at C speed first).
+    start = min(old_length, new_length)
+    for index in compress(count(), map(is_not, old_state, new_state)):
+        if not _same(old_state[index], new_state[index]):
+            start = index
+            break
+    suffix = min(old_length, new_length) - start
+    for offset in compress(count(), map(is_not, reversed(old_state), reversed(new_state))):
+        if offset >= suffix:
+            break
+        if not _same(old_state[old_length - offset - 1], new_state[new_length - offset - 1]):
+            suffix = offset
+            break
+    old_stop, new_stop = old_length - suffix, new_length - suffix
+    if old_stop == start and new_stop == start:
+        return
+
+    # Single value moved forward or backward.
+    if old_stop == new_stop and old_stop - start > 1:
+        stop = old_stop
+        if _same(old_state[start], new_state[stop - 1]) and all(
+            _same(old_state[i + 1], new_state[i]) for i in range(start, stop - 1)
+        ):
+            yield Move(path, start, stop)
+            return
+        if _same(old_state[stop - 1], new_state[start]) and all(
+            _same(old_state[i], new_state[i + 1]) for i in range(start, stop - 1)
+        ):
+            yield Move(path, stop - 1, start)
+            return
+
+    # Updates where both lists have values, then deletes or inserts.
+    common_stop = min(old_stop, new_stop)
+    for index in range(start, common_stop):
+        for change in _iter_value_changes(path, index, old_state[index], new_state[index]):
+            yield change
+    for index in range(common_stop, old_stop):
+        yield Delete(path, common_stop, old_state[index])
+    for index in range(common_stop, new_stop):
+        yield Insert(path, index, new_state[index])
+
+
+def _iter_dict_changes(path, old, new):
+    # type: (tuple[Any, ...], PrivateDictData, PrivateDictData) -> Iterator[Change]
+    """
+    Iterate over the changes between two dictionaries of the same class.
+
+    :param path: Path to the dictionary.
+    :param old: Old dictionary.
+    :param new: New dictionary.
+    :return: Change iterator.
+    """
+    old_state, new_state = old._state, new._state
+
+    # Only compare the buckets of the persistent maps that are not shared (when they have the same layout).
+    old_buckets = getattr(old_state, "_buckets", None)
+    new_buckets = getattr(new_state, "_buckets", None)
+    if old_buckets is not None and new_buckets is not None and len(old_buckets) == len(new_buckets):
+        old_changed = {}  # type: dict[Any, Any]
+        new_changed = {}  # type: dict[Any, Any]
+        for index in compress(count(), map(is_not, old_buckets, new_buckets)):
+            old_changed.update(old_buckets[index] or ())
+            new_changed.update(new_buckets[index] or ())
+        old_items, new_items = old_changed, new_changed  # type: Mapping[Any, Any], Mapping[Any, Any]
+    else:
+        old_items, new_items = old_state, new_state
+
+    deleted = 0
+    for key, old_value in six.iteritems(old_items):
+        new_value = new_items.get(key, MISSING)
+        if new_value is MISSING:
+            deleted += 1
+            yield Delete(path, key, old_value)
+        else:
+            for change in _iter_value_changes(path, key, old_value, new_value):
+                yield change
+
+    # New keys only need to be looked for if there are any.
+    if len(new_items) > len(old_items) - deleted:
+        for key, new_value in six.iteritems(new_items):
+            if key not in old_items:
+                yield Insert(path, key, new_value)
+
+
+def _iter_set_changes(path, old, new):
+    # type: (tuple[Any, ...], PrivateSetData, PrivateSetData) -> Iterator[Change]
+    """
+    Iterate over the changes between two sets of the same class.
+
+    :param path: Path to the set.
+    :param old: Old set.
+    :param new: New set.
+    :return: Change iterator.
+    """
+    old_state, new_state = old._state, new._state
+    for value in old_state:
+        if value not in new_state:
+            yield Delete(path, value, value)
+    for value in new_state:
+        if value not in old_state:
+            yield Insert(path, value, value)
+
+
+def _iter_changes(path, old, new):
+    # type: (tuple[Any, ...], Any, Any) -> Iterator[Change]
+    """
+    Iterate over the changes between two structures of the same class.
+
+    :param path: Path to the structures.
+    :param old: Old structure.
+    :param new: New structure.
+    :return: Change iterator.
+    """
+    if isinstance(old, PrivateData):
+        return _iter_data_changes(path, old, new)
+    elif isinstance(old, PrivateListData):
+        return _iter_list_changes(path, old, new)
+    elif isinstance(old, PrivateDictData):
+        return _iter_dict_changes(path, old, new)
+    else:
+        return _iter_set_changes(path, old, new)
+
+
+def diff(old, new):
+    # type: (BasePrivateData, BasePrivateData) -> Patch
+    """
+    Get the changes between two versions of a data tree (data objects, lists, dictionaries and sets).
+    Values that are the same object in both versions are skipped without being compared, so the cost is \
+proportional to the parts of the tree that changed when they share structure (such as versions derived from one \
+another through updates).
+
+    :param old: Old version.
+    :param new: New version.
+    :return: Patch with the changes that turn the old version into the new one.
+    :raises TypeError: Versions are not of the same data class.
+    """
+    if type(old) is not type(new) or not isinstance(old, _DIFFABLE_TYPES):
+        error = "can't diff {!r} and {!r} objects".format(type(old).__name__, type(new).__name__)
+        raise TypeError(error)
+    return Patch(_iter_changes((), old, new))
+
+
+_EVOLVABLE_TYPES = (Data, ListData, DictData, SetData)
+
+
+class _PatchNode(SlottedBase):
+    """Evolver for a container being patched, along with the nodes for its children being patched."""
+
+    __slots__ = ("evolver", "children")
+
+    def __init__(self, data):
+        # type: (Any) -> None
+        """
+        :param data: Data object or collection.
+        :raises TypeError: Not a data object or collection that can be changed.
+        """
+        if not isinstance(data, _EVOLVABLE_TYPES):
+            error = "can't apply changes to {!r} object".format(type(data).__name__)
+            raise TypeError(error)
+        self.evolver = data.evolver()  # type: Any
+        self.children = {}  # type: dict[Any, _PatchNode]
+
+    def get_child(self, key):
+        # type: (Any) -> _PatchNode
+        """
+        Get the node for the value at a key, creating it if needed.
+
+        :param key: Attribute name, index or dictionary key.
+        :return: Child node.
+        :raises TypeError: Values in sets can't be changed in place.
+        """
+        try:
+            return self.children[key]
+        except KeyError:
+            pass
+        if isinstance(self.evolver, SetDataEvolver):
+            error = "can't apply changes to values inside of a set"
+            raise TypeError(error)
+        child = self.children[key] = _PatchNode(self.evolver[key])
+        return child
+
+    def flush(self):
+        # type: () -> None
+        """Set the values of the children into this node's evolver and discard them."""
+        evolver = self.evolver
+        for key, child in six.iteritems(self.children):
+            value = child.persistent()
+            if value is not evolver[key]:
+                evolver.set(key, value)
+        self.children.clear()
+
+    def persistent(self):
+        # type: () -> Any
+        """
+        Get the resulting data object or collection.
+
+        :return: Data object or collection.
+        """
+        if self.children:
+            self.flush()
+        return self.evolver.persistent()
+
+
+def _apply_change(node, change):
+    # type: (_PatchNode, Change) -> None
+    """
+    Apply a change to the container of a node.
+
+    :param node: Node.
+    :param change: Change.
+    :raises TypeError: Change can't be applied to this kind of container.
+    """
+    evolver = node.evolver
+    key = change.key
+    change_type = type(change)
+
+    # Set values are their own keys.
+    if isinstance(evolver, SetDataEvolver):
+        if change_type is Insert:
+            evolver.add(change.value)
+            return
+        if change_type is Delete:
+            evolver.remove(change.old_value)
+            return
+        if change_type is Update:
+            evolver.remove(change.old_value).add(change.value)
+            return
+
+    # Indices shift when inserting, deleting or moving, so children are set into the list before that.
+    elif isinstance(evolver, ListDataEvolver):
+        if change_type is Update:
+            node.children.pop(key, None)
+            evolver.set(key, change.value)
+            return
+        if node.children:
+            node.flush()
+        if change_type is Insert:
+            evolver.insert(key, change.value)
+            return
+        if change_type is Delete:
+            evolver.delete(key)
+            return
+        if change_type is Move:
+            target_index = change.target_index
+            value = evolver[key]
+            evolver.delete(key)
+            evolver.insert(target_index if target_index <= key else target_index - 1, value)
+            return
+
+    # Data attributes and dictionary keys.
+    else:
+        node.children.pop(key, None)
+        if change_type is Insert or change_type is Update:
+            evolver.set(key, change.value)
+            return
+        if change_type is Delete:
+            evolver.delete(key)
+            return
+
+    error = "can't apply {!r} to {!r} object".format(change, type(evolver).__name__)
+    raise TypeError(error)
+
+
+def apply_patch(data, patch):
+    # type: (BD, Iterable[Change]) -> BD
+    """
+    Apply changes (such as the ones in a patch obtained with :func:`diff`) to a data tree, in order.
+    Every container along the changed paths is copied only once, no matter how many changes it receives.
+    Old values in the changes are not checked against the current ones.
+
+    :param data: Data tree (data objects, lists, dictionaries and sets).
+    :param patch: Changes.
+    :return: Changed data tree.
+    :raises TypeError: Change can't be applied to the container at its path.
+    :raises KeyError: Attribute or key not found.
+    :raises IndexError: Index out of range.
+    """
+    root = _PatchNode(data)
+    for change in patch:
+        node = root
+        for key in change.path:
+            node = node.get_child(key)
+        _apply_change(node, change)
+    return root.persistent()
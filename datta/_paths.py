@@ -0,0 +1,134 @@
+import copy
+
+from tippo import Any, Callable, Iterable, TypeVar
+
+from ._bases import BasePrivateData
+from ._constants import MISSING
+from ._data import Data
+from ._dict import DictData
+from ._list import ListData
+
+__all__ = ["set_in", "update_in"]
+
+
+BD = TypeVar("BD", bound=BasePrivateData)
+
+_PATH_TYPES = (Data, ListData, DictData)
+
+
+def _get_relationship(data, key):
+    # type: (Any, Any) -> Any
+    """
+    Get the relationship that processes the value at a key of a container.
+
+    :param data: Data object, list or dictionary.
+    :param key: Attribute name, index or dictionary key.
+    :return: Relationship.
+    """
+    if isinstance(data, Data):
+        return type(data).__attribute_map__[key].relationship
+    if isinstance(data, DictData):
+        return data.value_relationship
+    return data.relationship
+
+
+def _replace_valid(data, key, value):
+    # type: (Any, Any, Any) -> Any
+    """
+    Replace an existing value with one that does not need processing.
+
+    :param data: Data object, list or dictionary.
+    :param key: Attribute name, index or dictionary key.
+    :param value: Value.
+    :return: Transformed container.
+    """
+    if isinstance(data, Data):
+        return data._do_evolve({key: value}, process=False)
+    new_data = copy.copy(data)
+    new_data._state = data._state.set(key, value)
+    return new_data
+
+
+def _replace_in(data, path, depth, func, missing_ok):
+    # type: (Any, tuple[Any, ...], int, Callable[[Any], Any], bool) -> Any
+    """
+    Replace the value at the end of a path, copying only the containers along it.
+    Only the new value is processed by its container.
+
+    :param data: Container at the current depth.
+    :param path: Path.
+    :param depth: Current depth.
+    :param func: Function that gets the new value from the current one (MISSING if there's none).
+    :param missing_ok: Whether the value at the end of the path may be missing.
+    :return: Transformed container (or the same one if the value is the same object).
+    :raises TypeError: Not a container that supports nested updates.
+    """
+    if not isinstance(data, _PATH_TYPES):
+        error = "can't set value in {!r} object at path {!r}".format(type(data).__name__, path[:depth])
+        raise TypeError(error)
+
+    key = path[depth]
+    if depth + 1 < len(path):
+        old_value = data[key]
+        new_value = _replace_in(old_value, path, depth + 1, func, missing_ok)
+
+        # Containers along the path derive from processed values, only validators need to run on them again.
+        if new_value is not old_value and type(new_value) is type(old_value):
+            if _get_relationship(data, key).validator is None:
+                return _replace_valid(data, key, new_value)
+    else:
+        try:
+            old_value = data[key]
+        except (KeyError, IndexError):
+            if not missing_ok:
+                raise
+            old_value = MISSING
+        new_value = func(old_value)
+
+    if new_value is old_value:
+        return data
+    evolver = data.evolver()
+    evolver.set(key, new_value)
+    return evolver.persistent()
+
+
+def set_in(data, path, value):
+    # type: (BD, Iterable[Any], Any) -> BD
+    """
+    Set the value at the end of a path of keys (attribute names, indices and dictionary keys).
+
+    :param data: Data object, list or dictionary.
+    :param path: Path.
+    :param value: Value.
+    :return: Transformed.
+    :raises ValueError: Empty path.
+    :raises TypeError: Path goes through something other than a data object, list or dictionary.
+    :raises KeyError: Attribute or key along the path not found.
+    :raises IndexError: Index out of range.
+    """
+    path = tuple(path)
+    if not path:
+        error = "empty path"
+        raise ValueError(error)
+    return _replace_in(data, path, 0, lambda _: value, True)
+
+
+def update_in(data, path, func):
+    # type: (BD, Iterable[Any], Callable[[Any], Any]) -> BD
+    """
+    Update the value at the end of a path of keys (attribute names, indices and dictionary keys) with a function.
+
+    :param data: Data object, list or dictionary.
+    :param path: Path.
+    :param func: Function that gets the new value from the current one.
+    :return: Transformed.
+    :raises ValueError: Empty path.
+    :raises TypeError: Path goes through something other than a data object, list or dictionary.
+    :raises KeyError: Attribute or key not found.
+    :raises IndexError: Index out of range.
+    """
+    path = tuple(path)
+    if not path:
+        error = "empty path"
+        raise ValueError(error)
+    return _replace_in(data, path, 0, func, False)
@@ -0,0 +1,83 @@
+import atexit
+import os
+import sys
+import timeit
+import weakref
+
+from tippo import TextIO
+
+__all__ = ["PROFILE_CLASSES_VAR", "ProfiledNamespace", "is_profiling_classes", "record_class", "write_report"]
+
+
+PROFILE_CLASSES_VAR = "DATTA_PROFILE_CLASSES"
+
+_profiling_classes = os.environ.get(PROFILE_CLASSES_VAR, "").strip().lower() not in ("", "0", "false", "no")
+_records = []  # type: list[tuple[float, weakref.ReferenceType[type], str]]
+
+
+def is_profiling_classes():
+    # type: () -> bool
+    """
+    Get whether the time it takes to create data classes is being recorded (set the `DATTA_PROFILE_CLASSES` \
+environment variable to enable it).
+
+    :return: True if profiling.
+    """
+    return _profiling_classes
+
+
+class ProfiledNamespace(dict):
+    """Class body namespace that remembers when the class body started running."""
+
+    __slots__ = ("started",)
+
+    def __init__(self):
+        # type: () -> None
+        super(ProfiledNamespace, self).__init__()
+        self.started = timeit.default_timer()
+
+
+def _get_name(cls):
+    # type: (type) -> str
+    """
+    Get the full name of a class.
+
+    :param cls: Class.
+    :return: Module and qualified name.
+    """
+    return "{}.{}".format(cls.__module__, cls.__qualname__)
+
+
+def record_class(cls, started):
+    # type: (type, float) -> None
+    """
+    Record the time it took to create a class.
+
+    :param cls: Class (just created).
+    :param started: When its class body started running.
+    """
+    _records.append((timeit.default_timer() - started, weakref.ref(cls), _get_name(cls)))
+
+
+def write_report(stream=None):
+    # type: (TextIO | None) -> None
+    """
+    Write the recorded class creation times, slowest first.
+    Times include running the class body (defining attributes) and the metaclasses.
+
+    :param stream: Text stream (defaults to standard error).
+    """
+    if stream is None:
+        stream = sys.stderr
+    records = sorted(_records, key=lambda r: r[0], reverse=True)
+    total = sum(r[0] for r in records)
+    stream.write("{}: {} classes created in {:.3f} ms\n".format(PROFILE_CLASSES_VAR, len(records), total * 1000))
+    for seconds, ref, name in records:
+        cls = ref()
+        if cls is not None:
+            name = _get_name(cls)  # collection classes are renamed after the attribute that owns them (if not shared)
+        stream.write("{:>12.3f} ms  {}\n".format(seconds * 1000, name))
+
+
+if _profiling_classes:
+    atexit.register(write_report)
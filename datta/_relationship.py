@@ -1,6 +1,8 @@
 import estruttura
+from basicco import type_checking
 from tippo import Any, Callable, Iterable, Type, TypeVar
 
+from ._constants import BASIC_TYPES, MISSING
 from .serializers import Serializer, TypedSerializer
 
 __all__ = ["Relationship"]
@@ -9,10 +11,13 @@ __all__ = ["Relationship"]
 T = TypeVar("T")
 
 
+_BASIC_TYPES = frozenset(BASIC_TYPES)
+
+
 class Relationship(estruttura.Relationship[T]):
     """Describes a relationship between the data and the values it contains."""
 
-    __slots__ = ()
+    __slots__ = ("_exact_types", "_trusted_types")
 
     def __init__(
         self,
@@ -23,6 +28,7 @@ class Relationship(estruttura.Relationship[T]):
         serializer=TypedSerializer(),  # type: Serializer[T] | None
         extra_paths=(),  # type: Iterable[str]
         builtin_paths=None,  # type: Iterable[str] | None
+        trusted_types=(),  # type: Iterable[Type[Any]]
     ):
         # type: (...) -> None
         """
@@ -33,6 +39,8 @@ class Relationship(estruttura.Relationship[T]):
         :param serializer: Serializer.
         :param extra_paths: Extra module paths in fallback order.
         :param builtin_paths: Builtin module paths in fallback order.
+        :param trusted_types: Exact types whose values are accepted as they are, without converting them (such as \
+collection classes whose values were processed when they were built). Ignored if there's a validator.
         """
         super(Relationship, self).__init__(
             converter=converter,
@@ -43,3 +51,104 @@ class Relationship(estruttura.Relationship[T]):
             extra_paths=extra_paths,
             builtin_paths=builtin_paths,
         )
+        self._exact_types = None  # type: tuple[Type[Any], ...] | None
+        self._trusted_types = tuple(trusted_types) if validator is None else ()  # type: tuple[Type[Any], ...]
+
+    def process_value(self, value, location=MISSING):
+        # type: (Any, Any) -> T
+        """
+        Process value (convert, check type, validate).
+        Values whose type is readily accepted (when there's no converter or validator) or trusted are returned as \
+they are.
+
+        :param value: Value.
+        :param location: Optional value location information.
+        :return: Processed value.
+        :raises ProcessingError: Error while processing value.
+        """
+        if type(value) in self._trusted_types:
+            return value
+        exact_types = self._exact_types
+        if exact_types is None:
+            exact_types = self.exact_types
+        if exact_types:
+            if self.subtypes:
+                if isinstance(value, exact_types):
+                    return value
+            elif type(value) in exact_types:
+                return value
+        return super(Relationship, self).process_value(value, location)
+
+    def to_items(self, usecase=None):
+        # type: (Any) -> list[tuple[str, Any]]
+        """
+        Convert to items.
+
+        :param usecase: Usecase.
+        :return: Items.
+        """
+        items = super(Relationship, self).to_items(usecase)
+        if self._trusted_types:
+            items.append(("trusted_types", self._trusted_types))
+        return items
+
+    def serialize_value(self, value):
+        # type: (T) -> Any
+        """
+        Serialize value.
+        Values of basic types are passed through when using a :class:`TypedSerializer`.
+
+        :param value: Value.
+        :return: Serialized value.
+        :raises SerializationError: Error while serializing.
+        """
+        if type(value) in _BASIC_TYPES and type(self.serializer) is TypedSerializer:
+            return value
+        return super(Relationship, self).serialize_value(value)
+
+    def deserialize_value(self, serialized):
+        # type: (Any) -> T
+        """
+        Deserialize value.
+        Values of basic types are passed through when using a :class:`TypedSerializer`.
+
+        :param serialized: Serialized value.
+        :return: Value.
+        :raises SerializationError: Error while deserializing.
+        """
+        if type(serialized) in _BASIC_TYPES and type(self.serializer) is TypedSerializer:
+            return serialized
+        return super(Relationship, self).deserialize_value(serialized)
+
+    @property
+    def trusted_types(self):
+        # type: () -> tuple[Type[Any], ...]
+        """Exact types whose values are accepted as they are."""
+        return self._trusted_types
+
+    @property
+    def exact_types(self):
+        # type: () -> tuple[Type[Any], ...]
+        """
+        Types values can be checked against directly, without going through the full processing.
+        Empty if there's a converter/validator or if types are not all plain classes.
+        """
+        if self._exact_types is not None:
+            return self._exact_types
+        if self.converter is not None or self.validator is not None or not self.types:
+            exact_types = ()  # type: tuple[Type[Any], ...]
+        else:
+            try:
+                types = type_checking.import_types(
+                    self.types,
+                    extra_paths=self.extra_paths,
+                    builtin_paths=self.builtin_paths,
+                )
+            except (ImportError, AttributeError, TypeError, ValueError):
+                return ()  # might be importable later
+            if all(isinstance(t, type) for t in types):
+                exact_types = tuple(types)
+            else:
+                exact_types = ()
+        self._exact_types = exact_types
+        return exact_types
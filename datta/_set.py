@@ -3,18 +3,62 @@ import copy
 from estruttura import ImmutableSetStructure, UserImmutableSetStructure
 from pyrsistent import pset
 from pyrsistent.typing import PSet
-from tippo import AbstractSet, Iterable, Iterator, Type, TypeVar
+from tippo import AbstractSet, Any, Iterable, Iterator, Type, TypeVar
 
-from ._bases import DataCollection, PrivateDataCollection
+from ._bases import (
+    DataCollection,
+    PrivateDataCollection,
+    deserialize_trusted,
+    iter_serialize_values,
+    reconstruct_collection,
+)
+from ._evolvers import SetDataEvolver
 
 T = TypeVar("T")
 
 
+def _make_pset(values):
+    # type: (Iterable[T]) -> PSet[T]
+    """
+    Make a persistent set sized for its values.
+    By default, `pset` allocates 8 hash buckets no matter how many values there are, making lookups linear.
+
+    :param values: Values.
+    :return: Persistent set.
+    """
+    return pset(values, pre_size=0)
+
+
 class PrivateSetData(PrivateDataCollection[T], ImmutableSetStructure[T]):
     """Private set data."""
 
     __slots__ = ("_state",)
 
+    def __init__(self, initial=()):
+        # type: (Iterable[T]) -> None
+        """
+        :param initial: Initial values (not processed again if coming from a set data of the same class or with an \
+identical relationship).
+        """
+        if type(initial) is type(self) or (
+            isinstance(initial, PrivateSetData) and initial.relationship == self.relationship
+        ):
+            self._state = initial._state  # type: PSet[T]
+        else:
+            super(PrivateSetData, self).__init__(initial)
+
+    def __copy__(self):
+        # type: (PSD) -> PSD
+        """
+        Make a shallow copy (the cached hash is not carried over).
+
+        :return: Shallow copy.
+        """
+        cls = type(self)
+        new_self = cls.__new__(cls)
+        new_self._state = self._state
+        return new_self
+
     def __iter__(self):
         # type: () -> Iterator[T]
         """
@@ -43,10 +87,19 @@ class PrivateSetData(PrivateDataCollection[T], ImmutableSetStructure[T]):
         """
         return value in self._state
 
-    def _hash(self):
+    def __reduce__(self):
+        # type: () -> tuple[Any, ...]
+        """
+        Reduce for pickling as a flat tuple.
+
+        :return: Reconstructor and its arguments.
+        """
+        return reconstruct_collection, (type(self), tuple(self._state))
+
+    def _do_hash(self):
         # type: () -> int
         """
-        Get hash.
+        Compute hash (internal).
 
         :return: Hash.
         """
@@ -72,7 +125,7 @@ class PrivateSetData(PrivateDataCollection[T], ImmutableSetStructure[T]):
 
         :param initial_values: New values.
         """
-        self._state = pset(initial_values)  # type: PSet[T]
+        self._state = _make_pset(initial_values)
 
     @classmethod
     def _do_deserialize(cls, values):
@@ -85,9 +138,50 @@ class PrivateSetData(PrivateDataCollection[T], ImmutableSetStructure[T]):
         :raises SerializationError: Error while deserializing.
         """
         self = cls.__new__(cls)
-        self._state = pset(values)
+        self._state = _make_pset(values)
         return self
 
+    def _do_serialize(self):
+        # type: () -> list[Any]
+        """
+        Serialize (internal).
+
+        :return: Serialized list.
+        :raises SerializationError: Error while serializing.
+        """
+        serialize_value = type(self).relationship.serialize_value
+        return [serialize_value(v) for v in self._state]
+
+    def _iter_serialize(self):
+        # type: () -> Iterator[str]
+        """
+        Iterate over the JSON text parts of the serialized list (internal).
+
+        :return: JSON text parts.
+        :raises SerializationError: Error while serializing.
+        """
+        yield "["
+        for part in iter_serialize_values(type(self).relationship, self._state):
+            yield part
+        yield "]"
+
+    @classmethod
+    def deserialize(cls, serialized, trusted=False):
+        # type: (Type[PSD], Iterable[Any], bool) -> PSD
+        """
+        Deserialize.
+
+        :param serialized: Serialized iterable.
+        :param trusted: Whether the serialized iterable comes from a trusted source, such as data serialized by \
+this same class. If so, values are only structurally decoded (no conversion, type checking or validation).
+        :return: Set data.
+        :raises SerializationError: Error while deserializing.
+        """
+        if not trusted:
+            return super(PrivateSetData, cls).deserialize(serialized)
+        relationship = cls.relationship
+        return cls._do_deserialize(frozenset(deserialize_trusted(relationship, s) for s in serialized))
+
     def isdisjoint(self, iterable):
         # type: (Iterable) -> bool
         """
@@ -119,54 +213,140 @@ class PrivateSetData(PrivateDataCollection[T], ImmutableSetStructure[T]):
         return self._state.issuperset(iterable)
 
     def intersection(self, iterable):
-        # type: (Iterable) -> AbstractSet
+        # type: (PSD, Iterable) -> PSD
         """
         Get intersection.
+        Values not coming from a set data with the same relationship are processed first.
+        Only the smaller of the two sets is iterated over.
 
         :param iterable: Iterable.
-        :return: Intersection.
+        :return: Set data of the same class.
+        :raises ProcessingError: Error while processing values.
         """
-        return self._state.intersection(iterable)
+        other = self.__coerce(iterable)
+        state = self._state
+        if len(state) <= len(other):
+            return self.__from_state(_make_pset(v for v in state if v in other))
+        return self.__from_state(_make_pset(v for v in other if v in state))
 
     def symmetric_difference(self, iterable):
-        # type: (Iterable) -> AbstractSet
+        # type: (PSD, Iterable) -> PSD
         """
         Get symmetric difference.
+        Values not coming from a set data with the same relationship are processed first.
 
         :param iterable: Iterable.
-        :return: Symmetric difference.
-        """
-        return self._state.symmetric_difference(iterable)
+        :return: Set data of the same class.
+        :raises ProcessingError: Error while processing values.
+        """
+        other = self.__coerce(iterable)
+        state = self._state
+        evolver = state.evolver()
+        for value in other:
+            if value in state:
+                evolver.remove(value)
+            else:
+                evolver.add(value)
+        return self.__from_state(evolver.persistent())
 
     def union(self, iterable):
-        # type: (Iterable) -> AbstractSet
+        # type: (PSD, Iterable) -> PSD
         """
         Get union.
+        Values not coming from a set data with the same relationship are processed first.
 
         :param iterable: Iterable.
-        :return: Union.
+        :return: Set data of the same class.
+        :raises ProcessingError: Error while processing values.
         """
-        return self._state.union(iterable)
+        other = self.__coerce(iterable)
+        state = self._state
+        if type(other) is type(state) and len(other) > len(state):
+            return self.__from_state(other.update(state))
+        return self.__from_state(state.update(other))
 
     def difference(self, iterable):
-        # type: (Iterable) -> AbstractSet
+        # type: (PSD, Iterable) -> PSD
         """
         Get difference.
+        Values not coming from a set data with the same relationship are processed first.
+        Values are removed from this set when there are fewer of them than values to be kept.
 
         :param iterable: Iterable.
-        :return: Difference.
-        """
-        return self._state.difference(iterable)
+        :return: Set data of the same class.
+        :raises ProcessingError: Error while processing values.
+        """
+        other = self.__coerce(iterable)
+        state = self._state
+        if len(other) <= len(state) // 2:
+            evolver = state.evolver()
+            for value in other:
+                if value in state:
+                    evolver.remove(value)
+            return self.__from_state(evolver.persistent())
+        return self.__from_state(_make_pset(v for v in state if v not in other))
 
     def inverse_difference(self, iterable):
-        # type: (Iterable) -> AbstractSet
+        # type: (PSD, Iterable) -> PSD
         """
         Get an iterable's difference to this.
+        Values not coming from a set data with the same relationship are processed first.
+
+        :param iterable: Iterable.
+        :return: Set data of the same class.
+        :raises ProcessingError: Error while processing values.
+        """
+        other = self.__coerce(iterable)
+        state = self._state
+        return self.__from_state(_make_pset(v for v in other if v not in state))
+
+    def __coerce(self, iterable):
+        # type: (Iterable) -> AbstractSet[T]
+        """
+        Get a set with the processed values of an iterable.
+        Values coming from a set data with the same relationship (or from a set, when the relationship doesn't \
+process values) are used as they are.
 
         :param iterable: Iterable.
-        :return: Inverse Difference.
+        :return: Set of processed values.
+        :raises ProcessingError: Error while processing values.
+        """
+        if isinstance(iterable, PrivateSetData):
+            if type(iterable) is type(self) or iterable.relationship == self.relationship:
+                return iterable._state
+            iterable = iterable._state
+        elif isinstance(iterable, AbstractSet) and not self.relationship.will_process:
+            return iterable
+        return frozenset(self.__process_values(iterable))
+
+    def __process_values(self, values):
+        # type: (Iterable[Any]) -> list[T]
         """
-        return pset(iterable).difference(self._state)
+        Process values through the relationship.
+
+        :param values: Values.
+        :return: Processed values.
+        :raises ProcessingError: Error while processing values.
+        """
+        relationship = self.relationship
+        if not relationship.will_process:
+            return list(values)
+        return [relationship.process_value(v, v) for v in values]
+
+    def __from_state(self, state):
+        # type: (PSD, PSet[T]) -> PSD
+        """
+        Make a set data of the same class with a new internal state, without processing its values.
+
+        :param state: Internal state.
+        :return: Set data.
+        """
+        if state is self._state:
+            return self
+        cls = type(self)
+        new_self = cls.__new__(cls)
+        new_self._state = state
+        return new_self
 
 
 PSD = TypeVar("PSD", bound=PrivateSetData)  # private set data self type
@@ -203,5 +383,30 @@ class SetData(PrivateSetData[T], DataCollection[T], UserImmutableSetStructure[T]
         new_self._state = new_state
         return new_self
 
+    def apply_patch(self, patch):
+        # type: (SD, Iterable[Any]) -> SD
+        """
+        Apply changes (such as the ones in a patch obtained with :func:`datta.diff`), in order.
+        Every container along the changed paths is copied only once, no matter how many changes it receives.
+
+        :param patch: Changes (:class:`datta.patches.Change` objects).
+        :return: Transformed.
+        :raises TypeError: Change can't be applied to the container at its path.
+        :raises KeyError: Attribute or key not found.
+        :raises IndexError: Index out of range.
+        """
+        from ._patches import apply_patch
+
+        return apply_patch(self, patch)
+
+    def evolver(self):
+        # type: (SD) -> SetDataEvolver[SD]
+        """
+        Get an evolver, which processes values as they come and applies all changes at once.
+
+        :return: Evolver.
+        """
+        return SetDataEvolver(self)
+
 
 SD = TypeVar("SD", bound=SetData)  # set data self type
@@ -0,0 +1,160 @@
+import codecs
+import json
+import re
+
+import six
+from estruttura.exceptions import SerializationError
+from tippo import Any, Callable, Iterator, Match, cast
+
+__all__ = ["iter_json_lines", "iter_json_array"]
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")  # always matches
+
+
+def _iter_text(stream, chunk_size):
+    # type: (Any, int) -> Iterator[str]
+    """
+    Iterate over text chunks read from a text or binary (UTF-8) stream.
+
+    :param stream: Readable stream.
+    :param chunk_size: Maximum chunk size.
+    :return: Text chunk iterator.
+    """
+    decoder = None
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            if decoder is not None:
+                tail = decoder.decode(b"", final=True)
+                if tail:
+                    yield tail
+            return
+        if isinstance(chunk, six.binary_type):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder("utf-8")()
+            chunk = decoder.decode(chunk)
+            if not chunk:
+                continue
+        yield chunk
+
+
+def iter_json_lines(stream):
+    # type: (Any) -> Iterator[Any]
+    """
+    Iterate over the values of a JSON-lines stream (one JSON value per line, blank lines are skipped).
+
+    :param stream: Readable text or binary (UTF-8) stream, or any iterable of lines.
+    :return: Value iterator.
+    :raises SerializationError: Invalid JSON.
+    """
+    for line_number, line in enumerate(stream, 1):
+        if isinstance(line, six.binary_type):
+            line = line.decode("utf-8")
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            exc = SerializationError("invalid JSON at line {}: {}".format(line_number, e))
+            six.raise_from(exc, None)
+            raise exc
+
+
+def iter_json_array(stream, chunk_size=65536):
+    # type: (Any, int) -> Iterator[Any]
+    """
+    Iterate over the values of a JSON array read incrementally from a stream.
+    Only the values being decoded are kept in memory, not the whole document.
+
+    :param stream: Readable text or binary (UTF-8) stream.
+    :param chunk_size: Number of characters/bytes read at a time.
+    :return: Value iterator.
+    :raises SerializationError: Invalid JSON or not an array.
+    """
+    raw_decode = json.JSONDecoder().raw_decode
+    skip = cast(Callable[[str, int], Match[str]], _WHITESPACE.match)
+    chunks = _iter_text(stream, chunk_size)
+    buffer = ""
+    pos = 0
+    eof = False
+
+    # Opening bracket.
+    while not eof and skip(buffer, pos).end() == len(buffer):
+        buffer = next(chunks, "")
+        pos = 0
+        eof = not buffer
+    pos = skip(buffer, pos).end()
+    if buffer[pos : pos + 1] != "[":
+        error = "expected a JSON array, got {!r}".format(buffer[pos : pos + 20])
+        raise SerializationError(error)
+    pos += 1
+    first = True
+
+    while True:
+        pos = skip(buffer, pos).end()
+
+        # Read more when exhausted, the next character is needed.
+        if pos == len(buffer):
+            if eof:
+                error = "unexpected end of JSON array"
+                raise SerializationError(error)
+            buffer = next(chunks, "")
+            pos = 0
+            eof = not buffer
+            continue
+
+        # Empty array.
+        if first and buffer[pos] == "]":
+            pos += 1
+            break
+        first = False
+
+        # Decode a value; it's only known to be complete once followed by ',' or ']' (or at the end of the stream).
+        try:
+            value, end = raw_decode(buffer, pos)
+        except ValueError as e:
+            if eof:
+                exc = SerializationError("invalid JSON array: {}".format(e))
+                six.raise_from(exc, None)
+                raise exc
+            value, end = None, len(buffer)
+        following = skip(buffer, end).end()
+        if following == len(buffer) or buffer[following] not in ",]":
+            if not eof:
+
+                # Read at least as much as is pending before decoding again, so a value spanning many chunks is only
+                # decoded a logarithmic number of times (linear instead of quadratic).
+                parts = [buffer[pos:]]
+                size = 0
+                while size < len(parts[0]):
+                    chunk = next(chunks, "")
+                    if not chunk:
+                        eof = True
+                        break
+                    parts.append(chunk)
+                    size += len(chunk)
+                buffer = "".join(parts)
+                pos = 0
+                continue
+            if following == len(buffer):
+                error = "unexpected end of JSON array"
+            else:
+                error = "expected ',' or ']' in JSON array, got {!r}".format(buffer[following : following + 20])
+            raise SerializationError(error)
+
+        yield value
+        pos = following + 1
+        if buffer[following] == "]":
+            break
+
+    # Nothing but whitespace is allowed after the array.
+    while True:
+        pos = skip(buffer, pos).end()
+        if pos < len(buffer):
+            error = "unexpected data after JSON array: {!r}".format(buffer[pos : pos + 20])
+            raise SerializationError(error)
+        buffer = next(chunks, "")
+        pos = 0
+        if not buffer:
+            return
@@ -0,0 +1,520 @@
+import array
+import itertools
+import weakref
+
+import six
+from basicco import custom_repr
+from tippo import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    Type,
+    TypeVar,
+    overload,
+)
+
+from ._bases import (
+    DataCollection,
+    PrivateDataCollection,
+    deserialize_trusted,
+    iter_serialize_values,
+)
+from ._constants import MISSING
+from ._data import PrivateData, _process_column, _reconstruct_data
+from ._list import ListData
+from ._relationship import Relationship
+from .exceptions import ProcessingError
+
+T = TypeVar("T", bound=PrivateData)
+
+_typecodes = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[type, tuple[str | None, ...]]
+
+
+def _get_typecodes(row_type):
+    # type: (type) -> tuple[str | None, ...]
+    """
+    Get the array type codes for the columns of a data class (None for columns stored as tuples).
+    Only attributes whose relationship accepts exactly `int` or exactly `float` values (see \
+:attr:`datta.Relationship.exact_types`) are stored in arrays.
+
+    :param row_type: Data class.
+    :return: Type codes, in pickling order.
+    """
+    try:
+        return _typecodes[row_type]
+    except KeyError:
+        pass
+    typecodes = []  # type: list[str | None]
+    for name in row_type.__pickle_names__:  # type: ignore
+        relationship = row_type.__attribute_map__[name].relationship  # type: ignore
+        exact_types = relationship.exact_types if isinstance(relationship, Relationship) else ()
+        if relationship.subtypes:
+            typecodes.append(None)
+        elif exact_types == (int,):
+            typecodes.append("q")
+        elif exact_types == (float,):
+            typecodes.append("d")
+        else:
+            typecodes.append(None)
+    _typecodes[row_type] = result = tuple(typecodes)
+    return result
+
+
+def _make_column(typecode, values):
+    # type: (str | None, Iterable[Any]) -> Sequence[Any]
+    """
+    Make a column, falling back to a tuple when values don't fit in an array (missing values, big integers).
+
+    :param typecode: Array type code or None.
+    :param values: Column values.
+    :return: Column.
+    """
+    if typecode is not None:
+        if not isinstance(values, (list, tuple)):
+            values = tuple(values)
+        try:
+            return array.array(typecode, values)
+        except (TypeError, OverflowError):
+            pass
+    return tuple(values)
+
+
+def _reconstruct_table(cls, columns, length):
+    # type: (Type[PTD], tuple[Sequence[Any], ...], int) -> PTD
+    """
+    Reconstruct a pickled table from its columns, without revalidating them.
+
+    :param cls: Table data class.
+    :param columns: Columns.
+    :param length: Number of rows.
+    :return: Table data.
+    """
+    return cls._from_columns(columns, length)
+
+
+class PrivateTableData(PrivateDataCollection[T]):
+    """
+    Private table data.
+    Stores the attribute values of data objects of a single class (rows) in columns, and only builds row objects \
+when accessed. Columns of attributes that accept exactly `int` or `float` values are stored as arrays.
+    """
+
+    __slots__ = ("_columns", "_length")
+
+    row_type = PrivateData  # type: Type[T]  # type: ignore
+    row_list_type = None  # type: Type[ListData[T]] | None
+
+    def __init_subclass__(cls, **kwargs):
+        # type: (**Any) -> None
+        """Initialize subclass, deriving the relationship from the row type if it's not specified."""
+        if "row_type" in cls.__dict__ and "relationship" not in cls.__dict__:
+            kwargs.setdefault("relationship", Relationship(types=cls.row_type))
+        super(PrivateTableData, cls).__init_subclass__(**kwargs)  # noqa
+
+    def __init__(self, initial=()):
+        # type: (Iterable[T]) -> None
+        """
+        :param initial: Initial rows.
+        """
+        cls = type(self)
+        if type(initial) is cls:
+            self._columns = initial._columns  # type: tuple[Sequence[Any], ...]
+            self._length = initial._length  # type: int
+            return
+        try:
+            rows = tuple(cls.relationship.process_value(r, i) for i, r in enumerate(initial))
+        except ProcessingError as e:
+            exc = type(e)(e)
+            six.raise_from(exc, None)
+            raise exc
+        self._do_init(rows)
+
+    def __copy__(self):
+        # type: (PTD) -> PTD
+        """
+        Make a shallow copy (the cached hash is not carried over).
+
+        :return: Shallow copy.
+        """
+        return type(self)._from_columns(self._columns, self._length)
+
+    def __iter__(self):
+        # type: () -> Iterator[T]
+        """
+        Iterate over rows (built on the fly).
+
+        :return: Row iterator.
+        """
+        row_type = type(self).row_type
+        if not self._columns:
+            return (_reconstruct_data(row_type, ()) for _ in range(self._length))
+        return (_reconstruct_data(row_type, values) for values in zip(*self._columns))
+
+    def __len__(self):
+        # type: () -> int
+        """
+        Get row count.
+
+        :return: Row count.
+        """
+        return self._length
+
+    @overload
+    def __getitem__(self, item):
+        # type: (int) -> T
+        pass
+
+    @overload
+    def __getitem__(self, item):
+        # type: (PTD, slice) -> PTD
+        pass
+
+    def __getitem__(self, item):
+        """
+        Get row at index or table with the rows in a slice.
+
+        :param item: Index/slice.
+        :return: Row/table.
+        :raises IndexError: Index out of range.
+        """
+        if isinstance(item, slice):
+            indices = range(*item.indices(self._length))
+            return type(self)._from_columns(tuple(c[item] for c in self._columns), len(indices))
+        if item < 0:
+            item += self._length
+        if not 0 <= item < self._length:
+            error = "table index out of range"
+            raise IndexError(error)
+        return _reconstruct_data(type(self).row_type, tuple(c[item] for c in self._columns))
+
+    def __contains__(self, value):
+        # type: (object) -> bool
+        """
+        Get whether contains row or not (compared by attribute values, without building row objects).
+
+        :param value: Row.
+        :return: True if contains.
+        """
+        row_type = type(self).row_type
+        if type(value) is not row_type:
+            return False
+        values = tuple(getattr(value, n, MISSING) for n in row_type.__pickle_names__)
+        if not values:
+            return self._length > 0
+        return any(v == values for v in zip(*self._columns))
+
+    def __reduce__(self):
+        # type: () -> tuple[Any, ...]
+        """
+        Reduce for pickling as columns.
+
+        :return: Reconstructor and its arguments.
+        """
+        return _reconstruct_table, (type(self), self._columns, self._length)
+
+    def _do_hash(self):
+        # type: () -> int
+        """
+        Compute hash (internal).
+
+        :return: Hash.
+        """
+        return hash((self._length,) + tuple(tuple(c) for c in self._columns))
+
+    def _eq(self, other):
+        # type: (object) -> bool
+        """
+        Compare for equality.
+
+        :param other: Another object.
+        :return: True if equal.
+        """
+        if not isinstance(other, type(self)) or self._length != other._length:
+            return False
+        for column, other_column in zip(self._columns, other._columns):
+            if type(column) is not type(other_column):
+                column, other_column = tuple(column), tuple(other_column)
+            if column != other_column:
+                return False
+        return True
+
+    def _repr(self):
+        # type: () -> str
+        """
+        Get representation.
+
+        :return: Representation.
+        """
+        return custom_repr.iterable_repr(self, prefix="{}([".format(type(self).__qualname__), suffix="])")
+
+    def _do_init(self, initial_values):
+        # type: (tuple[T, ...]) -> None
+        """
+        Initialize rows (internal).
+
+        :param initial_values: Initial rows.
+        """
+        row_type = type(self).row_type
+        self._columns = tuple(
+            _make_column(t, [getattr(r, n, MISSING) for r in initial_values])
+            for n, t in zip(row_type.__pickle_names__, _get_typecodes(row_type))
+        )
+        self._length = len(initial_values)
+
+    @classmethod
+    def _from_columns(cls, columns, length):
+        # type: (Type[PTD], tuple[Sequence[Any], ...], int) -> PTD
+        """
+        Make a table from its columns (internal).
+
+        :param columns: Columns, in the pickling order of the row type.
+        :param length: Number of rows.
+        :return: Table data.
+        """
+        self = cls.__new__(cls)
+        self._columns = columns
+        self._length = length
+        return self
+
+    @classmethod
+    def from_columns(cls, columns):
+        # type: (Type[PTD], Mapping[str, Iterable[Any]]) -> PTD
+        """
+        Make a table from columns of attribute values (see :meth:`datta.Data.from_columns`).
+        Row types with delegated attributes can't skip building row objects, so rows are built in that case.
+
+        :param columns: Attribute values by attribute name (attributes that can be initialized).
+        :return: Table data.
+        :raises KeyError: Not the name of an attribute that can be initialized.
+        :raises ValueError: Columns have different lengths.
+        :raises RuntimeError: Missing values for required attributes.
+        :raises ProcessingError: Error while processing values.
+        """
+        row_type = cls.row_type
+        processed_columns, length = row_type._process_columns(columns)
+        if any(a.delegated for a in six.itervalues(row_type.__attribute_map__)):
+            return cls._do_deserialize(tuple(row_type._make_instances(processed_columns, length)))
+        complete_columns = row_type._complete_columns(processed_columns, length)
+        return cls._from_columns(
+            tuple(_make_column(t, c) for t, c in zip(_get_typecodes(row_type), complete_columns)), length
+        )
+
+    @classmethod
+    def from_list(cls, list_data):
+        # type: (Type[PTD], Iterable[T]) -> PTD
+        """
+        Make a table from list data (or any iterable of rows).
+
+        :param list_data: List data.
+        :return: Table data.
+        """
+        return cls(list_data)
+
+    def _column_index(self, name):
+        # type: (str) -> int
+        """
+        Get the index of the column of an attribute (internal).
+
+        :param name: Attribute name.
+        :return: Column index.
+        :raises KeyError: Invalid attribute name.
+        """
+        try:
+            return type(self).row_type.__pickle_names__.index(name)
+        except ValueError:
+            exc = KeyError(name)
+            six.raise_from(exc, None)
+            raise exc
+
+    def column(self, name):
+        # type: (str) -> Sequence[Any]
+        """
+        Get the values of an attribute, without building row objects.
+        Array columns are copied, tuple columns are returned as they are.
+
+        :param name: Attribute name.
+        :return: Column values (missing values are MISSING).
+        :raises KeyError: Invalid attribute name.
+        """
+        column = self._columns[self._column_index(name)]
+        if isinstance(column, array.array):
+            return array.array(column.typecode, column)
+        return column
+
+    def filter(self, predicate, *names):
+        # type: (PTD, Callable[..., bool], *str) -> PTD
+        """
+        Make a table with the rows that satisfy a predicate.
+        If attribute names are provided, the predicate is called with the values of those attributes instead of the \
+rows, so no row objects are built.
+
+        :param predicate: Predicate function.
+        :param names: Attribute names.
+        :return: Filtered table.
+        :raises KeyError: Invalid attribute name.
+        """
+        if names:
+            arguments = zip(*(self._columns[self._column_index(n)] for n in names))
+            mask = tuple(bool(predicate(*a)) for a in arguments)
+        else:
+            mask = tuple(bool(predicate(r)) for r in self)
+        columns = tuple(
+            _make_column(c.typecode if isinstance(c, array.array) else None, itertools.compress(c, mask))
+            for c in self._columns
+        )
+        return type(self)._from_columns(columns, sum(mask))
+
+    def to_list(self, list_type=None):
+        # type: (Type[ListData[T]] | None) -> ListData[T]
+        """
+        Convert to list data.
+
+        :param list_type: List data class (defaults to the class' `row_list_type`).
+        :return: List data.
+        :raises TypeError: No list data class.
+        """
+        if list_type is None:
+            list_type = type(self).row_list_type
+            if list_type is None:
+                error = "{!r} has no 'row_list_type'".format(type(self).__name__)
+                raise TypeError(error)
+        return list_type._do_deserialize(tuple(self))
+
+    @classmethod
+    def _do_deserialize(cls, values):
+        # type: (Type[PTD], tuple[T, ...]) -> PTD
+        """
+        Deserialize (internal).
+
+        :param values: Deserialized rows.
+        :return: Table data.
+        :raises SerializationError: Error while deserializing.
+        """
+        self = cls.__new__(cls)
+        self._do_init(values)
+        return self
+
+    def _do_serialize(self):
+        # type: () -> list[Any]
+        """
+        Serialize (internal).
+
+        :return: Serialized list.
+        :raises SerializationError: Error while serializing.
+        """
+        serialize_value = type(self).relationship.serialize_value
+        return [serialize_value(r) for r in self]
+
+    def _iter_serialize(self):
+        # type: () -> Iterator[str]
+        """
+        Iterate over the JSON text parts of the serialized list (internal).
+
+        :return: JSON text parts.
+        :raises SerializationError: Error while serializing.
+        """
+        yield "["
+        for part in iter_serialize_values(type(self).relationship, self):
+            yield part
+        yield "]"
+
+    @classmethod
+    def deserialize(cls, serialized, trusted=False):
+        # type: (Type[PTD], Iterable[Any], bool) -> PTD
+        """
+        Deserialize.
+
+        :param serialized: Serialized iterable of rows.
+        :param trusted: Whether the serialized iterable comes from a trusted source, such as data serialized by \
+this same class. If so, values are only structurally decoded (no conversion, type checking or validation).
+        :return: Table data.
+        :raises SerializationError: Error while deserializing.
+        """
+        relationship = cls.relationship
+        if trusted:
+            rows = tuple(deserialize_trusted(relationship, s) for s in serialized)
+        else:
+            deserialize_value = relationship.deserialize_value
+            rows = tuple(deserialize_value(s) for s in serialized)
+        return cls._do_deserialize(rows)
+
+
+PTD = TypeVar("PTD", bound=PrivateTableData)  # private table data self type
+
+
+class TableData(PrivateTableData[T], DataCollection[T]):
+    """Table data."""
+
+    __slots__ = ()
+
+    def append(self, row):
+        # type: (TD, T) -> TD
+        """
+        Append a row.
+
+        :param row: Row.
+        :return: Transformed.
+        """
+        return self.extend((row,))
+
+    def extend(self, rows):
+        # type: (TD, Iterable[T]) -> TD
+        """
+        Append rows.
+
+        :param rows: Rows.
+        :return: Transformed.
+        """
+        other = type(self)(rows)
+        if not other._length:
+            return self
+        columns = tuple(
+            _make_column(c.typecode if isinstance(c, array.array) else None, itertools.chain(c, o))
+            for c, o in zip(self._columns, other._columns)
+        )
+        return type(self)._from_columns(columns, self._length + other._length)
+
+    def update_column(self, name, values):
+        # type: (TD, str, Iterable[Any]) -> TD
+        """
+        Replace the values of an attribute for all rows.
+        Values are processed by the attribute (see :meth:`datta.Data.from_columns`); unless the attribute is \
+delegated or has dependents, no row objects are built.
+
+        :param name: Attribute name.
+        :param values: New values (one per row).
+        :return: Transformed.
+        :raises KeyError: Invalid attribute name.
+        :raises AttributeError: Attribute is not settable.
+        :raises ValueError: Wrong number of values.
+        :raises ProcessingError: Error while processing values.
+        """
+        cls = type(self)
+        row_type = cls.row_type
+        index = self._column_index(name)
+        attribute = row_type.__attribute_map__[name]
+
+        # Delegates and dependents require the full machinery.
+        if attribute.delegated or attribute.dependents:
+            values = tuple(values)
+            if len(values) != self._length:
+                error = "expected {} values, got {}".format(self._length, len(values))
+                raise ValueError(error)
+            return cls(r.update({name: v}) for r, v in zip(self, values))  # type: ignore
+
+        if not attribute.settable:
+            error = "attribute {!r} is not settable".format(name)
+            raise AttributeError(error)
+        new_values = _process_column(attribute, values)
+        if len(new_values) != self._length:
+            error = "expected {} values, got {}".format(self._length, len(new_values))
+            raise ValueError(error)
+        columns = list(self._columns)
+        columns[index] = _make_column(_get_typecodes(row_type)[index], new_values)
+        return cls._from_columns(tuple(columns), self._length)
+
+
+TD = TypeVar("TD", bound=TableData)  # table data self type
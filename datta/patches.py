@@ -0,0 +1,12 @@
+from ._patches import Change, Delete, Insert, Move, Patch, Update, apply_patch, diff
+
+__all__ = [
+    "Change",
+    "Insert",
+    "Delete",
+    "Update",
+    "Move",
+    "Patch",
+    "diff",
+    "apply_patch",
+]
@@ -1,3 +1,14 @@
 from estruttura.serializers import EnumSerializer, Serializer, TypedSerializer
 
-__all__ = ["Serializer", "TypedSerializer", "EnumSerializer"]
+from ._binary import from_bytes, to_bytes
+from ._streams import iter_json_array, iter_json_lines
+
+__all__ = [
+    "Serializer",
+    "TypedSerializer",
+    "EnumSerializer",
+    "to_bytes",
+    "from_bytes",
+    "iter_json_lines",
+    "iter_json_array",
+]
@@ -31,9 +31,10 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/x-rst",
     url="https://github.com/brunonicko/datta",
-    packages=setuptools.find_packages(exclude=["tests", "tests.*"]),
+    packages=setuptools.find_packages(exclude=["tests", "tests.*", "benchmarks", "benchmarks.*"]),
     package_data={"datta": ["py.typed"]},
     install_requires=install_requires,
+    extras_require={"numpy": ["numpy"]},
     classifiers=[
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
@@ -10,17 +10,19 @@ from invoke import task  # type: ignore  # noqa
 
 @task
 def conform(c):
-    c.run("isort datta tests ./docs/source/conf.py setup.py -m 3 -l 88 --up --tc --lbt 0")
+    c.run("isort datta tests benchmarks ./docs/source/conf.py setup.py -m 3 -l 88 --up --tc --lbt 0")
     c.run("black datta --line-length=120")
     c.run("black tests --line-length=120")
+    c.run("black benchmarks --line-length=120")
     c.run("black setup.py --line-length=120")
 
 
 @task
 def lint(c):
-    c.run("isort datta tests ./docs/source/conf.py setup.py -m 3 -l 88 --up --tc --lbt 0 --check-only")
+    c.run("isort datta tests benchmarks ./docs/source/conf.py setup.py -m 3 -l 88 --up --tc --lbt 0 --check-only")
     c.run("black datta --line-length=120 --check")
     c.run("black tests --line-length=120 --check")
+    c.run("black benchmarks --line-length=120 --check")
     c.run("black setup.py --line-length=120 --check")
 
     c.run("flake8 datta --count --select=E9,F63,F7,F82 --show-source --statistics")
@@ -43,6 +45,11 @@ def tests(c):
     c.run("python -m pytest --doctest-modules -vv -rs README.rst")
 
 
+@task
+def benchmarks(c, output="benchmarks.json", quick=False):
+    c.run("python -m benchmarks {}--output {}".format("--quick " if quick else "", output))
+
+
 @task
 def docs(c):
     api_docs = "./docs/source/api"
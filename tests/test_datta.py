@@ -1,8 +1,46 @@
 from __future__ import absolute_import, division, print_function
 
+import array
+import io
+import json
+import math
+import os
+import pickle
+import subprocess
+import sys
+
+import estruttura
 import pytest
 
-from datta import Data, attribute, exceptions, getter
+from datta import (
+    MISSING,
+    Attribute,
+    Data,
+    DictData,
+    ListData,
+    Relationship,
+    SetData,
+    _profiling,
+    attribute,
+    dict_attribute,
+    dict_cls,
+    diff,
+    exceptions,
+    getter,
+    list_attribute,
+    list_cls,
+    set_attribute,
+    set_cls,
+    table_cls,
+)
+from datta.patches import Delete, Insert, Move, Patch, Update
+from datta.serializers import (
+    TypedSerializer,
+    from_bytes,
+    iter_json_array,
+    iter_json_lines,
+    to_bytes,
+)
 
 
 def test_datta():
@@ -58,6 +96,53 @@ def test_constants():
         circle.PI = 5
 
 
+def test_lazy_getter():
+    calls = []
+
+    class Circle(Data):
+        PI = attribute(3.14, constant=True)
+        radius = attribute(types=float)
+        name = attribute(types=str, default="")
+        circumference = attribute(types=float, lazy=True)
+
+        @getter(circumference, dependencies=(PI, radius))
+        def _(self):
+            calls.append(self.radius)
+            return 2 * self.PI * self.radius
+
+    circle = Circle(3.0)
+    assert not calls
+    assert "circumference" not in circle
+    with pytest.raises(KeyError):
+        assert not circle["circumference"]
+    with pytest.raises(AttributeError):
+        assert not circle["diameter"]
+    assert circle.circumference == 18.84
+    assert "circumference" in circle
+    assert circle.circumference == 18.84
+    assert calls == [3.0]
+
+    # Only invalidated when a dependency changes.
+    assert circle.set("name", "c").circumference == 18.84
+    assert calls == [3.0]
+    assert "circumference" in circle.set("radius", 3.0)
+    assert "circumference" in circle.evolver().set("name", "c").persistent()
+    assert "circumference" not in circle.set("radius", 3.5)
+    assert calls == [3.0]
+    bigger = circle.set("radius", 4.0)
+    assert "circumference" not in bigger
+    assert bigger.circumference == 25.12
+    assert calls == [3.0, 4.0]
+    assert bigger == Circle(4.0)
+
+    with pytest.raises(TypeError):
+
+        class Invalid(Data):
+            area = attribute(lazy=True)
+
+        assert not Invalid  # type: ignore
+
+
 def test_evolve():
     class Point(Data):
         x = attribute()
@@ -84,5 +169,777 @@ def test_type_checking():
         point.set("x", 3.0)
 
 
+def test_generated_init():
+    class Point(Data):
+        x = attribute(types=int)
+        y = attribute(types=int, default=0)
+        z = attribute(factory=list, converter=tuple)
+
+    class Point3D(Point):
+        w = attribute(types=int, default=0)
+
+        def __init__(self, x, w):
+            super(Point3D, self).__init__(x, w=w)
+
+    assert Point(1) == Point(1, 0, ())
+    assert Point(1, z=[2]).z == (2,)
+    assert Point3D(1, 2).w == 2
+
+    with pytest.raises(RuntimeError):
+        Point()
+    with pytest.raises(TypeError):
+        Point(1, foo=2)
+    with pytest.raises(exceptions.InvalidTypeError):
+        Point(1.0)
+
+
+def test_generated_serialize():
+    class Child(Data):
+        value = attribute(types=int)
+
+    class Parent(Data):
+        name = attribute(types=str, serialize_as="label")
+        note = attribute(types=str, default="", serialize_default=False)
+        secret = attribute(types=str, default="", serializable=False)
+        child = attribute(types=(Child, None), default=None)
+        children = list_attribute(types=Child, default=())
+        extra = attribute(types=(int, None), default=None, serialize_default=False)
+
+    class SubParent(Parent):
+        def serialize(self):
+            return dict(super(SubParent, self).serialize(), sub=True)
+
+    parent = Parent("p", child=Child(1), children=[Child(2)], secret="s")
+    serialize = parent.serialize  # bound to the placeholder
+    expected = {"label": "p", "child": {"value": 1}, "children": [{"value": 2}]}
+    assert serialize() == serialize() == parent.serialize() == expected
+    assert Parent.deserialize(parent.serialize()) == parent.set("secret", "")
+    assert parent.update(note="n", extra=3).serialize() == dict(expected, note="n", extra=3)
+    assert SubParent("p").serialize() == {"label": "p", "child": None, "children": [], "sub": True}
+
+
+def test_cached_hash():
+    class Point(Data):
+        x = attribute()
+        y = attribute()
+
+    class MutablePoint(Data):
+        __kwargs__ = {"cache_hash": False}
+        x = attribute()
+
+    point = Point(3, 4)
+    assert hash(point) == hash(point) == hash(Point(3, 4))
+    assert hash(point.set("x", 30)) == hash(Point(30, 4))
+    assert not MutablePoint.__cache_hash__
+    assert hash(MutablePoint(3)) == hash(MutablePoint(3))
+
+    IntList = list_cls(types=int)
+    int_list = IntList([1, 2])
+    assert hash(int_list) == hash(IntList([1, 2]))
+    assert hash(int_list.append(3)) == hash(IntList([1, 2, 3]))
+
+
+def test_cached_serialized():
+    class Vehicle(Data):
+        __kwargs__ = {"cache_serialized": True}
+        wheels = attribute(types=int)
+
+    class Garage(Data):
+        __kwargs__ = {"cache_serialized": True}
+        vehicles = list_attribute(types=Vehicle, cls_dct={"__cache_serialized__": True})
+        name = attribute(types=str, default="")
+
+    vehicle = Vehicle(4)
+    assert vehicle.serialize() is vehicle.serialize()
+    assert not Data.__cache_serialized__
+
+    garage = Garage([vehicle, Vehicle(2)])
+    serialized = garage.serialize()
+    assert serialized == {"vehicles": [{"wheels": 4}, {"wheels": 2}], "name": ""}
+    assert serialized["vehicles"][0] is vehicle.serialize()
+
+    # Unchanged children reuse their cached output, changed ones are serialized again.
+    renamed = garage.set("name", "home")
+    assert renamed.serialize()["name"] == "home"
+    assert renamed.serialize()["vehicles"] is serialized["vehicles"]
+    assert garage.serialize() is serialized
+    assert garage.update(vehicles=[Vehicle(3)]).serialize()["vehicles"] == [{"wheels": 3}]
+
+
+def test_intern():
+    class Vehicle(Data):
+        __kwargs__ = {"intern": True}
+        kind = attribute(types=str)
+        wheels = attribute(types=int, default=4)
+
+    class Bike(Vehicle):
+        __kwargs__ = {"intern": False}
+
+    car = Vehicle("car")
+    assert Vehicle("car") is car
+    assert Vehicle.deserialize({"kind": "car"}) is car
+    assert Vehicle.deserialize({"kind": "car"}, trusted=True) is car
+    assert Vehicle("bike", 2).update(kind="car", wheels=4) is car
+    assert Vehicle("car", 3) is not car
+
+    assert Bike("bike") == Bike("bike")
+    assert Bike("bike") is not Bike("bike")
+
+    class Pair(Data):
+        __kwargs__ = {"intern": True}
+        first = attribute()
+        second = attribute(default=None)
+
+    # Equal values of different types are not interchangeable, even when nested.
+    assert Pair(1) is Pair(1)
+    assert Pair(1) is not Pair(True) and Pair(1) is not Pair(1.0)
+    assert Pair(0.0) is not Pair(-0.0)
+    assert math.copysign(1.0, Pair(-0.0).first) == -1.0
+    assert Pair(Pair(1)) is Pair(Pair(1)) and Pair(Pair(1)) is not Pair(Pair(True))
+    assert type(Pair((True,)).first[0]) is bool and type(Pair((1,)).first[0]) is int
+    assert Pair((1,)) == Pair((1,)) and Pair((1,)) is not Pair((1,))
+
+
+class PickledCircle(Data):
+    __kwargs__ = {"cache_serialized": True}
+    radius = attribute(types=float)
+    name = attribute(types=(str, None), default=None, required=False, deletable=True)
+    diameter = attribute(types=float, lazy=True)
+
+    @getter(diameter, dependencies=(radius,))
+    def _(self):
+        return self.radius * 2
+
+
+PickledCircles = list_cls(types=PickledCircle, qualified_name="PickledCircles")
+PickledRadii = dict_cls(key_types=str, types=float, qualified_name="PickledRadii")
+PickledNames = set_cls(types=str, qualified_name="PickledNames")
+
+
+class PickledHero(Data):
+    aliases = list_attribute(types=str)
+
+
+def test_pickle():
+    circle = PickledCircle(3.0).delete("name")
+    assert circle.diameter == 6.0
+    assert hash(circle) and circle.serialize()
+    assert circle.__reduce__()[1] == (PickledCircle, (3.0, MISSING))
+
+    # Cached hash, cached serialized output and lazy values are not carried over.
+    unpickled = pickle.loads(pickle.dumps(circle))
+    assert unpickled == circle
+    assert "name" not in unpickled and "diameter" not in unpickled
+    assert unpickled.diameter == 6.0
+
+    for collection in (
+        PickledCircles([circle, PickledCircle(1.0, "small")]),
+        PickledRadii({"a": 1.0}),
+        PickledNames(["a", "b"]),
+    ):
+        unpickled = pickle.loads(pickle.dumps(collection))
+        assert type(unpickled) is type(collection)
+        assert unpickled == collection
+
+
+def test_binary_serializer():
+    class Point(Data):
+        x = attribute(types=int)
+        y = attribute(types=float, default=0.0)
+        label = attribute(types=(str, None), default=None, required=False, deletable=True)
+        extra = attribute(default=None)
+
+    Points = list_cls(types=Point)
+
+    class Shape(Data):
+        points = attribute(types=Points)
+        tags = dict_attribute(key_types=str, types=int, default={})
+        names = set_attribute(types=str, default=())
+
+    shape = Shape(
+        Points([Point(-300, 1.5, "a", extra=True), Point(2).delete("label")]),
+        tags={"a": 1},
+        names=["b"],
+    )
+    data = to_bytes(shape)
+    assert b"points" not in data and b"label" not in data
+    assert len(data) < len(repr(shape.serialize()).encode("utf-8")) // 3
+
+    decoded = from_bytes(Shape, data)
+    assert decoded == shape
+    assert "label" not in decoded.points[1]
+    assert from_bytes(Points, to_bytes(shape.points)) == shape.points
+
+    with pytest.raises(exceptions.SerializationError):
+        from_bytes(Shape, data[:-1])
+    with pytest.raises(exceptions.SerializationError):
+        to_bytes({"x": 1})
+
+
+def test_deserialize_iter(monkeypatch):
+    class Point(Data):
+        x = attribute(types=int)
+
+    Points = list_cls(types=Point)
+    consumed = []
+
+    def generate():
+        for i in range(3):
+            consumed.append(i)
+            yield {"x": i}
+
+    points = Points.deserialize_iter(generate())
+    assert consumed == [0, 1, 2]
+    assert points == Points([Point(0), Point(1), Point(2)])
+    assert Points.deserialize_iter(generate(), trusted=True) == points
+
+    stream = io.BytesIO(b'[{"x": 0}, {"x": 1},\n {"x": 2}]')
+    assert Points.deserialize_iter(iter_json_array(stream, chunk_size=3)) == points
+    stream = io.StringIO('{"x": 0}\n\n{"x": 1}\n{"x": 2}\n')
+    assert Points.deserialize_iter(iter_json_lines(stream)) == points
+
+    for invalid in (b"[1, 2", b"[1 2]", b"{}", b"[1] 2"):
+        with pytest.raises(exceptions.SerializationError):
+            list(iter_json_array(io.BytesIO(invalid), chunk_size=2))
+
+    # Values spanning many chunks are not decoded again for every chunk.
+    raw_decode = json.JSONDecoder.raw_decode
+    decoded = []
+    monkeypatch.setattr(json.JSONDecoder, "raw_decode", lambda *a: decoded.append(a) or raw_decode(*a))
+    stream = io.StringIO(json.dumps([list(range(2000)), "x" * 10000]))
+    assert list(iter_json_array(stream, chunk_size=4)) == [list(range(2000)), "x" * 10000]
+    assert len(decoded) < 50
+
+
+def test_iter_serialize():
+    class Vehicle(Data):
+        wheels = attribute(types=int)
+        name = attribute(types=str, default="", serialize_default=False)
+        brand = attribute(types=(str, None), default=None, serialize_as="make")
+
+    class Custom(Data):
+        x = attribute(types=int)
+
+        def serialize(self):
+            return {"custom": self.x}
+
+    class Garage(Data):
+        vehicles = list_attribute(types=Vehicle)
+        by_id = dict_attribute(key_types=int, types=Vehicle, default={})
+        ids = set_attribute(types=int, default=())
+        custom = attribute(types=(Custom, None), default=None)
+        circle = attribute(default=None, types=(PickledCircle, None), subtypes=True)
+
+    garage = Garage(
+        [Vehicle(4), Vehicle(2, "bike", "acme")],
+        by_id={1: Vehicle(3)},
+        ids=[1],
+        custom=Custom(1),
+        circle=PickledCircle(1.0),
+    )
+    text = json.dumps(garage.serialize())
+    chunks = list(garage.iter_serialize(chunk_size=16))
+    assert "".join(chunks) == text
+    assert len(chunks) > 1 and all(len(c) >= 16 for c in chunks[:-1])
+
+    stream = io.StringIO()
+    garage.vehicles.serialize_to(stream)
+    assert stream.getvalue() == json.dumps(garage.vehicles.serialize())
+    assert "".join(Garage([]).iter_serialize()) == json.dumps(Garage([]).serialize())
+
+
+def test_table():
+    class Point(Data):
+        x = attribute(types=int)
+        y = attribute(types=float, default=0.0)
+        name = attribute(types=(str, None), default=None)
+
+    PointTable = table_cls(Point)
+    table = PointTable([Point(1, 2.0), Point(2, 3.5, "b")])
+    assert len(table) == 2
+    assert table[-1] == Point(2, 3.5, "b")
+    assert list(table[:1]) == [Point(1, 2.0)]
+    assert Point(1, 2.0) in table and Point(3) not in table
+
+    # Numeric columns are arrays, columns are accessed and filtered without building rows.
+    assert table.column("x") == array.array("q", [1, 2])
+    assert table.column("name") == (None, "b")
+    assert table.filter(lambda x, y: x + y > 4, "x", "y") == PointTable([Point(2, 3.5, "b")])
+    assert table.filter(lambda p: p.name is None) == PointTable([Point(1, 2.0)])
+    assert table.update_column("x", [10, 20]).column("x") == array.array("q", [10, 20])
+    with pytest.raises(exceptions.InvalidTypeError):
+        table.update_column("x", [1, "2"])
+    with pytest.raises(KeyError):
+        table.column("z")
+
+    assert PointTable.from_columns({"x": [1, 2], "y": [2.0, 3.5], "name": [None, "b"]}) == table
+    assert PointTable.from_columns({"x": [1]}) == PointTable([Point(1)])
+    assert table.append(Point(3)).extend([Point(4)])[3] == Point(4)
+
+    list_data = table.to_list()
+    assert list(list_data) == list(table)
+    assert PointTable.from_list(list_data) == table
+    assert PointTable.deserialize(table.serialize()) == table
+    assert "".join(table.iter_serialize()) == json.dumps(table.serialize())
+
+    # Only columns with exact types are arrays (imported from paths, not converted, no subtypes).
+    class Reading(Data):
+        count = attribute(types="int")
+        value = attribute(types=float, converter=float)
+        level = attribute(types=int, subtypes=True)
+
+    readings = table_cls(Reading)([Reading(1, 2, 3)])
+    assert readings.column("count") == array.array("q", [1])
+    assert readings.column("value") == (2.0,)
+    assert readings.column("level") == (3,)
+
+
+def test_numpy():
+    numpy = pytest.importorskip("numpy")
+
+    class Sample(Data):
+        index = attribute(types=int)
+        value = attribute(types=float, default=0.0)
+        valid = attribute(types=bool, default=True)
+        label = attribute(types=str, default="")
+        count = attribute(types=int, converter=int, default=0)
+
+    SampleList = list_cls(types=Sample)
+    samples = SampleList([Sample(1, 0.5, False, "a", 2), Sample(2)])
+    structured = samples.to_numpy()
+    assert structured.dtype.names == ("index", "value", "valid", "count")
+    assert structured["value"].tolist() == [0.5, 0.0]
+
+    imported = SampleList.from_numpy(structured)
+    assert imported == SampleList([Sample(1, 0.5, False, count=2), Sample(2)])
+    assert type(imported[0].index) is int and type(imported[0].valid) is bool
+
+    # Converters are applied per value, wrong dtypes go through the relationship for an error.
+    converted = SampleList.from_numpy(numpy.array([(1, 2.5)], dtype=[("index", "i4"), ("count", "f8")]))
+    assert converted[0].count == 2
+    with pytest.raises(exceptions.InvalidTypeError):
+        SampleList.from_numpy(numpy.array([(1.5,)], dtype=[("index", "f8")]))
+    with pytest.raises(TypeError):
+        list_cls(types=int)([1]).to_numpy()
+
+
+def test_from_columns():
+    class Reading(Data):
+        sensor = attribute(types=str)
+        value = attribute(types=float, converter=float)
+        unit = attribute(types=str, default="m")
+        note = attribute(types=(str, None), default=None)
+
+    readings = Reading.from_columns(sensor=["a", "b"], value=[1, 2.5], note=[None, "x"])
+    assert list(readings) == [Reading("a", 1.0), Reading("b", 2.5, note="x")]
+    assert type(readings[0].value) is float
+    assert type(readings).relationship.types == (Reading,)
+    assert Reading.from_columns(sensor=[], value=[]) == type(readings)()
+
+    with pytest.raises(exceptions.InvalidTypeError):
+        Reading.from_columns(sensor=["a", 1], value=[1, 2])
+    with pytest.raises(ValueError):
+        Reading.from_columns(sensor=["a"], value=[1, 2])
+    with pytest.raises(RuntimeError):
+        Reading.from_columns(value=[1])
+    with pytest.raises(KeyError):
+        Reading.from_columns(sensor=["a"], value=[1], color=["red"])
+
+    # Only attributes that can be initialized, with or without delegated attributes.
+    class Scaled(Data):
+        value = attribute(types=int, init_as="v")
+        scale = attribute(types=int, default=1, init=False)
+
+    class Doubled(Data):
+        value = attribute(types=int, init_as="v")
+        scale = attribute(types=int, default=1, init=False)
+        double = attribute(types=int)
+
+        @getter(double, dependencies=(value,))
+        def _(self):
+            return self.value * 2
+
+    assert list(Scaled.from_columns(value=[1])) == [Scaled(v=1)]
+    assert list(Doubled.from_columns(value=[1])) == [Doubled(v=1)]
+    for data_type in (Scaled, Doubled):
+        with pytest.raises(KeyError):
+            data_type.from_columns(value=[1], scale=[9])
+    with pytest.raises(KeyError):
+        Doubled.from_columns(value=[1], double=[2])
+
+
+def test_diff():
+    class Item(Data):
+        name = attribute(types=str)
+        tags = set_attribute(types=str, default=())
+
+    class Inventory(Data):
+        items = list_attribute(types=Item)
+        note = attribute(types=str, required=False, deletable=True)
+        lookup = dict_attribute(key_types=str, types=Item, default={})
+
+    old = Inventory([Item("a"), Item("b"), Item("c")], lookup={"a": Item("a")})
+    with pytest.raises(KeyError):  # unset attributes can be updated
+        assert not old["note"]
+    assert diff(old, old) == Patch()
+
+    new = Inventory(old.items.set(1, old.items[1].update({"name": "B"})), "hi", old.lookup)
+    assert list(diff(old, new)) == [Update(("items", 1), "name", "b", "B"), Insert((), "note", "hi")]
+    assert list(diff(new, old))[-1] == Delete((), "note", "hi")
+
+    assert list(diff(old, old.update({"items": old.items.move(0, 3)}))) == [Move(("items",), 0, 3)]
+    assert list(diff(old, old.update({"items": old.items.append(Item("d"))}))) == [Insert(("items",), 3, Item("d"))]
+    assert list(diff(old, old.update({"items": old.items.delete(0)}))) == [Delete(("items",), 0, Item("a"))]
+
+    new = old.update({"lookup": old.lookup.set("a", Item("a", {"x"})).set("b", Item("b"))})
+    assert list(diff(old, new)) == [Insert(("lookup", "a", "tags"), "x", "x"), Insert(("lookup",), "b", Item("b"))]
+
+    patch = diff(PickledCircles([PickledCircle(1.0)]), PickledCircles([PickledCircle(2.0), PickledCircle(3.0)]))
+    assert list(patch) == [Update((0,), "radius", 1.0, 2.0), Insert((), 1, PickledCircle(3.0))]
+    assert Patch.deserialize(json.loads(json.dumps(patch.serialize()))) == patch
+    with pytest.raises(TypeError):
+        diff(old, Item("a"))
+
+
+def test_apply_patch():
+    class Item(Data):
+        name = attribute(types=str)
+        tags = set_attribute(types=str, default=())
+
+    class Inventory(Data):
+        items = list_attribute(types=Item)
+        note = attribute(types=str, required=False, deletable=True)
+        lookup = dict_attribute(key_types=str, types=Item, default={})
+
+    old = Inventory([Item("a"), Item("b"), Item("c")], lookup={"a": Item("a")})
+    with pytest.raises(KeyError):  # unset attributes can be updated
+        assert not old["note"]
+    versions = [
+        old.update({"note": "hi", "items": old.items.set(1, Item("B", {"x"}))}),
+        old.update({"items": old.items.move(0, 3)}),
+        old.update({"items": old.items.move(2, 0).insert(1, Item("d")).delete(3)}),
+        old.update({"lookup": old.lookup.set("a", Item("a", {"x"})).set("b", Item("b"))}),
+        old.update({"lookup": {}, "items": []}),
+    ]
+    for new in versions:
+        assert old.apply_patch(diff(old, new)) == new
+        assert new.apply_patch(diff(new, old)) == old
+
+    # Changes to a list and to the values in it, in a single pass.
+    patch = Patch(
+        [
+            Update(("items", 0), "name", "a", "A"),
+            Insert(("items",), 0, Item("z")),
+            Insert(("items", 1, "tags"), "y", "y"),
+            Move(("items",), 3, 0),
+            Delete(("lookup",), "a", Item("a")),
+        ]
+    )
+    new = old.apply_patch(patch)
+    assert new == Inventory([Item("c"), Item("z"), Item("A", {"y"}), Item("b")])
+    assert new.items[3] is old.items[1]
+    assert old.items.apply_patch([Delete((), 0, Item("a"))]) == old.items.delete(0)
+
+    with pytest.raises(TypeError):
+        old.apply_patch([Update(("items", 0, "name"), 0, "a", "b")])
+    with pytest.raises(TypeError):
+        old.apply_patch([Move((), "note", 0)])
+    with pytest.raises(exceptions.InvalidTypeError):
+        old.apply_patch([Update(("items",), 0, Item("a"), "a")])
+    with pytest.raises(exceptions.InvalidTypeError):
+        old.apply_patch([Update(("items", 0), "name", "a", 1)])
+
+
+def test_set_in():
+    class Vehicle(Data):
+        kind = attribute(types=str)
+        wheels = attribute(types=int, default=4)
+
+    class Garage(Data):
+        vehicles = list_attribute(types=Vehicle)
+        owners = dict_attribute(key_types=str, types=Vehicle, default={})
+
+    garage = Garage([Vehicle("car"), Vehicle("bike", 2)], {"ana": Vehicle("car")})
+    new_garage = garage.set_in(("vehicles", 1, "kind"), "trike")
+    assert new_garage == Garage([Vehicle("car"), Vehicle("trike", 2)], {"ana": Vehicle("car")})
+    assert new_garage.vehicles[0] is garage.vehicles[0]
+    assert new_garage.owners is garage.owners
+    assert garage.set_in(("vehicles", 1, "kind"), garage.vehicles[1].kind) is garage
+
+    assert garage.update_in(("owners", "ana", "wheels"), lambda w: w * 2).owners["ana"].wheels == 8
+    assert garage.set_in(("owners", "bob"), Vehicle("bus")).owners["bob"] == Vehicle("bus")
+    assert garage.vehicles.set_in((0, "wheels"), 3)[0] == Vehicle("car", 3)
+    assert garage.owners.update_in(("ana",), lambda v: v.set("kind", "van"))["ana"].kind == "van"
+
+    with pytest.raises(exceptions.InvalidTypeError):
+        garage.set_in(("vehicles", 1, "kind"), 3)
+    with pytest.raises(KeyError):
+        garage.update_in(("owners", "bob", "kind"), str.upper)
+    with pytest.raises(IndexError):
+        garage.set_in(("vehicles", 2, "kind"), "bus")
+    with pytest.raises(TypeError):
+        garage.set_in(("vehicles", 0, "kind", 0), "b")
+    with pytest.raises(ValueError):
+        garage.set_in((), None)
+
+
+def test_list_slicing():
+    IntList = list_cls(types=int)
+    int_list = IntList([1, 2, 3, 4])
+
+    assert type(int_list[1:3]) is IntList
+    assert int_list[1:3] == IntList([2, 3])
+    assert int_list[::2] == IntList([1, 3])
+
+    assert int_list + IntList([5]) == IntList([1, 2, 3, 4, 5])
+    assert type(int_list + [5]) is IntList
+    assert [0] + int_list == IntList([0, 1, 2, 3, 4])
+    assert int_list[:2] * 2 == 2 * int_list[:2] == IntList([1, 2, 1, 2])
+    assert type(int_list * 0) is IntList and not int_list * 0
+
+    with pytest.raises(exceptions.InvalidTypeError):
+        _ = int_list + ["5"]
+    with pytest.raises(TypeError):
+        _ = int_list + 5
+
+
+def test_set_algebra():
+    IntSet = set_cls(types=int)
+    OtherIntSet = set_cls(types=int, qualified_name="OtherIntSet")
+    int_set = IntSet([1, 2, 3, 4])
+
+    assert type(int_set.intersection([2, 5])) is IntSet
+    assert int_set.intersection([2, 5]) == IntSet([2])
+    assert int_set.intersection(IntSet(range(100))) == int_set
+    assert int_set.union([5]) == int_set.union(OtherIntSet([5])) == IntSet([1, 2, 3, 4, 5])
+    assert IntSet(range(10)).union(int_set) == IntSet(range(10))
+    assert int_set.difference([1, 2]) == int_set.difference({1, 2, 10}) == IntSet([3, 4])
+    assert int_set.difference(range(100)) == IntSet()
+    assert int_set.symmetric_difference([4, 5]) == IntSet([1, 2, 3, 5])
+    assert int_set.inverse_difference([4, 5]) == IntSet([5])
+    assert type(int_set & {1}) is type(int_set | {1}) is type(int_set - {1}) is type(int_set ^ {1}) is IntSet
+    assert int_set.union([]) is int_set
+
+    with pytest.raises(exceptions.InvalidTypeError):
+        int_set.union(["5"])
+    with pytest.raises(exceptions.InvalidTypeError):
+        int_set.symmetric_difference(["5"])
+
+    # Values are converted before comparing them.
+    ConvertedIntSet = set_cls(types=int, converter=int)
+    converted_set = ConvertedIntSet([1, 2])
+    assert converted_set.intersection(["1"]) == ConvertedIntSet([1])
+    assert converted_set.difference(["1"]) == converted_set.difference({"1"}) == ConvertedIntSet([2])
+    assert converted_set.symmetric_difference(["1", "3"]) == ConvertedIntSet([2, 3])
+    assert converted_set.inverse_difference(["1", "3"]) == ConvertedIntSet([3])
+    assert converted_set.union(["1"]) is converted_set
+    assert converted_set.intersection(int_set) == ConvertedIntSet([1, 2])
+
+
+def test_collection_reuse():
+    IntList = list_cls(types=int)
+    OtherIntList = list_cls(types=int, qualified_name="OtherIntList")
+    StrIntDict = dict_cls(key_types=str, types=int)
+    IntSet = set_cls(types=int)
+
+    int_list = IntList([1, 2])
+    assert IntList(int_list)._state is int_list._state
+    assert OtherIntList(int_list)._state is int_list._state
+    with pytest.raises(exceptions.InvalidTypeError):
+        list_cls(types=str)(int_list)
+
+    str_int_dict = StrIntDict({"a": 1})
+    assert StrIntDict(str_int_dict)._state is str_int_dict._state
+    assert StrIntDict(str_int_dict, b=2) == StrIntDict({"a": 1, "b": 2})
+    int_set = IntSet([1])
+    assert IntSet(int_set)._state is int_set._state
+
+    class Vehicle(Data):
+        kind = attribute(types=str)
+
+    class Garage(Data):
+        vehicles = list_attribute(types=Vehicle)
+        tags = set_attribute(types=str, default=())
+
+    vehicles = Garage([Vehicle("car")]).vehicles
+    assert Garage(vehicles).vehicles is vehicles
+    assert Garage([Vehicle("car")]).vehicles == vehicles
+    with pytest.raises(exceptions.InvalidTypeError):
+        Garage(IntList([1]))
+
+    # Trusted types are part of the relationship's identity.
+    relationship = Garage.__attribute_map__["vehicles"].relationship
+    assert relationship.trusted_types == (type(vehicles),)
+    assert relationship.update() == relationship != relationship.update(trusted_types=())
+    assert "trusted_types=" in repr(relationship)
+
+
+def test_class_cache():
+    assert list_cls(types=int) is list_cls(types=(int,))
+    assert dict_cls(key_types=str, types=int) is dict_cls(key_types=str, types=int)
+    assert set_cls(types=int) is set_cls(types=int)
+    assert list_cls(types=int) is not list_cls(types=str)
+    assert list_cls(types=int) is not list_cls(types=int, qualified_name="IntList")
+    assert list_cls(types=int, cls_dct={}) is not list_cls(types=int, cls_dct={})
+
+    class Person(Data):
+        nicknames = list_attribute(types=str)
+
+    class Pet(Data):
+        tricks = list_attribute(types=str)
+
+    assert type(Person(["Bob"]).nicknames) is type(Pet(["Sit"]).tricks)
+    assert Pet(Person(["Bob"]).nicknames).tricks == Person(["Bob"]).nicknames
+
+    # Shared classes are in the namespace of each attribute, and are pickled as a call to the factory that built them.
+    nicknames_type = type(Person(["Bob"]).nicknames)
+    assert nicknames_type is type(PickledHero(["Bob"]).aliases)
+    assert Person.__attribute_map__["nicknames"].namespace.ListData is nicknames_type
+    assert pickle.loads(pickle.dumps(nicknames_type)) is nicknames_type
+    assert pickle.loads(pickle.dumps(Person(["Bob"]).nicknames)) == ["Bob"]
+
+    # Unpickling imports the module that defines the attributes.
+    script = "import pickle, sys; print(pickle.loads(getattr(sys.stdin, 'buffer', sys.stdin).read()))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    process = subprocess.Popen([sys.executable, "-c", script], stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env)
+    output = process.communicate(pickle.dumps(PickledHero(["Bob"]).aliases, protocol=2))[0]
+    assert output.decode("utf-8").strip().endswith("(['Bob'])")
+
+
+def test_collection_attributes():
+    # Collection attributes are defined the way estruttura's helpers define them, other than sharing their classes.
+    serializer = TypedSerializer()
+    helpers = (
+        (
+            dict_attribute,
+            estruttura.dict_attribute,
+            {"dict_type": DictData, "key_serializer": serializer, "key_relationship_type": Relationship},
+            {"a": "1"},
+        ),
+        (list_attribute, estruttura.list_attribute, {"list_type": ListData}, ["1"]),
+        (set_attribute, estruttura.set_attribute, {"set_type": SetData}, {"1"}),
+    )
+    for helper, estruttura_helper, kwargs, value in helpers:
+        kwargs.update(converter=int, types=int, serializer=serializer, default=value)
+        kwargs.update(attribute_type=Attribute, relationship_type=Relationship)
+        attribute_, expected = helper(**kwargs), estruttura_helper(**kwargs)
+
+        ignored = ("default", "repr", "namespace", "callback", "count")
+        assert [i for i in attribute_.to_items() if i[0] not in ignored] == [
+            i for i in expected.to_items() if i[0] not in ignored
+        ]
+        assert attribute_.default.serialize() == expected.default.serialize()
+        relationship, expected_relationship = attribute_.relationship, expected.relationship
+        ignored = ("converter", "types", "trusted_types")
+        assert [i for i in relationship.to_items() if i[0] not in ignored] == [
+            i for i in expected_relationship.to_items() if i[0] not in ignored
+        ]
+
+        cls, expected_cls = relationship.types[0], expected_relationship.types[0]
+        assert cls.__name__ == expected_cls.__name__ and cls.__bases__ == expected_cls.__bases__
+        assert cls.relationship == expected_cls.relationship
+        assert getattr(cls, "value_relationship", None) == getattr(expected_cls, "value_relationship", None)
+        processed, expected_processed = relationship.process_value(value), expected_relationship.process_value(value)
+        assert type(processed) is cls and type(expected_processed) is expected_cls
+        assert processed.serialize() == expected_processed.serialize()
+        assert attribute_.repr(processed) == expected.repr(expected_processed)
+
+
+def test_profile_classes(monkeypatch):
+    monkeypatch.setattr(_profiling, "_profiling_classes", True)
+    monkeypatch.setattr(_profiling, "_records", [])
+
+    class Node(Data):
+        children = list_attribute(types=int, default=())
+
+    assert Node.__attribute_map__["children"].relationship.extra_paths == (__name__,)
+    stream = io.StringIO()
+    _profiling.write_report(stream)
+    report = stream.getvalue()
+    assert report.startswith("DATTA_PROFILE_CLASSES: 2 classes created in ")
+    assert "test_profile_classes.<locals>.Node\n" in report
+
+
+def test_evolver():
+    class Point(Data):
+        x = attribute(types=int)
+        y = attribute(types=int)
+        z = attribute(types=int, required=False, deletable=True)
+
+    point = Point(3, 4, z=5)
+    evolver = point.evolver()
+    evolver["x"] = 30
+    evolver.set("y", 40).delete("z")
+    assert evolver.is_dirty()
+    assert evolver["x"] == 30
+    assert "z" not in evolver
+
+    new_point = evolver.persistent()
+    assert new_point == Point(30, 40)
+    assert "z" not in new_point
+    assert point == Point(3, 4, z=5)
+    assert evolver.persistent() is new_point
+
+    evolver["x"] = "30"
+    with pytest.raises(exceptions.InvalidTypeError):
+        evolver.persistent()
+
+
+def test_collection_evolvers():
+    IntList = list_cls(types=int)
+    int_list = IntList([1, 2])
+    list_evolver = int_list.evolver()
+    list_evolver.append(3).extend([4, 5]).insert(0, 0)
+    list_evolver[1] = 10
+    del list_evolver[-1]
+    assert list_evolver.persistent() == IntList([0, 10, 2, 3, 4])
+    assert int_list == IntList([1, 2])
+    with pytest.raises(exceptions.InvalidTypeError):
+        list_evolver.append("6")
+
+    StrIntDict = dict_cls(key_types=str, types=int)
+    str_int_dict = StrIntDict(a=1)
+    dict_evolver = str_int_dict.evolver()
+    dict_evolver["b"] = 2
+    dict_evolver.update(c=3).discard("a")
+    assert dict_evolver.persistent() == StrIntDict(b=2, c=3)
+    with pytest.raises(exceptions.InvalidTypeError):
+        dict_evolver[1] = 1
+
+    IntSet = set_cls(types=int)
+    int_set = IntSet([1])
+    set_evolver = int_set.evolver()
+    set_evolver.update([2, 3]).remove(1)
+    assert 2 in set_evolver
+    assert set_evolver.persistent() == IntSet([2, 3])
+    assert int_set.evolver().persistent() is int_set
+
+
+def test_trusted_deserialize():
+    class Child(Data):
+        value = attribute(types=int, converter=int)
+        tags = set_attribute(types=str, default=())
+
+    class Parent(Data):
+        children = list_attribute(types=Child)
+        lookup = dict_attribute(key_types=str, types=Child, default={})
+
+    parent = Parent([Child(1, {"a"}), Child(2)], {"c": Child(3)})
+    serialized = parent.serialize()
+    trusted = Parent.deserialize(serialized, trusted=True)
+    assert trusted == parent == Parent.deserialize(serialized)
+    assert type(trusted.children[0]) is Child
+    assert type(trusted.lookup["c"].tags) is type(parent.lookup["c"].tags)
+
+    # Defaults are filled in, but values are not processed.
+    assert Parent.deserialize({"children": []}, trusted=True).lookup == {}
+    assert Child.deserialize({"value": "1"}).value == 1
+    assert Child.deserialize({"value": "1"}, trusted=True).value == "1"
+
+    # Required attributes still need values.
+    with pytest.raises(RuntimeError):
+        Child.deserialize({"tags": ["a"]}, trusted=True)
+
+
 if __name__ == "__main__":
     pytest.main()